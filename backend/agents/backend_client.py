@@ -0,0 +1,78 @@
+"""
+Process-wide HTTP client for agent → backend calls.
+
+Checkpoint batches, completion webhooks and outbox retries from every job
+in this worker process share one connection pool to BACKEND_URL instead of
+opening (and tearing down) a client per call. The client is built in the
+worker's prewarm stage (init_backend_client). Each job registers as a user
+(acquire_backend_client); only the shutdown of the last job still using it
+closes it, so jobs sharing a process (thread executor) never lose the
+client under one another.
+
+HTTP/2 is negotiated via ALPN, so it only applies when BACKEND_URL is
+https and the `h2` package is installed; otherwise HTTP/1.1 keep-alive.
+"""
+import importlib.util
+import logging
+import threading
+from typing import Optional
+
+import httpx
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+_users = 0
+_users_lock = threading.Lock()
+
+
+def _build_client() -> httpx.AsyncClient:
+    http2 = settings.AGENT_HTTP2 and importlib.util.find_spec("h2") is not None
+    return httpx.AsyncClient(
+        http2=http2,
+        timeout=settings.AGENT_HTTP_TIMEOUT_S,
+        limits=httpx.Limits(
+            max_connections=settings.AGENT_HTTP_POOL_SIZE,
+            max_keepalive_connections=settings.AGENT_HTTP_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.AGENT_HTTP_KEEPALIVE_S,
+        ),
+    )
+
+
+def init_backend_client() -> httpx.AsyncClient:
+    """Create the shared client ahead of the first job (called from prewarm)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+        logger.info("[AGENT] Backend HTTP pool ready (max_connections=%d).", settings.AGENT_HTTP_POOL_SIZE)
+    return _client
+
+
+def get_backend_client() -> httpx.AsyncClient:
+    """Return the shared client (created here if prewarm did not run)."""
+    return init_backend_client()
+
+
+def acquire_backend_client() -> httpx.AsyncClient:
+    """Register the calling job as a user of the shared client and return it."""
+    global _users
+    with _users_lock:
+        _users += 1
+    return init_backend_client()
+
+
+def release_backend_client() -> bool:
+    """Unregister a job. Returns True if no other job still uses the client."""
+    global _users
+    with _users_lock:
+        _users = max(_users - 1, 0)
+        return _users == 0
+
+
+async def close_backend_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
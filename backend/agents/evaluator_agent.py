@@ -2,14 +2,45 @@
 Post-interview evaluator agent.
 Called by Celery after the interview ends — analyzes the full transcript
 and produces a structured JSON report using Gemini.
+
+Incremental mode: while the interview runs, assess_segment scores the
+skills whose discussion has concluded in each new stretch of turns; at
+completion synthesize_report turns those partial assessments into the
+same report schema with one short call.
+
+Map-reduce mode: a transcript too long for one comfortable request is
+split at turn boundaries (chunk_turns), the chunks are assessed in
+parallel (assess_chunks), and synthesize_report merges them.
+
+Every call goes through services/llm_limiter: skill extraction draws on
+the shared RPM/TPM budget as INTERACTIVE work, evaluation as BATCH, and a
+429 pauses all callers for the server's retry delay before retrying.
 """
+import asyncio
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 from google import genai
 from google.genai import types
 
 from backend.config import settings
+from backend.services.llm_limiter import (
+    BATCH,
+    INTERACTIVE,
+    estimate_tokens,
+    is_rate_limited,
+    llm_slot,
+    retry_after_s,
+    settle_tokens,
+    settle_tokens_async,
+    start_cooldown,
+    start_cooldown_async,
+    wait_for_budget,
+    wait_for_budget_async,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -83,17 +114,156 @@ Return this exact JSON structure — no markdown, no explanation, just JSON:
 }}"""
 
 
+_SEGMENT_PROMPT = """\
+You are a senior hiring manager assessing an interview for a {role} position \
+segment by segment. Below is the next stretch of the transcript; \
+each turn is prefixed with its [seq] number.
+
+SKILLS TO ASSESS: {skills_to_cover}
+ALREADY ASSESSED IN EARLIER SEGMENTS: {assessed_skills}
+
+JOB DESCRIPTION:
+{job_description}
+
+TRANSCRIPT SEGMENT:
+{transcript}
+
+{ending_note}
+
+Return ONLY this JSON — no markdown, no explanation:
+
+{{
+  "skill_scores": [
+    {{ "skill": "<skill name>", "score": <integer 1-10>, "evidence": "<direct quote or paraphrase>" }}
+  ],
+  "observations": ["<short note on communication, problem solving, depth, fit, leadership, or a red/green flag>"],
+  "open_from_seq": <seq of the first turn of a topic still being discussed, or null>
+}}
+
+Only score a skill once the conversation has moved past it in this segment. \
+Re-score an already assessed skill only if this segment adds new evidence."""
+
+_SEGMENT_ONGOING = """\
+The interview is still running: if the last topic has not concluded, do not score it \
+and set open_from_seq to the seq where that topic began."""
+
+_SEGMENT_FINAL = "The interview has ended: treat every topic as concluded and set open_from_seq to null."
+
+_SYNTHESIS_PROMPT = """\
+You are a senior hiring manager with 15 years of experience evaluating engineering candidates.
+The interview below was assessed segment by segment as it happened. Combine the partial \
+assessments into a final report and return ONLY a valid JSON object.
+
+ROLE: {role}
+CANDIDATE: {candidate_name}
+
+JOB DESCRIPTION:
+{job_description}
+
+SKILLS ASSESSED: {skills_to_cover}
+
+PARTIAL SKILL SCORES (a skill may appear more than once — later evidence refines earlier):
+{skill_scores}
+
+OBSERVATIONS:
+{observations}
+
+Give exactly one skill_scores entry per skill in SKILLS ASSESSED; a skill with no partial \
+score was not covered — score it 1 and say so in its evidence.
+
+Return this exact JSON structure — no markdown, no explanation, just JSON:
+""" + _EVALUATION_PROMPT[_EVALUATION_PROMPT.index("\n{{"):]
+
+# ── Gemini helpers ────────────────────────────────────────────────────────────
+
+_JSON_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    temperature=0.3,  # low temp for consistent structured output
+)
+
+
+def _usage(response) -> Optional[int]:
+    usage = getattr(response, "usage_metadata", None)
+    return getattr(usage, "total_token_count", None)
+
+
+def _generate(prompt: str, config: types.GenerateContentConfig, priority: str = BATCH):
+    """One blocking Gemini call within the shared rate budget and in-flight cap."""
+    tokens = estimate_tokens(prompt)
+    for attempt in range(settings.LLM_RATE_LIMIT_RETRIES + 1):
+        wait_for_budget(priority, tokens)
+        try:
+            with llm_slot():
+                response = client.models.generate_content(
+                    model="gemini-2.5-flash",
+                    config=config,
+                    contents=prompt,
+                )
+        except Exception as exc:
+            if not is_rate_limited(exc) or attempt == settings.LLM_RATE_LIMIT_RETRIES:
+                raise
+            delay = retry_after_s(exc)
+            logger.warning("[LLM] Rate limited (%s) — all callers pausing %.1fs.", priority, delay)
+            start_cooldown(delay)
+            time.sleep(delay)
+            continue
+        settle_tokens(tokens, _usage(response))
+        return response
+
+
+async def _generate_async(prompt: str, config: types.GenerateContentConfig, priority: str = INTERACTIVE):
+    """Async variant of _generate. Not slot-capped: the in-flight cap guards blocking workers."""
+    tokens = estimate_tokens(prompt)
+    for attempt in range(settings.LLM_RATE_LIMIT_RETRIES + 1):
+        await wait_for_budget_async(priority, tokens)
+        try:
+            response = await client.aio.models.generate_content(
+                model="gemini-2.5-flash",
+                config=config,
+                contents=prompt,
+            )
+        except Exception as exc:
+            if not is_rate_limited(exc) or attempt == settings.LLM_RATE_LIMIT_RETRIES:
+                raise
+            delay = retry_after_s(exc)
+            logger.warning("[LLM] Rate limited (%s) — all callers pausing %.1fs.", priority, delay)
+            await start_cooldown_async(delay)
+            await asyncio.sleep(delay)
+            continue
+        await settle_tokens_async(tokens, _usage(response))
+        return response
+
+
+def _generate_json(prompt: str, config: types.GenerateContentConfig = _JSON_CONFIG):
+    """Batch Gemini call whose response is parsed as JSON."""
+    return json.loads(_generate(prompt, config).text)
+
+
 # ── Public functions ──────────────────────────────────────────────────────────
 
+_SKILLS_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    temperature=0.2,
+)
+
+
 def extract_skills_from_jd(job_description: str, role: str) -> list[str]:
     """Use Gemini to pull 8-10 skills to assess from the job description."""
-    response = client.models.generate_content(
-        model="gemini-2.5-flash",
-        config=types.GenerateContentConfig(
-            response_mime_type="application/json",
-            temperature=0.2,
-        ),
-        contents=_SKILLS_PROMPT.format(role=role, job_description=job_description),
+    response = _generate(
+        _SKILLS_PROMPT.format(role=role, job_description=job_description),
+        _SKILLS_CONFIG,
+        priority=INTERACTIVE,
+    )
+    skills = json.loads(response.text)
+    logger.info("Extracted %d skills for role '%s'", len(skills), role)
+    return skills
+
+
+async def extract_skills_from_jd_async(job_description: str, role: str) -> list[str]:
+    """Async variant of extract_skills_from_jd — safe to await from request handlers."""
+    response = await _generate_async(
+        _SKILLS_PROMPT.format(role=role, job_description=job_description),
+        _SKILLS_CONFIG,
     )
     skills = json.loads(response.text)
     logger.info("Extracted %d skills for role '%s'", len(skills), role)
@@ -116,20 +286,101 @@ def generate_report(
         skills_to_cover=", ".join(skills_to_cover),
     )
 
-    response = client.models.generate_content(
-        model="gemini-2.5-flash",
-        config=types.GenerateContentConfig(
-            response_mime_type="application/json",
-            temperature=0.3,  # low temp for consistent structured output
-        ),
-        contents=prompt,
+    report = _generate_json(prompt)
+    logger.info(
+        "Report generated for '%s' — score: %s, eligibility: %s",
+        candidate_name,
+        report.get("overall_score"),
+        report.get("role_eligibility"),
+    )
+    return report
+
+
+def assess_segment(
+    turns: list[dict],
+    role: str,
+    job_description: str,
+    skills_to_cover: list[str],
+    assessed_skills: list[str],
+    final: bool = False,
+) -> dict:
+    """
+    Score the skills concluded within a stretch of turns ({seq, speaker, text}).
+    Returns {skill_scores, observations, open_from_seq}.
+    """
+    prompt = _SEGMENT_PROMPT.format(
+        role=role,
+        job_description=job_description,
+        skills_to_cover=", ".join(skills_to_cover),
+        assessed_skills=", ".join(assessed_skills) or "none",
+        transcript="\n\n".join(f"[{t['seq']}] {t['speaker']}: {t['text']}" for t in turns),
+        ending_note=_SEGMENT_FINAL if final else _SEGMENT_ONGOING,
     )
+    result = _generate_json(prompt)
+    open_from = result.get("open_from_seq")
+    return {
+        "skill_scores": result.get("skill_scores") or [],
+        "observations": result.get("observations") or [],
+        "open_from_seq": None if final or open_from is None else int(open_from),
+    }
+
 
-    report = json.loads(response.text)
+def synthesize_report(
+    segments: list[dict],
+    role: str,
+    job_description: str,
+    candidate_name: str,
+    skills_to_cover: list[str],
+) -> dict:
+    """Build the final report from segment assessments ({skill_scores, observations})."""
+    prompt = _SYNTHESIS_PROMPT.format(
+        role=role,
+        candidate_name=candidate_name,
+        job_description=job_description,
+        skills_to_cover=", ".join(skills_to_cover),
+        skill_scores=json.dumps([s for seg in segments for s in seg["skill_scores"]], indent=1),
+        observations="\n".join(f"- {o}" for seg in segments for o in seg["observations"]) or "- none",
+    )
+    report = _generate_json(prompt)
     logger.info(
-        "Report generated for '%s' — score: %s, eligibility: %s",
+        "Report synthesized for '%s' from %d segment(s) — score: %s, eligibility: %s",
         candidate_name,
+        len(segments),
         report.get("overall_score"),
         report.get("role_eligibility"),
     )
     return report
+
+
+def chunk_turns(turns: list[dict], max_chars: int) -> list[list[dict]]:
+    """Split turns into consecutive chunks of at most ~max_chars, never inside a turn."""
+    chunks: list[list[dict]] = []
+    current: list[dict] = []
+    size = 0
+    for turn in turns:
+        turn_chars = len(turn["speaker"]) + len(turn["text"]) + 4
+        if current and size + turn_chars > max_chars:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(turn)
+        size += turn_chars
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def assess_chunks(
+    chunks: list[list[dict]],
+    role: str,
+    job_description: str,
+    skills_to_cover: list[str],
+    max_workers: int,
+) -> list[dict]:
+    """Map step: assess every chunk concurrently, as concluded segments. Results keep chunk order."""
+    def assess(chunk: list[dict]) -> dict:
+        return assess_segment(chunk, role, job_description, skills_to_cover, assessed_skills=[], final=True)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as pool:
+        segments = list(pool.map(assess, chunks))
+    logger.info("Assessed %d transcript chunk(s) for role '%s'", len(chunks), role)
+    return segments
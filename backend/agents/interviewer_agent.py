@@ -9,15 +9,27 @@ import json
 import logging
 import time
 
-import httpx
-from livekit.agents import Agent, AgentSession, JobContext, RoomInputOptions, WorkerOptions, cli
+import psutil  # ships with livekit-agents
+from livekit import rtc
+from livekit.agents import Agent, AgentSession, JobContext, JobProcess, RoomInputOptions, WorkerOptions, cli
 from livekit.plugins import google
 
+from backend.agents.backend_client import (
+    acquire_backend_client,
+    close_backend_client,
+    get_backend_client,
+    init_backend_client,
+    release_backend_client,
+)
+from backend.agents.outbox import get_outbox
+from backend.agents.transcript_sync import TranscriptCheckpointer
 from backend.config import settings
-from backend.observability import get_langfuse
+from backend.observability import get_langfuse, get_telemetry
 
 logger = logging.getLogger(__name__)
 
+_REALTIME_MODEL = "gemini-2.5-flash-native-audio-preview-12-2025"
+
 # ── Instructions ──────────────────────────────────────────────────────────────
 
 _INSTRUCTIONS = """\
@@ -59,22 +71,116 @@ class InterviewerAgent(Agent):
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-async def _finalize_interview(interview_id: str, transcript: str) -> None:
-    """Save transcript and trigger async evaluation via backend API."""
-    try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(
-                f"{settings.BACKEND_URL}/api/webhooks/interview-complete",
-                json={"interview_id": interview_id, "transcript": transcript},
-            )
-            resp.raise_for_status()
+def _finalize_key(interview_id: str) -> str:
+    return f"interview-complete:{interview_id}"
+
+
+async def _finalize_interview(checkpointer: TranscriptCheckpointer) -> None:
+    """
+    Flush remaining transcript turns, then send the completion marker so the
+    backend assembles the transcript and queues evaluation. Turns that could
+    not be checkpointed ride along in the completion body.
+
+    The completion call goes through the durable outbox: if the backend is
+    unreachable it is retried with backoff, surviving this job's process.
+    """
+    interview_id = checkpointer.interview_id
+    fully_acked = await checkpointer.aclose()
+    body = {"interview_id": interview_id, "final_seq": checkpointer.last_seq}
+    if not fully_acked:
+        body["turns"] = checkpointer.unacked_turns()
+        logger.warning("[FINALIZE] %d unacked turn(s) for %s — sending with completion.",
+                       len(body["turns"]), interview_id)
+
+    delivered = await get_outbox().submit(
+        _finalize_key(interview_id), "/api/webhooks/interview-complete", body, get_backend_client()
+    )
+    if delivered:
         logger.info("[FINALIZE] Interview %s finalized — evaluation queued.", interview_id)
-    except Exception as exc:
-        logger.error("[FINALIZE] Failed to finalize interview %s: %s", interview_id, exc)
+    else:
+        logger.warning("[FINALIZE] Interview %s not delivered yet — left in outbox for retry.", interview_id)
+
+
+async def _wait_for_candidate_audio(ctx: JobContext) -> bool:
+    """
+    Wait until the candidate has joined and their microphone track is
+    subscribed, for at most AGENT_GREETING_MAX_WAIT_S. Returns False on
+    timeout (the agent greets anyway).
+    """
+    subscribed = asyncio.Event()
+    candidate_identity: str | None = None
+
+    def has_audio(participant: rtc.RemoteParticipant) -> bool:
+        return any(
+            pub.kind == rtc.TrackKind.KIND_AUDIO and pub.subscribed
+            for pub in participant.track_publications.values()
+        )
+
+    def on_track_subscribed(track, publication, participant) -> None:
+        # Only the candidate's microphone counts, not an observer's or another agent's.
+        if track.kind == rtc.TrackKind.KIND_AUDIO and participant.identity == candidate_identity:
+            subscribed.set()
+
+    ctx.room.on("track_subscribed", on_track_subscribed)
+    try:
+        async def wait() -> None:
+            nonlocal candidate_identity
+            participant = await ctx.wait_for_participant()
+            candidate_identity = participant.identity
+            if not has_audio(participant):
+                await subscribed.wait()
+
+        await asyncio.wait_for(wait(), timeout=settings.AGENT_GREETING_MAX_WAIT_S)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        ctx.room.off("track_subscribed", on_track_subscribed)
 
 
 # ── Entry point ───────────────────────────────────────────────────────────────
 
+def _build_llm() -> google.realtime.RealtimeModel:
+    return google.realtime.RealtimeModel(
+        model=_REALTIME_MODEL,
+        voice="Zephyr",
+        temperature=0.8,
+        modalities=["AUDIO"],
+        max_output_tokens=2048,
+        api_key=settings.GEMINI_API_KEY,
+    )
+
+
+def prewarm(proc: JobProcess) -> None:
+    """
+    Runs once per job process before it is handed a job, so settings, the
+    Langfuse client, the backend HTTP pool, the outbox and the realtime
+    model are not built on the first job's critical path.
+    """
+    init_backend_client()
+    get_outbox()
+    get_langfuse()
+    get_telemetry()
+    proc.userdata["llm"] = _build_llm()
+
+
+# compute_load runs in the main worker process, not in job processes, so the
+# CPU sampler is primed here at import: psutil's first non-blocking sample
+# only sets the baseline (and reads 0.0).
+psutil.cpu_percent(interval=None)
+
+
+def compute_load(worker) -> float:
+    """
+    Worker load reported to LiveKit (0..1): the higher of active sessions
+    against AGENT_MAX_SESSIONS and system CPU. LiveKit stops dispatching to
+    this worker above AGENT_LOAD_THRESHOLD, spreading jobs across replicas.
+    """
+    sessions = len(worker.active_jobs) / max(settings.AGENT_MAX_SESSIONS, 1)
+    cpu = psutil.cpu_percent(interval=None) / 100
+    return min(max(sessions, cpu), 1.0)
+
+
 async def entrypoint(ctx: JobContext) -> None:
     await ctx.connect()
 
@@ -86,23 +192,20 @@ async def entrypoint(ctx: JobContext) -> None:
     candidate_name = metadata.get("candidate_name", "the candidate")
     logger.info("[AGENT] interview_id=%s candidate=%s role=%s", interview_id, candidate_name, role)
 
-    # ── Langfuse trace ────────────────────────────────────────────────────────
-    lf = get_langfuse()
-    trace = None
-    if lf:
-        trace = lf.trace(
-            name="interview",
-            id=interview_id,
-            session_id=interview_id,
-            user_id=candidate_name,
-            metadata={
-                "role": role,
-                "candidate_name": candidate_name,
-                "skills": skills,
-            },
-            tags=["interview", role],
-        )
-        logger.info("[OBSERVABILITY] Langfuse trace created: %s", interview_id)
+    # ── Langfuse trace (buffered — never blocks the voice loop) ───────────────
+    telemetry = get_telemetry()
+    telemetry.trace(
+        name="interview",
+        id=interview_id,
+        session_id=interview_id,
+        user_id=candidate_name,
+        metadata={
+            "role": role,
+            "candidate_name": candidate_name,
+            "skills": skills,
+        },
+        tags=["interview", role],
+    )
 
     instructions = _INSTRUCTIONS.format(
         role=role,
@@ -112,20 +215,48 @@ async def entrypoint(ctx: JobContext) -> None:
     )
 
     session = AgentSession(
-        llm=google.realtime.RealtimeModel(
-            model="gemini-2.5-flash-native-audio-preview-12-2025",
-            voice="Zephyr",
-            temperature=0.8,
-            modalities=["AUDIO"],
-            max_output_tokens=2048,
-            api_key=settings.GEMINI_API_KEY,
-        ),
+        llm=ctx.proc.userdata.pop("llm", None) or _build_llm(),
     )
 
     interview_done = False
-    transcript_lines: list[str] = []
+    http_client = acquire_backend_client()
+    outbox = get_outbox()
+    outbox.start(http_client)   # also retries entries left behind by earlier jobs
+
+    async def _on_shutdown() -> None:
+        # Give this job's own finalization a bounded chance to land before
+        # the process exits; anything left is retried by later jobs.
+        if not await outbox.wait_delivered(_finalize_key(interview_id), settings.AGENT_OUTBOX_SHUTDOWN_GRACE_S):
+            logger.warning("[FINALIZE] Interview %s still queued in outbox at shutdown.", interview_id)
+        if release_backend_client():
+            # Last job in this process: stop the retry loop before closing the
+            # client it sends on, so no due row is attempted on a closed client.
+            await outbox.stop()
+            await close_backend_client()
+        await asyncio.to_thread(telemetry.flush)
+
+    ctx.add_shutdown_callback(_on_shutdown)
+    checkpointer = TranscriptCheckpointer(interview_id, http_client)
+    checkpointer.start()
     last_user_speech_time: list[float] = [0.0]
     turn_index: list[int] = [0]
+    candidate_ready_at: list[float] = [0.0]
+    first_audio_sent: list[bool] = [False]
+
+    @session.on("agent_state_changed")
+    def on_agent_state_changed(event) -> None:
+        # Time to first audio: candidate ready → agent starts speaking the greeting.
+        if event.new_state != "speaking" or first_audio_sent[0] or not candidate_ready_at[0]:
+            return
+        first_audio_sent[0] = True
+        ttfa_ms = (time.monotonic() - candidate_ready_at[0]) * 1000
+        logger.info("[METRICS] interview=%s time_to_first_audio=%.0fms", interview_id, ttfa_ms)
+        telemetry.score(
+            trace_id=interview_id,
+            name="time_to_first_audio_ms",
+            value=round(ttfa_ms),
+            comment="Candidate audio subscribed to agent greeting start",
+        )
 
     @session.on("conversation_item_added")
     def on_conversation_item(event) -> None:
@@ -138,75 +269,69 @@ async def entrypoint(ctx: JobContext) -> None:
         item_role = str(item.role)
         now = time.monotonic()
 
+        latency_s = None
         if "user" in item_role:
             label = "Candidate"
             last_user_speech_time[0] = now
 
-            if trace:
-                trace.event(
-                    name="user_turn",
-                    input=text,
-                    metadata={"turn_index": turn_index[0]},
-                )
+            telemetry.event(
+                trace_id=interview_id,
+                name="user_turn",
+                input=text,
+                metadata={"turn_index": turn_index[0]},
+            )
         else:
             label = "Interviewer"
-            latency_s = None
             if last_user_speech_time[0]:
                 latency_s = now - last_user_speech_time[0]
 
-            if trace:
-                trace.generation(
-                    name="agent_turn",
-                    model="gemini-2.5-flash-native-audio-preview-12-2025",
-                    output=text,
-                    metadata={
-                        "turn_index": turn_index[0],
-                        "latency_s": round(latency_s, 3) if latency_s else None,
-                    },
-                )
+            telemetry.generation(
+                trace_id=interview_id,
+                name="agent_turn",
+                model=_REALTIME_MODEL,
+                output=text,
+                metadata={
+                    "turn_index": turn_index[0],
+                    "latency_s": round(latency_s, 3) if latency_s else None,
+                },
+            )
             turn_index[0] += 1
 
         logger.info("[TRANSCRIPT] %s: %s", label, text[:80])
-        transcript_lines.append(f"{label}: {text}")
+        checkpointer.add(label, text, latency_s=round(latency_s, 3) if latency_s else None)
 
         if label == "Interviewer" and not interview_done and "[INTERVIEW_COMPLETE]" in text:
             logger.info("[AGENT] [INTERVIEW_COMPLETE] detected — triggering finalization")
             interview_done = True
-            transcript = "\n\n".join(transcript_lines)
-            if trace:
-                trace.update(
-                    output=f"Interview completed — {turn_index[0]} turns",
-                    metadata={"completion": "natural", "turns": turn_index[0]},
-                )
-            asyncio.create_task(_finalize_interview(interview_id, transcript))
+            telemetry.trace(
+                id=interview_id,
+                output=f"Interview completed — {turn_index[0]} turns",
+                metadata={"completion": "natural", "turns": turn_index[0]},
+            )
+            asyncio.create_task(_finalize_interview(checkpointer))
 
     @ctx.room.on("participant_disconnected")
     def on_participant_disconnected(participant) -> None:
         nonlocal interview_done
         logger.info("[AGENT] participant_disconnected: %s | interview_done=%s | transcript_lines=%d",
-                    participant.identity, interview_done, len(transcript_lines))
-        if not interview_done and transcript_lines:
+                    participant.identity, interview_done, checkpointer.turn_count)
+        if not interview_done and checkpointer.turn_count:
             interview_done = True
-            transcript = "\n\n".join(transcript_lines)
-            logger.info("[AGENT] finalizing interview %s with %d transcript lines", interview_id, len(transcript_lines))
+            logger.info("[AGENT] finalizing interview %s with %d transcript lines", interview_id, checkpointer.turn_count)
 
-            if trace:
-                trace.update(
-                    output=f"Interview ended by disconnect — {turn_index[0]} turns",
-                    metadata={"completion": "disconnect", "turns": turn_index[0]},
-                )
+            telemetry.trace(
+                id=interview_id,
+                output=f"Interview ended by disconnect — {turn_index[0]} turns",
+                metadata={"completion": "disconnect", "turns": turn_index[0]},
+            )
 
             async def _finalize_then_close() -> None:
-                await _finalize_interview(interview_id, transcript)
-                if lf:
-                    lf.flush()
+                await _finalize_interview(checkpointer)
                 await session.aclose()
 
             asyncio.create_task(_finalize_then_close())
         else:
-            logger.info("[AGENT] no transcript to save (lines=%d, done=%s) — closing session", len(transcript_lines), interview_done)
-            if lf:
-                lf.flush()
+            logger.info("[AGENT] no transcript to save (lines=%d, done=%s) — closing session", checkpointer.turn_count, interview_done)
             asyncio.create_task(session.aclose())
 
     await session.start(
@@ -215,13 +340,21 @@ async def entrypoint(ctx: JobContext) -> None:
         room_input_options=RoomInputOptions(close_on_disconnect=False),
     )
 
-    # Give the candidate a moment to settle before the agent speaks first.
-    await asyncio.sleep(2)
+    # Greet as soon as the candidate can hear us, rather than after a fixed pause.
+    ready = await _wait_for_candidate_audio(ctx)
+    if not ready:
+        logger.warning("[AGENT] Candidate audio not ready after %.1fs — greeting anyway.",
+                       settings.AGENT_GREETING_MAX_WAIT_S)
+    candidate_ready_at[0] = time.monotonic()
     await session.generate_reply()
 
 
 if __name__ == "__main__":
     cli.run_app(WorkerOptions(
         entrypoint_fnc=entrypoint,
+        prewarm_fnc=prewarm,
+        load_fnc=compute_load,
+        load_threshold=settings.AGENT_LOAD_THRESHOLD,
+        num_idle_processes=settings.AGENT_NUM_IDLE_PROCESSES,
         agent_name="interviewer",   # must match CreateAgentDispatchRequest.agent_name
     ))
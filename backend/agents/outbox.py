@@ -0,0 +1,251 @@
+"""
+Durable outbox for agent → backend calls that must not be lost.
+
+A finalization POST is written to a local SQLite file before it is sent.
+It is deleted only once the backend accepts it. Failed sends are retried
+with exponential backoff and full jitter. This happens in this job, and
+in any later job process on the same worker, because the file outlives
+the process: a backend restart during finalization no longer drops the
+interview.
+
+Rows are claimed with a lease (a conditional UPDATE of next_attempt_at),
+so concurrent job processes sharing the file never send the same row at
+the same time. Backend idempotency covers the rare double send after a
+lease expires.
+
+Outbox depth and oldest-entry age are published to Redis under
+`agent:outbox:<host>` (see GET /api/metrics/agent-outbox).
+"""
+import asyncio
+import json
+import logging
+import random
+import socket
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+import httpx
+
+from backend.cache import get_redis
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+METRICS_PREFIX = "agent:outbox:"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    key             TEXT PRIMARY KEY,
+    path            TEXT NOT NULL,
+    body            TEXT NOT NULL,
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    created_at      REAL NOT NULL,
+    last_error      TEXT
+)
+"""
+
+
+def _backoff(attempts: int) -> float:
+    """Full-jitter exponential backoff for the given attempt count."""
+    cap = min(settings.AGENT_OUTBOX_BACKOFF_MAX_S, settings.AGENT_OUTBOX_BACKOFF_BASE_S * 2 ** attempts)
+    return random.uniform(0, cap)
+
+
+def _rejected(exc: Exception) -> bool:
+    """
+    True only for a definitive 4xx from the backend. Anything else — 5xx,
+    408/425/429, transport errors, a closed client, a bug on our side —
+    keeps the row for a later attempt.
+    """
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return False
+    code = exc.response.status_code
+    return 400 <= code < 500 and code not in (408, 425, 429)
+
+
+class Outbox:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._db = sqlite3.connect(path, timeout=10, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=FULL")
+        self._db.execute(_SCHEMA)
+        self._lock = threading.Lock()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    # ── Storage (sync; called via asyncio.to_thread) ─────────────────────────
+
+    def _put(self, key: str, path: str, body: dict) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO outbox (key, path, body, attempts, next_attempt_at, created_at) "
+                "VALUES (?, ?, ?, 0, ?, ?)",
+                (key, path, json.dumps(body), now, now),
+            )
+
+    def _claim(self, key: Optional[str] = None, limit: int = 20) -> list[tuple]:
+        """Lease due rows (or the one named `key`) so no other process sends them meanwhile."""
+        now = time.time()
+        lease_until = now + settings.AGENT_OUTBOX_LEASE_S
+        with self._lock:
+            if key is None:
+                rows = self._db.execute(
+                    "SELECT key, path, body, attempts FROM outbox WHERE next_attempt_at <= ? "
+                    "ORDER BY next_attempt_at LIMIT ?",
+                    (now, limit),
+                ).fetchall()
+            else:
+                rows = self._db.execute(
+                    "SELECT key, path, body, attempts FROM outbox WHERE key = ? AND next_attempt_at <= ?",
+                    (key, now),
+                ).fetchall()
+            claimed = []
+            for row in rows:
+                cur = self._db.execute(
+                    "UPDATE outbox SET next_attempt_at = ? WHERE key = ? AND next_attempt_at <= ?",
+                    (lease_until, row[0], now),
+                )
+                if cur.rowcount == 1:
+                    claimed.append(row)
+            return claimed
+
+    def _done(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM outbox WHERE key = ?", (key,))
+
+    def _retry_later(self, key: str, attempts: int, error: str) -> float:
+        delay = _backoff(attempts)
+        with self._lock:
+            self._db.execute(
+                "UPDATE outbox SET attempts = ?, next_attempt_at = ?, last_error = ? WHERE key = ?",
+                (attempts, time.time() + delay, error[:500], key),
+            )
+        return delay
+
+    def _expire(self) -> int:
+        """Drop rows older than AGENT_OUTBOX_MAX_AGE_S; returns the count removed."""
+        cutoff = time.time() - settings.AGENT_OUTBOX_MAX_AGE_S
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT key, attempts, last_error FROM outbox WHERE created_at < ?", (cutoff,)
+            ).fetchall()
+            for key, attempts, error in rows:
+                logger.error("[OUTBOX] Giving up on %s after %d attempt(s): %s", key, attempts, error)
+                self._db.execute("DELETE FROM outbox WHERE key = ?", (key,))
+        return len(rows)
+
+    def stats(self) -> dict:
+        with self._lock:
+            depth, oldest, max_attempts = self._db.execute(
+                "SELECT COUNT(*), MIN(created_at), MAX(attempts) FROM outbox"
+            ).fetchone()
+        return {
+            "depth": depth,
+            "oldest_age_s": round(time.time() - oldest, 1) if oldest else 0.0,
+            "max_attempts": max_attempts or 0,
+        }
+
+    # ── Delivery ─────────────────────────────────────────────────────────────
+
+    async def _send(self, client: httpx.AsyncClient, row: tuple) -> bool:
+        key, path, body, attempts = row
+        try:
+            resp = await client.post(f"{settings.BACKEND_URL}{path}", content=body,
+                                     headers={"Content-Type": "application/json"})
+            resp.raise_for_status()
+        except Exception as exc:
+            if _rejected(exc):
+                logger.error("[OUTBOX] %s rejected by backend, dropping: %s", key, exc)
+                await asyncio.to_thread(self._done, key)
+                return False
+            error = f"{type(exc).__name__}: {exc}"
+            delay = await asyncio.to_thread(self._retry_later, key, attempts + 1, error)
+            logger.warning("[OUTBOX] %s attempt %d failed: %s — retrying in %.1fs",
+                           key, attempts + 1, exc, delay)
+            return False
+        await asyncio.to_thread(self._done, key)
+        return True
+
+    async def submit(self, key: str, path: str, body: dict, client: httpx.AsyncClient) -> bool:
+        """Persist the call, then try it once now. Returns True if the backend accepted it."""
+        await asyncio.to_thread(self._put, key, path, body)
+        rows = await asyncio.to_thread(self._claim, key)
+        if not rows:
+            return False
+        return await self._send(client, rows[0])
+
+    async def drain(self, client: httpx.AsyncClient) -> None:
+        """Send every row that is due."""
+        await asyncio.to_thread(self._expire)
+        for row in await asyncio.to_thread(self._claim):
+            await self._send(client, row)
+
+    async def pending(self, key: str) -> bool:
+        def _exists() -> bool:
+            with self._lock:
+                return self._db.execute("SELECT 1 FROM outbox WHERE key = ?", (key,)).fetchone() is not None
+        return await asyncio.to_thread(_exists)
+
+    async def _publish_stats(self) -> None:
+        stats = await asyncio.to_thread(self.stats)
+        if stats["depth"]:
+            logger.info("[OUTBOX] depth=%d oldest_age_s=%.1f", stats["depth"], stats["oldest_age_s"])
+        try:
+            await get_redis().set(
+                f"{METRICS_PREFIX}{socket.gethostname()}",
+                json.dumps(stats),
+                ex=int(settings.AGENT_OUTBOX_POLL_S * 4),
+            )
+        except Exception as exc:
+            logger.debug("[OUTBOX] Failed to publish stats: %s", exc)
+
+    async def _run(self, client: httpx.AsyncClient) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=settings.AGENT_OUTBOX_POLL_S)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.drain(client)
+                await self._publish_stats()
+            except Exception as exc:
+                logger.warning("[OUTBOX] Drain failed: %s", exc)
+
+    def start(self, client: httpx.AsyncClient) -> None:
+        """Start the background retry loop (once per process)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(client))
+
+    async def stop(self) -> None:
+        """Cancel the retry loop and wait for it to exit. Call before closing its client."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def wait_delivered(self, key: str, timeout: float) -> bool:
+        """Wait up to `timeout` seconds for `key` to leave the outbox."""
+        deadline = time.monotonic() + timeout
+        while await self.pending(key):
+            if time.monotonic() >= deadline:
+                return False
+            self._wake.set()
+            await asyncio.sleep(min(1.0, max(deadline - time.monotonic(), 0)))
+        return True
+
+
+_outbox: Optional[Outbox] = None
+
+
+def get_outbox() -> Outbox:
+    """Return this process's handle on the shared outbox file."""
+    global _outbox
+    if _outbox is None:
+        _outbox = Outbox(settings.AGENT_OUTBOX_PATH)
+    return _outbox
@@ -0,0 +1,118 @@
+"""
+Incremental transcript checkpointing for the interviewer agent.
+
+Each committed turn gets a per-interview sequence number and is queued;
+a background task POSTs pending turns to /api/webhooks/transcript in
+small batches. Turns are only dropped from the queue once the backend
+acks their seq, so delivery is at-least-once — the backend stores turns
+by seq, making re-sends harmless. If the worker dies mid-interview the
+backend already holds everything up to the last ack.
+"""
+import asyncio
+import logging
+import time
+from typing import Optional
+
+import httpx
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+_MAX_TURNS_PER_REQUEST = 50
+
+
+class TranscriptCheckpointer:
+    def __init__(self, interview_id: str, client: httpx.AsyncClient) -> None:
+        self.interview_id = interview_id
+        self._client = client
+        self._next_seq = 0
+        self._pending: list[dict] = []    # turns not yet acked by the backend
+        self._wake = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def last_seq(self) -> int:
+        """Seq of the last recorded turn, or -1 if none."""
+        return self._next_seq - 1
+
+    @property
+    def turn_count(self) -> int:
+        return self._next_seq
+
+    @property
+    def fully_acked(self) -> bool:
+        return not self._pending
+
+    def unacked_turns(self) -> list[dict]:
+        """Turns the backend has not acked, in seq order (sent with the completion call)."""
+        return list(self._pending)
+
+    def add(self, speaker: str, text: str, latency_s: Optional[float] = None) -> int:
+        """Record a turn (sync — safe to call from event callbacks). Returns its seq."""
+        turn = {
+            "seq": self._next_seq,
+            "speaker": speaker,
+            "text": text,
+            "ts": time.time(),
+            "latency_s": latency_s,
+        }
+        self._next_seq += 1
+        self._pending.append(turn)
+        if len(self._pending) >= settings.AGENT_TRANSCRIPT_BATCH_SIZE:
+            self._wake.set()
+        return turn["seq"]
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=settings.AGENT_TRANSCRIPT_FLUSH_S)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self) -> bool:
+        """Send all pending turns. Returns True if everything is acked."""
+        async with self._lock:
+            while self._pending:
+                batch = self._pending[:_MAX_TURNS_PER_REQUEST]
+                try:
+                    resp = await self._client.post(
+                        f"{settings.BACKEND_URL}/api/webhooks/transcript",
+                        json={"interview_id": self.interview_id, "turns": batch},
+                    )
+                    if resp.status_code == 409:
+                        # A report already exists — late turns can no longer change it.
+                        logger.info("[CHECKPOINT] interview=%s already evaluated — dropping %d turn(s).",
+                                    self.interview_id, len(self._pending))
+                        self._pending.clear()
+                        return True
+                    resp.raise_for_status()
+                    acked = resp.json().get("acked_seq", batch[-1]["seq"])
+                except Exception as exc:
+                    logger.warning(
+                        "[CHECKPOINT] interview=%s failed to send %d turn(s): %s",
+                        self.interview_id, len(batch), exc,
+                    )
+                    return False
+                self._pending = [t for t in self._pending if t["seq"] > acked]
+                logger.debug("[CHECKPOINT] interview=%s acked through seq %d", self.interview_id, acked)
+            return True
+
+    async def aclose(self, attempts: int = 3) -> bool:
+        """Stop the background loop and make a final bounded flush."""
+        self._closed = True
+        self._wake.set()
+        if self._task:
+            await asyncio.gather(self._task, return_exceptions=True)
+        for attempt in range(attempts):
+            if await self.flush():
+                return True
+            await asyncio.sleep(0.5 * 2 ** attempt)
+        return False
@@ -0,0 +1,33 @@
+"""composite indexes for keyset pagination of list endpoints
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_interviews_user_created_id", "interviews", ["user_id", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_interviews_user_status_created_id",
+        "interviews",
+        ["user_id", "status", "created_at", "id"],
+    )
+    op.create_index("ix_reports_generated_id", "reports", ["generated_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reports_generated_id", table_name="reports")
+    op.drop_index("ix_interviews_user_status_created_id", table_name="interviews")
+    op.drop_index("ix_interviews_user_created_id", table_name="interviews")
@@ -0,0 +1,87 @@
+"""per-turn transcript storage, backfilled from interviews.transcript
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+import re
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of services.transcript_store.parse_transcript — migrations must
+# not change behaviour if the application parser evolves.
+_TURN_RE = re.compile(r"^(Candidate|Interviewer):[ \t]?(.*)$", re.DOTALL)
+_BATCH = 500
+
+
+def _parse(transcript: str) -> list[dict]:
+    turns: list[dict] = []
+    for block in transcript.split("\n\n"):
+        match = _TURN_RE.match(block)
+        if match:
+            turns.append({"speaker": match.group(1), "text": match.group(2).strip()})
+        elif turns and block.strip():
+            turns[-1]["text"] += "\n\n" + block.strip()
+    return turns
+
+
+def upgrade() -> None:
+    turns_table = op.create_table(
+        "transcript_turns",
+        sa.Column(
+            "interview_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("interviews.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("seq", sa.Integer, primary_key=True),
+        sa.Column("speaker", sa.String(50), nullable=False),
+        sa.Column("text", sa.Text, nullable=False),
+        sa.Column("spoken_at", sa.DateTime, nullable=True),
+        sa.Column("latency_s", sa.Float, nullable=True),
+        sa.Column("created_at", sa.DateTime, nullable=False, server_default=sa.func.now()),
+    )
+
+    # Backfill: split every existing transcript blob into turns.
+    conn = op.get_bind()
+    # stream_results on the statement only — Connection.execution_options()
+    # would switch every later statement (alembic's own too) to a server-side cursor.
+    result = conn.execute(
+        sa.text("SELECT id, transcript FROM interviews WHERE transcript IS NOT NULL")
+        .execution_options(stream_results=True)
+    )
+    rows: list[dict] = []
+    for interview_id, transcript in result:
+        for seq, turn in enumerate(_parse(transcript)):
+            rows.append({"interview_id": interview_id, "seq": seq, **turn})
+        if len(rows) >= _BATCH:
+            op.bulk_insert(turns_table, rows)
+            rows = []
+    if rows:
+        op.bulk_insert(turns_table, rows)
+
+
+def downgrade() -> None:
+    # Restore the blob for interviews that only have structured turns.
+    op.execute(
+        """
+        UPDATE interviews AS i
+        SET transcript = t.body
+        FROM (
+            SELECT interview_id, string_agg(speaker || ': ' || text, E'\\n\\n' ORDER BY seq) AS body
+            FROM transcript_turns
+            GROUP BY interview_id
+        ) AS t
+        WHERE i.id = t.interview_id AND i.transcript IS NULL
+        """
+    )
+    op.drop_table("transcript_turns")
@@ -0,0 +1,38 @@
+"""segment assessments for incremental evaluation
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "segment_assessments",
+        sa.Column(
+            "interview_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("interviews.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("start_seq", sa.Integer, primary_key=True),
+        sa.Column("end_seq", sa.Integer, nullable=False),
+        sa.Column("skill_scores", sa.JSON, nullable=False),
+        sa.Column("observations", sa.JSON, nullable=False),
+        sa.Column("created_at", sa.DateTime, nullable=False, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("segment_assessments")
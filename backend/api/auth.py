@@ -1,9 +1,19 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.auth import create_access_token, get_current_user, hash_password, verify_password
+from backend.auth import (
+    AuthenticatedUser,
+    bearer_scheme,
+    create_access_token,
+    get_current_user,
+    hash_password_async,
+    revoke_token,
+    verify_password_async,
+)
 from backend.db import models
 from backend.db.database import get_db
 from backend.db.schemas import LoginRequest, RegisterRequest, TokenResponse, UserResponse
@@ -12,28 +22,36 @@ router = APIRouter(prefix="/api/auth", tags=["auth"])
 
 
 @router.post("/register", response_model=TokenResponse, status_code=201)
-def register(payload: RegisterRequest, db: Session = Depends(get_db)):
+async def register(payload: RegisterRequest, db: AsyncSession = Depends(get_db)):
     if len(payload.password) < 8:
         raise HTTPException(status_code=400, detail="Password must be at least 8 characters.")
-    if db.query(models.User).filter(models.User.email == payload.email).first():
+
+    if await db.scalar(select(models.User.id).where(models.User.email == payload.email)):
         raise HTTPException(status_code=400, detail="Email already registered.")
+    await db.close()   # don't hold a pooled connection while queued for bcrypt
 
     user = models.User(
         id=uuid.uuid4(),
         email=payload.email,
-        hashed_password=hash_password(payload.password),
+        hashed_password=await hash_password_async(payload.password),
         full_name=payload.full_name,
     )
     db.add(user)
-    db.commit()
+    await db.commit()
 
     return TokenResponse(access_token=create_access_token(str(user.id)))
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(payload: LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(models.User).filter(models.User.email == payload.email).first()
-    if not user or not verify_password(payload.password, user.hashed_password):
+async def login(payload: LoginRequest, db: AsyncSession = Depends(get_db)):
+    user = (
+        await db.execute(
+            select(models.User.id, models.User.hashed_password)
+            .where(models.User.email == payload.email)
+        )
+    ).first()
+    await db.close()   # don't hold a pooled connection while queued for bcrypt
+    if not user or not await verify_password_async(payload.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password.",
@@ -42,5 +60,11 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserResponse)
-def me(current_user: models.User = Depends(get_current_user)):
+def me(current_user: AuthenticatedUser = Depends(get_current_user)):
     return current_user
+
+
+@router.post("/logout", status_code=204)
+async def logout(credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)):
+    await revoke_token(credentials.credentials)
+    return Response(status_code=204)
@@ -1,40 +1,88 @@
+import asyncio
+import csv
+import io
+import json
+import logging
+import re
 import uuid
 from datetime import datetime
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, load_only
 
-from backend.agents.evaluator_agent import extract_skills_from_jd
-from backend.auth import get_current_user
+from backend.auth import AuthenticatedUser, get_current_user
 from backend.config import settings
 from backend.db import models
-from backend.db.database import get_db
-from backend.db.schemas import CreateInterviewRequest, InterviewResponse
-from backend.services.livekit_service import create_interview_room, generate_candidate_token
+from backend.db.database import AsyncSessionLocal, get_db
+from backend.db.pagination import keyset_page, split_page
+from backend.db.schemas import BulkCreateInterviewRequest, CreateInterviewRequest, InterviewResponse
+from backend.observability import StageTimer
+from backend.serialization import encode_json
+from backend.services.livekit_service import (
+    create_interview_room,
+    create_room,
+    delete_room,
+    dispatch_agent,
+    generate_candidate_token,
+    room_metadata,
+    update_room_metadata,
+)
+from backend.services.skills_service import remember_skills, resolve_skills
+from backend.services.transcript_store import suffix_start, turn_stats, turns_query
 
 router = APIRouter(prefix="/api/interviews", tags=["interviews"])
+logger = logging.getLogger(__name__)
+
+_TURN_RANGE_RE = re.compile(r"^turns=(\d*)-(\d*)$")
 
 
 @router.post("/", response_model=InterviewResponse, status_code=201)
 async def create_interview(
     payload: CreateInterviewRequest,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
-    """Recruiter creates an interview — returns an invite link to send the candidate."""
-    skills = extract_skills_from_jd(payload.job_description, payload.role)
+    """
+    Recruiter creates an interview — returns an invite link to send the candidate.
 
+    Pipeline (stages on the same line overlap):
+      1. skill extraction  ‖  room creation with provisional metadata
+      2. metadata update → agent dispatch  ‖  DB insert (flush)
+      3. commit
+    The per-stage breakdown is returned in the Server-Timing header. If any
+    stage after room creation fails, the room is deleted again.
+    """
+    timer = StageTimer()
     interview_id = str(uuid.uuid4())
     room_name = f"interview-{interview_id}"
 
-    await create_interview_room(
-        room_name=room_name,
-        interview_id=interview_id,
-        role=payload.role,
-        job_description=payload.job_description,
-        skills_to_cover=skills,
-        candidate_name=payload.candidate_name,
+    def metadata(skills: list[str]) -> str:
+        return room_metadata(
+            interview_id=interview_id,
+            role=payload.role,
+            job_description=payload.job_description,
+            skills_to_cover=skills,
+            candidate_name=payload.candidate_name,
+        )
+
+    skills, created = await asyncio.gather(
+        timer.run("skills", resolve_skills(payload.job_description, payload.role)),
+        timer.run("create_room", create_room(room_name, metadata([]))),
+        return_exceptions=True,
     )
+    if isinstance(created, BaseException):
+        raise created
+    if isinstance(skills, BaseException):
+        await delete_room(room_name)
+        raise skills
 
     interview = models.Interview(
         id=uuid.UUID(interview_id),
@@ -48,7 +96,28 @@ async def create_interview(
         status="pending",
     )
     db.add(interview)
-    db.commit()
+
+    async def finalize_room() -> None:
+        await timer.run("update_metadata", update_room_metadata(room_name, metadata(skills)))
+        await timer.run("dispatch", dispatch_agent(room_name))
+
+    results = await asyncio.gather(
+        finalize_room(),
+        timer.run("db_insert", db.flush()),
+        return_exceptions=True,
+    )
+    errors = [r for r in results if isinstance(r, BaseException)]
+    try:
+        if errors:
+            raise errors[0]
+        await timer.run("db_commit", db.commit())
+    except Exception:
+        await db.rollback()
+        await delete_room(room_name)
+        raise
+
+    response.headers["Server-Timing"] = timer.server_timing()
+    logger.info("[CREATE] interview=%s %s", interview_id, timer.server_timing())
 
     return InterviewResponse(
         id=interview.id,
@@ -60,13 +129,184 @@ async def create_interview(
     )
 
 
+async def _parse_bulk_request(request: Request) -> BulkCreateInterviewRequest:
+    """
+    Accept either a JSON body matching BulkCreateInterviewRequest, or a
+    multipart form with `role`, `job_description` and a `candidates` CSV
+    file whose header row contains candidate_name,candidate_email.
+    """
+    content_type = request.headers.get("content-type", "")
+    try:
+        if content_type.startswith("multipart/form-data"):
+            form = await request.form()
+            upload = form.get("candidates")
+            if upload is None or isinstance(upload, str):
+                raise HTTPException(status_code=400, detail="Missing 'candidates' CSV file.")
+            text = (await upload.read()).decode("utf-8-sig")
+            payload = BulkCreateInterviewRequest(
+                role=form.get("role", ""),
+                job_description=form.get("job_description", ""),
+                candidates=list(csv.DictReader(io.StringIO(text))),
+            )
+        else:
+            payload = BulkCreateInterviewRequest.model_validate(await request.json())
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors())
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Malformed request body.")
+
+    if not payload.role or not payload.job_description:
+        raise HTTPException(status_code=400, detail="role and job_description are required.")
+    if not payload.candidates:
+        raise HTTPException(status_code=400, detail="No candidates supplied.")
+    if len(payload.candidates) > settings.BULK_CREATE_MAX_CANDIDATES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.BULK_CREATE_MAX_CANDIDATES} candidates per batch.",
+        )
+    return payload
+
+
+@router.post("/bulk", status_code=201)
+async def bulk_create_interviews(
+    request: Request,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    Create one interview per candidate for a single JD (hiring drives).
+
+    Skills are extracted once and rooms + dispatches are created
+    concurrently (at most BULK_CREATE_CONCURRENCY in flight). Streams one
+    NDJSON line per candidate in completion order: a failure as soon as its
+    room fails, an invite link once its row is committed. Rows are inserted
+    in batches of BULK_CREATE_INSERT_BATCH; if a batch cannot be written,
+    its rooms are deleted and its candidates reported as failed. Rooms that
+    were provisioned but never persisted (e.g. the client disconnected) are
+    deleted as well.
+    """
+    payload = await _parse_bulk_request(request)
+    skills = await resolve_skills(payload.job_description, payload.role)
+    semaphore = asyncio.Semaphore(settings.BULK_CREATE_CONCURRENCY)
+
+    async def provision(candidate) -> tuple:
+        interview_id = str(uuid.uuid4())
+        async with semaphore:
+            try:
+                await create_interview_room(
+                    room_name=f"interview-{interview_id}",
+                    interview_id=interview_id,
+                    role=payload.role,
+                    job_description=payload.job_description,
+                    skills_to_cover=skills,
+                    candidate_name=candidate.candidate_name,
+                )
+            except BaseException as exc:
+                # The room may exist even though the dispatch failed or was cancelled.
+                with anyio.CancelScope(shield=True):
+                    await delete_room(f"interview-{interview_id}")
+                if not isinstance(exc, Exception):
+                    raise
+                logger.warning("[BULK] Room creation failed for %s: %s", candidate.candidate_email, exc)
+                return candidate, interview_id, exc
+        return candidate, interview_id, None
+
+    def line(candidate, **fields) -> str:
+        return json.dumps({
+            "candidate_name": candidate.candidate_name,
+            "candidate_email": candidate.candidate_email,
+            **fields,
+        }) + "\n"
+
+    async def persist(batch: list[tuple]) -> tuple[bool, list[str]]:
+        """Insert and commit one batch; returns whether it was saved and its NDJSON lines."""
+        created_at = datetime.utcnow()
+        rows = [
+            {
+                "id": uuid.UUID(interview_id),
+                "user_id": current_user.id,
+                "candidate_name": candidate.candidate_name,
+                "candidate_email": candidate.candidate_email,
+                "role": payload.role,
+                "job_description": payload.job_description,
+                "skills_to_cover": skills,
+                "livekit_room_name": f"interview-{interview_id}",
+                "status": "pending",
+                "created_at": created_at,
+            }
+            for candidate, interview_id in batch
+        ]
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(insert(models.Interview), rows)
+                await db.commit()
+        except Exception as exc:
+            logger.error("[BULK] Could not save %d interviews: %s", len(batch), exc)
+            await asyncio.gather(*(delete_room(f"interview-{interview_id}") for _, interview_id in batch))
+            return False, [line(candidate, status="failed", error=str(exc)) for candidate, _ in batch]
+        return True, [
+            line(
+                candidate,
+                id=interview_id,
+                status="pending",
+                invite_link=f"{settings.FRONTEND_URL}/interview/{interview_id}",
+                created_at=created_at.isoformat(),
+            )
+            for candidate, interview_id in batch
+        ]
+
+    async def stream():
+        tasks = [asyncio.create_task(provision(c)) for c in payload.candidates]
+        batch: list[tuple] = []
+        settled: set[str] = set()   # persisted, or rooms already deleted
+        created = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                candidate, interview_id, error = await next_done
+                if error is not None:
+                    settled.add(interview_id)
+                    yield line(candidate, status="failed", error=str(error))
+                    continue
+                batch.append((candidate, interview_id))
+                if len(batch) < settings.BULK_CREATE_INSERT_BATCH and len(settled) + len(batch) < len(tasks):
+                    continue
+                with anyio.CancelScope(shield=True):   # don't abandon a batch mid-commit
+                    saved, lines = await persist(batch)
+                settled.update(interview_id for _, interview_id in batch)
+                created += len(batch) if saved else 0
+                batch = []
+                for text in lines:
+                    yield text
+            logger.info("[BULK] %d/%d interviews created for role '%s'.", created, len(tasks), payload.role)
+        finally:
+            # Runs inside Starlette's cancelled scope when the client goes away.
+            with anyio.CancelScope(shield=True):
+                for task in tasks:
+                    task.cancel()
+                outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+                orphans = [
+                    outcome[1] for outcome in outcomes
+                    if not isinstance(outcome, BaseException) and outcome[2] is None and outcome[1] not in settled
+                ]
+                if orphans:
+                    logger.warning("[BULK] Deleting %d rooms that were never saved.", len(orphans))
+                    await asyncio.gather(*(delete_room(f"interview-{interview_id}") for interview_id in orphans))
+
+    return StreamingResponse(stream(), status_code=201, media_type="application/x-ndjson")
+
+
 @router.get("/{interview_id}/token")
-def get_candidate_token(interview_id: str, db: Session = Depends(get_db)):
+async def get_candidate_token(interview_id: str, db: AsyncSession = Depends(get_db)):
     """Candidate fetches their LiveKit token to join the interview room."""
-    interview = (
-        db.query(models.Interview)
-        .filter(models.Interview.id == uuid.UUID(interview_id))
-        .first()
+    interview = await db.scalar(
+        select(models.Interview)
+        .options(load_only(
+            models.Interview.status,
+            models.Interview.livekit_room_name,
+            models.Interview.candidate_name,
+            models.Interview.role,
+            models.Interview.started_at,
+        ))
+        .where(models.Interview.id == uuid.UUID(interview_id))
     )
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found.")
@@ -81,7 +321,7 @@ def get_candidate_token(interview_id: str, db: Session = Depends(get_db)):
     if interview.status == "pending":
         interview.status = "active"
         interview.started_at = datetime.now()
-        db.commit()
+        await db.commit()
 
     return {
         "token": token,
@@ -95,21 +335,27 @@ def get_candidate_token(interview_id: str, db: Session = Depends(get_db)):
 @router.post("/{interview_id}/repeat", response_model=InterviewResponse, status_code=201)
 async def repeat_interview(
     interview_id: str,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     """Create a new interview with identical settings as an existing one."""
-    original = (
-        db.query(models.Interview)
-        .filter(
+    original = await db.scalar(
+        select(models.Interview)
+        .options(defer(models.Interview.transcript))
+        .where(
             models.Interview.id == uuid.UUID(interview_id),
             models.Interview.user_id == current_user.id,
         )
-        .first()
     )
     if not original:
         raise HTTPException(status_code=404, detail="Interview not found.")
 
+    if original.skills_to_cover:
+        await remember_skills(original.job_description, original.role, original.skills_to_cover)
+        skills = original.skills_to_cover
+    else:
+        skills = await resolve_skills(original.job_description, original.role)
+
     new_id = str(uuid.uuid4())
     room_name = f"interview-{new_id}"
 
@@ -118,7 +364,7 @@ async def repeat_interview(
         interview_id=new_id,
         role=original.role,
         job_description=original.job_description,
-        skills_to_cover=original.skills_to_cover,
+        skills_to_cover=skills,
         candidate_name=original.candidate_name,
     )
 
@@ -129,12 +375,12 @@ async def repeat_interview(
         candidate_email=original.candidate_email,
         role=original.role,
         job_description=original.job_description,
-        skills_to_cover=original.skills_to_cover,
+        skills_to_cover=skills,
         livekit_room_name=room_name,
         status="pending",
     )
     db.add(interview)
-    db.commit()
+    await db.commit()
 
     return InterviewResponse(
         id=interview.id,
@@ -146,26 +392,148 @@ async def repeat_interview(
     )
 
 
-@router.get("/", response_model=list[InterviewResponse])
-def list_interviews(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+def _turn_range(
+    range_header: Optional[str], start: int, end: Optional[int]
+) -> tuple[Optional[int], Optional[int], Optional[int]]:
+    """
+    Resolve `Range: turns=a-b` over the query-param range into (first, last,
+    None), or `turns=-n` into (None, None, n) for the last n stored turns.
+    """
+    if not range_header:
+        return start, end, None
+    match = _TURN_RANGE_RE.match(range_header.strip())
+    if not match or match.groups() == ("", ""):
+        raise HTTPException(status_code=416, detail="Range must be 'turns=<first>-<last>'.")
+    first, last = match.groups()
+    if not first:
+        return None, None, int(last)
+    return int(first), int(last) if last else None, None
+
+
+@router.get("/{interview_id}/transcript")
+async def get_transcript(
+    interview_id: str,
+    request: Request,
+    start: int = Query(0, ge=0),
+    end: Optional[int] = Query(None, ge=0),
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
-    """Dashboard — list all interviews for the current user, newest first."""
-    interviews = (
-        db.query(models.Interview)
-        .filter(models.Interview.user_id == current_user.id)
-        .order_by(models.Interview.created_at.desc())
-        .all()
+    """
+    Stream the interview's transcript as NDJSON, one turn per line, in seq
+    order. Select turns with `start`/`end` (inclusive seqs) or a
+    `Range: turns=<first>-<last>` header, which answers 206 with
+    `Content-Range: turns <first>-<last>/<total>`.
+    """
+    iid = uuid.UUID(interview_id)
+    owned = await db.scalar(
+        select(models.Interview.id).where(
+            models.Interview.id == iid,
+            models.Interview.user_id == current_user.id,
+        )
     )
-    return [
-        InterviewResponse(
-            id=i.id,
-            candidate_name=i.candidate_name,
-            role=i.role,
-            status=i.status,
-            invite_link=f"{settings.FRONTEND_URL}/interview/{i.id}",
-            created_at=i.created_at,
+    if not owned:
+        raise HTTPException(status_code=404, detail="Interview not found.")
+
+    total, last_seq = await turn_stats(db, iid)
+    range_header = request.headers.get("range")
+    first, last, suffix = _turn_range(range_header, start, end)
+    if suffix is not None:
+        # Counting back from the end by seq would be off wherever seqs have gaps.
+        first = await suffix_start(db, iid, suffix)
+        if first is None:
+            first = last_seq + 1 if last_seq is not None else 0
+    if last is not None and last < first:
+        raise HTTPException(status_code=416, detail="Range end precedes start.")
+    if total and first > last_seq:
+        raise HTTPException(
+            status_code=416,
+            detail="Range not satisfiable.",
+            headers={"Content-Range": f"turns */{total}"},
         )
+
+    headers = {"Accept-Ranges": "turns", "X-Total-Turns": str(total)}
+    if range_header and total:
+        headers["Content-Range"] = f"turns {first}-{min(last_seq, last if last is not None else last_seq)}/{total}"
+
+    async def stream():
+        # The request-scoped session is released before the body is sent,
+        # so the stream reads through its own session.
+        async with AsyncSessionLocal() as stream_db:
+            turns = await stream_db.stream_scalars(
+                turns_query(iid, first, last).execution_options(yield_per=200)
+            )
+            async for turn in turns:
+                yield encode_json({
+                    "seq": turn.seq,
+                    "speaker": turn.speaker,
+                    "text": turn.text,
+                    "spoken_at": turn.spoken_at,
+                    "latency_s": turn.latency_s,
+                }) + "\n"
+
+    return StreamingResponse(
+        stream(),
+        status_code=206 if "Content-Range" in headers else 200,
+        media_type="application/x-ndjson",
+        headers=headers,
+    )
+
+
+@router.get("/", response_model=list[InterviewResponse])
+async def list_interviews(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    role: Optional[str] = None,
+    min_score: Optional[float] = Query(None, ge=0, le=10),
+    max_score: Optional[float] = Query(None, ge=0, le=10),
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    Dashboard — list the current user's interviews, newest first.
+
+    Keyset-paginated on (created_at, id): pass the `X-Next-Cursor` response
+    header back as `cursor` to fetch the next page. A score filter only
+    matches interviews that already have a report.
+    """
+    # Project only the summary columns — never job_description / transcript.
+    query = select(
+        models.Interview.id,
+        models.Interview.candidate_name,
+        models.Interview.role,
+        models.Interview.status,
+        models.Interview.created_at,
+    ).where(models.Interview.user_id == current_user.id)
+    if status:
+        query = query.where(models.Interview.status == status)
+    if role:
+        query = query.where(models.Interview.role == role)
+    if min_score is not None or max_score is not None:
+        query = query.join(models.Report, models.Report.interview_id == models.Interview.id)
+        if min_score is not None:
+            query = query.where(models.Report.overall_score >= min_score)
+        if max_score is not None:
+            query = query.where(models.Report.overall_score <= max_score)
+
+    try:
+        query = keyset_page(query, models.Interview.created_at, models.Interview.id, cursor, limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    rows = (await db.execute(query)).all()
+    interviews, next_cursor = split_page(rows, limit, key=lambda i: (i.created_at, i.id))
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+
+    body = encode_json([
+        {
+            "id": i.id,
+            "candidate_name": i.candidate_name,
+            "role": i.role,
+            "status": i.status,
+            "invite_link": f"{settings.FRONTEND_URL}/interview/{i.id}",
+            "created_at": i.created_at,
+        }
         for i in interviews
-    ]
+    ])
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,11 +1,26 @@
 """
 Metrics endpoint — receives frontend-measured latency and logs it to Langfuse.
 """
+import json
 import logging
-from fastapi import APIRouter
+import time
+import uuid
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.observability import get_langfuse
+from backend.agents.outbox import METRICS_PREFIX as OUTBOX_METRICS_PREFIX
+from backend.auth import AuthenticatedUser, auth_cache_stats, get_current_user, password_pool_stats
+from backend.cache import get_redis
+from backend.config import settings
+from backend.db import models
+from backend.db.database import get_db
+from backend.services.dead_letter import dead_letter_ids, list_dead_letters
+from backend.services.llm_limiter import budget_keys, slots_key
+from backend.observability import get_telemetry
+from backend.services.report_cache import report_cache_stats
+from backend.services.skills_service import skill_cache_stats
 
 router = APIRouter(prefix="/api/metrics", tags=["metrics"])
 logger = logging.getLogger(__name__)
@@ -23,12 +38,96 @@ def record_latency(event: LatencyEvent):
         "[METRICS] interview=%s turn=%d latency=%dms",
         event.interview_id, event.turn_index, event.latency_ms,
     )
-    lf = get_langfuse()
-    if lf:
-        lf.score(
-            trace_id=event.interview_id,
-            name="turn_latency_ms",
-            value=event.latency_ms,
-            comment=f"Turn {event.turn_index} — VAD stop to agent audio (browser-measured)",
-        )
+    get_telemetry().score(
+        trace_id=event.interview_id,
+        name="turn_latency_ms",
+        value=event.latency_ms,
+        comment=f"Turn {event.turn_index} — VAD stop to agent audio (browser-measured)",
+    )
     return {"ok": True}
+
+
+@router.get("/cache")
+def cache_stats():
+    """Hit/miss counters for the in-process and Redis caches."""
+    return {
+        "skills": skill_cache_stats(),
+        "reports": report_cache_stats(),
+        "auth": auth_cache_stats(),
+    }
+
+
+@router.get("/password-pool")
+def password_pool():
+    """Queue depth and throughput of the bcrypt hashing pool."""
+    return password_pool_stats()
+
+
+@router.get("/telemetry")
+def telemetry():
+    """Buffered Langfuse emission in this API process: queue depth and drops."""
+    return get_telemetry().stats()
+
+
+@router.get("/agent-outbox")
+async def agent_outbox():
+    """Finalization outbox depth and oldest-entry age, per agent worker host."""
+    redis = get_redis()
+    workers = {}
+    async for key in redis.scan_iter(match=OUTBOX_METRICS_PREFIX + "*"):
+        raw = await redis.get(key)
+        if raw:
+            workers[key.removeprefix(OUTBOX_METRICS_PREFIX)] = json.loads(raw)
+    return {
+        "workers": workers,
+        "depth": sum(w["depth"] for w in workers.values()),
+        "oldest_age_s": max((w["oldest_age_s"] for w in workers.values()), default=0.0),
+    }
+
+
+@router.get("/llm")
+async def llm_in_flight():
+    """Gemini in-flight slots, rate buckets, and 429 cooldown, across all workers."""
+    r = get_redis()
+    now = time.time()
+    requests_key, tokens_key, cooldown_key = budget_keys()
+    in_flight = await r.zcount(slots_key(), now, "+inf")
+    buckets = {}
+    for name, key, cap in (
+        ("requests", requests_key, settings.LLM_RPM),
+        ("tokens", tokens_key, settings.LLM_TPM),
+    ):
+        level, ts = await r.hmget(key, "level", "ts")
+        if level is None:
+            available = cap
+        elif ts is None:
+            available = None   # no timestamp to refill from
+        else:
+            available = round(min(cap, float(level) + (now - float(ts)) * cap / 60))
+        buckets[name] = {"available": available, "per_minute": cap}
+    cooldown_until = float(await r.get(cooldown_key) or 0)
+    return {
+        "in_flight": in_flight,
+        "limit": settings.LLM_MAX_IN_FLIGHT,
+        **buckets,
+        "interactive_reserve": settings.LLM_INTERACTIVE_RESERVE,
+        "cooldown_s": round(max(0.0, cooldown_until - now), 1),
+    }
+
+
+@router.get("/eval-dead-letter")
+async def eval_dead_letter(
+    limit: int = 100,
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    """The caller's evaluations that failed permanently or exhausted their retries, most recent first."""
+    parked = [uuid.UUID(i) for i in await dead_letter_ids()]
+    owned = (await db.scalars(
+        select(models.Interview.id).where(
+            models.Interview.user_id == current_user.id,
+            models.Interview.id.in_(parked),
+        )
+    )).all() if parked else []
+    total, entries = await list_dead_letters([str(i) for i in owned], limit)
+    return {"total": total, "entries": entries}
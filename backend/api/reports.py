@@ -1,72 +1,246 @@
+import asyncio
+import json
 import uuid
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
+from backend.auth import AuthenticatedUser, get_current_user
+from backend.config import settings
 from backend.db import models
-from backend.db.database import get_db
+from backend.db.database import AsyncSessionLocal, get_db
+from backend.db.pagination import keyset_page, split_page
+from backend.serialization import encode_json
+from backend.services.dead_letter import clear_dead_letter, get_dead_letter
+from backend.services.evaluation_queue import enqueue_evaluation
+from backend.services.report_cache import cache_report, get_cached_report, serialize_report
+from backend.services.report_events import (
+    close_subscription,
+    next_report_event,
+    subscribe_report_ready,
+)
 
 router = APIRouter(prefix="/api/reports", tags=["reports"])
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
 @router.get("/{interview_id}")
-def get_report(interview_id: str, db: Session = Depends(get_db)):
-    """Fetch the full evaluation report for an interview."""
-    interview = (
-        db.query(models.Interview)
-        .filter(models.Interview.id == uuid.UUID(interview_id))
-        .first()
-    )
-    if not interview:
+async def get_report(
+    interview_id: str,
+    db: AsyncSession = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """
+    Fetch the full evaluation report for an interview.
+
+    Finalized reports are served from the report cache (in-process LRU →
+    Redis → DB) with an ETag, so the browser can revalidate with
+    If-None-Match and get a 304.
+    """
+    try:
+        iid = uuid.UUID(interview_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Interview not found.")
+    cache_key = str(iid)   # one cache entry per interview, however the ID is spelled
+
+    cached = await get_cached_report(cache_key)
+    if cached is None:
+        interview = await db.scalar(
+            select(models.Interview)
+            .options(load_only(models.Interview.candidate_name, models.Interview.role, models.Interview.status))
+            .where(models.Interview.id == iid)
+        )
+        if not interview:
+            raise HTTPException(status_code=404, detail="Interview not found.")
+        report = await db.scalar(select(models.Report).where(models.Report.interview_id == iid))
+        if not report and interview.status == "evaluation_failed":
+            raise HTTPException(
+                status_code=409,
+                detail=f"Evaluation failed — retry it with POST /api/reports/{interview_id}/retry.",
+            )
+        if not report:
+            # 202 = request accepted but not ready yet
+            raise HTTPException(status_code=202, detail="Report is still being generated.")
+        cached = await cache_report(cache_key, encode_json(serialize_report(report, interview)))
+
+    body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.post("/{interview_id}/retry", status_code=202)
+async def retry_evaluation(
+    interview_id: str,
+    regenerate: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    Requeue the evaluation of a finished interview, e.g. one that was
+    dead-lettered after exhausting its retries. Requeueing an interview
+    that already has a report requires `regenerate=true`.
+    """
+    iid = uuid.UUID(interview_id)
+    row = (
+        await db.execute(
+            select(models.Interview.status, models.Report.id)
+            .outerjoin(models.Report, models.Report.interview_id == models.Interview.id)
+            .where(models.Interview.id == iid, models.Interview.user_id == current_user.id)
+        )
+    ).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Interview not found.")
+    status, report_id = row
+    if status in ("pending", "active"):
+        raise HTTPException(status_code=409, detail="Interview has not finished yet.")
+    if report_id is not None and not regenerate:
+        raise HTTPException(status_code=409, detail="Report already exists — pass regenerate=true to replace it.")
+
+    dead_letter = await get_dead_letter(interview_id)
+    if status == "evaluation_failed":
+        await db.execute(update(models.Interview).where(models.Interview.id == iid).values(status="completed"))
+        await db.commit()
+    await enqueue_evaluation(interview_id, force=True, regenerate=regenerate)
+    await clear_dead_letter(interview_id)
+    return {"interview_id": interview_id, "status": "queued", "previous_failure": dead_letter}
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.get("/{interview_id}/events")
+async def report_events(interview_id: str):
+    """
+    Server-Sent Events stream that fires `ready` once the report exists,
+    or `failed` once its evaluation has been dead-lettered.
+
+    Registers for readiness events *before* a single DB check so a report
+    committed in between is never missed. While waiting, no DB
+    queries are made (the session is closed before streaming, so no pooled
+    connection is held) — only keep-alive comments are sent. After
+    REPORT_EVENTS_TIMEOUT_S a `timeout` event closes the stream and the
+    browser's EventSource reconnects.
+    """
+    iid = uuid.UUID(interview_id)
+    events = subscribe_report_ready(interview_id)
+
+    try:
+        async with AsyncSessionLocal() as db:
+            row = (
+                await db.execute(
+                    select(models.Interview.status, models.Report.id)
+                    .outerjoin(models.Report, models.Report.interview_id == models.Interview.id)
+                    .where(models.Interview.id == iid)
+                )
+            ).first()
+    except BaseException:
+        close_subscription(interview_id, events)
+        raise
+    if not row:
+        close_subscription(interview_id, events)
         raise HTTPException(status_code=404, detail="Interview not found.")
 
-    report = (
-        db.query(models.Report)
-        .filter(models.Report.interview_id == uuid.UUID(interview_id))
-        .first()
+    async def stream():
+        try:
+            yield "retry: 3000\n\n"
+            if row[1] is not None:
+                yield _sse("ready", {"interview_id": interview_id, "report_id": str(row[1])})
+                return
+            if row[0] == "evaluation_failed":
+                yield _sse("failed", {"interview_id": interview_id})
+                return
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + settings.REPORT_EVENTS_TIMEOUT_S
+            while (remaining := deadline - loop.time()) > 0:
+                event = await next_report_event(
+                    events, timeout=min(settings.REPORT_EVENTS_KEEPALIVE_S, remaining)
+                )
+                if event is not None:
+                    yield _sse("failed" if "error" in event else "ready", event)
+                    return
+                yield ": keep-alive\n\n"
+            yield _sse("timeout", {"interview_id": interview_id})
+        finally:
+            close_subscription(interview_id, events)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    if not report:
-        # 202 = request accepted but not ready yet
-        raise HTTPException(status_code=202, detail="Report is still being generated.")
-
-    return {
-        "id": str(report.id),
-        "interview_id": str(report.interview_id),
-        "candidate_name": interview.candidate_name,
-        "role_applied": interview.role,
-        "overall_score": report.overall_score,
-        "role_eligibility": report.role_eligibility,
-        "recommendation": report.recommendation,
-        "skill_scores": report.skill_scores,
-        "competency_scores": report.competency_scores,
-        "strengths": report.strengths,
-        "weaknesses": report.weaknesses,
-        "areas_for_improvement": report.areas_for_improvement,
-        "red_flags": report.red_flags,
-        "green_flags": report.green_flags,
-        "interview_quality_notes": report.interview_quality_notes,
-        "generated_at": report.generated_at,
-    }
 
 
 @router.get("/")
-def list_reports(db: Session = Depends(get_db)):
-    """List all generated reports with summary info."""
-    rows = (
-        db.query(models.Report, models.Interview)
-        .outerjoin(models.Interview, models.Interview.id == models.Report.interview_id)
-        .order_by(models.Report.generated_at.desc())
-        .all()
+async def list_reports(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    role: Optional[str] = None,
+    eligibility: Optional[str] = None,
+    min_score: Optional[float] = Query(None, ge=0, le=10),
+    max_score: Optional[float] = Query(None, ge=0, le=10),
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    List the current user's generated reports with summary info, newest first.
+
+    Keyset-paginated on (generated_at, id): pass the `X-Next-Cursor` response
+    header back as `cursor` to fetch the next page.
+    """
+    # Project only the summary columns — the JSON/array report bodies stay on disk.
+    query = (
+        select(
+            models.Report.id,
+            models.Report.interview_id,
+            models.Report.overall_score,
+            models.Report.role_eligibility,
+            models.Report.generated_at,
+            models.Interview.candidate_name,
+            models.Interview.role,
+        )
+        .join(models.Interview, models.Interview.id == models.Report.interview_id)
+        .where(models.Interview.user_id == current_user.id)
     )
-    result = []
-    for r, interview in rows:
-        result.append({
-            "id": str(r.id),
-            "interview_id": str(r.interview_id),
-            "candidate_name": interview.candidate_name if interview else "Unknown",
-            "role": interview.role if interview else "Unknown",
+    if role:
+        query = query.where(models.Interview.role == role)
+    if eligibility:
+        query = query.where(models.Report.role_eligibility == eligibility)
+    if min_score is not None:
+        query = query.where(models.Report.overall_score >= min_score)
+    if max_score is not None:
+        query = query.where(models.Report.overall_score <= max_score)
+
+    try:
+        query = keyset_page(query, models.Report.generated_at, models.Report.id, cursor, limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    rows, next_cursor = split_page((await db.execute(query)).all(), limit, key=lambda r: (r.generated_at, r.id))
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+
+    body = encode_json([
+        {
+            "id": r.id,
+            "interview_id": r.interview_id,
+            "candidate_name": r.candidate_name,
+            "role": r.role,
             "overall_score": r.overall_score,
             "role_eligibility": r.role_eligibility,
             "generated_at": r.generated_at,
-        })
-    return result
+        }
+        for r in rows
+    ])
+    return Response(content=body, media_type="application/json", headers=headers)
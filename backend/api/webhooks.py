@@ -1,57 +1,150 @@
 """
 Webhook endpoints:
+  POST /api/webhooks/transcript          — incremental turn batches from the agent
   POST /api/webhooks/interview-complete  — called by the LiveKit agent
   POST /api/webhooks/livekit             — called by LiveKit Cloud (safety net)
 """
 import logging
+import time
 import uuid
 from datetime import datetime
+from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from sqlalchemy import exists, select, update
 
-from backend.db.database import SessionLocal
+from backend.config import settings
+from backend.db.database import AsyncSessionLocal
 from backend.db import models
-from backend.tasks.evaluate import evaluate_interview
+from backend.db.schemas import AppendTranscriptRequest, CompleteInterviewRequest
+from backend.services.evaluation_queue import enqueue_evaluation, maybe_schedule_assessment
+from backend.services.transcript_store import append_turns, check_complete, parse_transcript, turn_stats
+from backend.tasks.finalize import complete_abandoned_interview
 
 router = APIRouter(prefix="/api/webhooks", tags=["webhooks"])
 logger = logging.getLogger(__name__)
 
 
-@router.post("/interview-complete")
-async def interview_complete(request: Request):
+async def _complete_interview(db, iid: uuid.UUID) -> Optional[str]:
     """
-    The LiveKit agent calls this endpoint when it detects [INTERVIEW_COMPLETE].
-    Saves the transcript and queues the Celery evaluation task.
+    Mark the interview completed with a single conditional UPDATE that only
+    matches a pending/active interview, so retries and races cannot reopen
+    or overwrite it. Returns the interview's status after the call, or None
+    if it does not exist.
     """
-    body = await request.json()
-    interview_id: str = body.get("interview_id")
-    transcript: str = body.get("transcript")
-
-    if not interview_id or not transcript:
-        raise HTTPException(status_code=400, detail="Missing interview_id or transcript.")
-
-    db = SessionLocal()
-    try:
-        interview = (
-            db.query(models.Interview)
-            .filter(models.Interview.id == uuid.UUID(interview_id))
-            .first()
+    updated = await db.scalar(
+        update(models.Interview)
+        .where(
+            models.Interview.id == iid,
+            models.Interview.status.in_(("pending", "active")),
+        )
+        .values(status="completed", ended_at=datetime.utcnow())
+        .returning(models.Interview.id)
+    )
+    await db.commit()
+    if updated is not None:
+        return "completed"
+    return await db.scalar(select(models.Interview.status).where(models.Interview.id == iid))
+
+
+async def _interview_state(db, iid: uuid.UUID):
+    """(status, report_id) for an interview, or None if it does not exist."""
+    return (
+        await db.execute(
+            select(models.Interview.status, models.Report.id.label("report_id"))
+            .outerjoin(models.Report, models.Report.interview_id == models.Interview.id)
+            .where(models.Interview.id == iid)
         )
-        if not interview:
+    ).first()
+
+
+@router.post("/transcript")
+async def append_transcript(payload: AppendTranscriptRequest):
+    """
+    The agent streams transcript turns here in small batches while the
+    interview runs. Turns carry a per-interview sequence number, so
+    re-delivered batches are idempotent. Responds with the highest seq
+    stored, which the agent treats as the ack. Enough new turns schedule
+    an incremental skill assessment.
+
+    Late batches (the interview was already completed, e.g. by the safety
+    net) are still stored until a report exists; only then does this
+    answer 409 and the agent stops sending.
+    """
+    if not payload.turns:
+        raise HTTPException(status_code=400, detail="No turns supplied.")
+
+    async with AsyncSessionLocal() as db:
+        state = await _interview_state(db, payload.interview_id)
+        if state is None:
             raise HTTPException(status_code=404, detail="Interview not found.")
+        if state.report_id is not None:
+            raise HTTPException(status_code=409, detail="Interview already has a report.")
+
+        await append_turns(db, payload.interview_id, [t.model_dump() for t in payload.turns])
+        await db.commit()
+        acked = max(t.seq for t in payload.turns)
+        if state.status in ("pending", "active"):
+            await maybe_schedule_assessment(db, payload.interview_id, acked)
+    return {"status": "ok", "acked_seq": acked}
+
 
-        interview.transcript = transcript
-        interview.status = "completed"
-        interview.ended_at = datetime.utcnow()
-        db.commit()
+@router.post("/interview-complete", status_code=202)
+async def interview_complete(payload: CompleteInterviewRequest):
+    """
+    The LiveKit agent calls this endpoint when it detects [INTERVIEW_COMPLETE]
+    or the candidate leaves. Body: {interview_id, final_seq, turns} — `turns`
+    carries only those the checkpoint stream could not deliver, stored
+    like any /transcript batch. Turns are accepted as long as no report
+    exists, so a late completion (the agent's outbox retrying after the
+    safety net closed the interview) still fills in the transcript before
+    evaluation runs.
+
+    Older agents send the whole `transcript` as text instead; it is parsed
+    into turns only if none were checkpointed, since re-parsed seqs need
+    not line up with stored ones.
+
+    Idempotent: see _complete_interview; the enqueue is deduplicated in Redis.
+    """
+    iid = payload.interview_id
+    interview_id = str(iid)
+    final_seq = payload.final_seq
+
+    async with AsyncSessionLocal() as db:
+        state = await _interview_state(db, iid)
+        if state is None:
+            raise HTTPException(status_code=404, detail="Interview not found.")
+        status = state.status
+        if state.report_id is None:
+            if payload.turns:
+                await append_turns(db, iid, [t.model_dump() for t in payload.turns])
+            elif payload.transcript and not (await turn_stats(db, iid))[0]:
+                turns = parse_transcript(payload.transcript)
+                if turns:
+                    await append_turns(db, iid, turns)
+                    final_seq = turns[-1]["seq"]
+        if status in ("pending", "active"):
+            if not await check_complete(db, iid, final_seq):
+                raise HTTPException(status_code=400, detail="Missing transcript and no checkpointed turns.")
+            status = await _complete_interview(db, iid)
+        else:
+            await db.commit()
 
-        # Queue async evaluation — non-blocking
-        evaluate_interview.delay(interview_id)
-        logger.info("Evaluation task queued for interview %s.", interview_id)
+    if status != "completed":
+        return JSONResponse(
+            status_code=202,
+            content={"status": "ok", "message": f"Interview already '{status}'."},
+        )
 
-        return {"status": "ok", "message": "Transcript saved. Evaluation queued."}
-    finally:
-        db.close()
+    # A retry of an already-completed interview still tries to enqueue, in
+    # case the first attempt committed but failed to publish — deduplicated.
+    queued = await enqueue_evaluation(interview_id)
+    return {
+        "status": "ok",
+        "message": "Transcript saved. Evaluation queued." if queued else "Evaluation already queued.",
+    }
 
 
 @router.post("/livekit")
@@ -59,7 +152,10 @@ async def livekit_webhook(request: Request):
     """
     LiveKit Cloud sends room lifecycle events here.
     Used as a safety net: if the agent crashes before calling /interview-complete,
-    this will re-queue evaluation when the room closes (provided transcript was saved).
+    the interview is completed from its checkpointed turns and evaluation
+    queued. room_finished usually arrives while the agent is still
+    finalizing, so completion is deferred by SAFETY_NET_GRACE_S
+    (tasks/finalize.py) and skipped if the agent got there first.
     """
     body = await request.json()
     event = body.get("event")
@@ -68,25 +164,36 @@ async def livekit_webhook(request: Request):
         room_name = body.get("room", {}).get("name", "")
         if room_name.startswith("interview-"):
             interview_id = room_name.removeprefix("interview-")
-            db = SessionLocal()
-            try:
-                interview = (
-                    db.query(models.Interview)
-                    .filter(models.Interview.id == uuid.UUID(interview_id))
-                    .first()
-                )
-                if interview and interview.transcript and interview.status == "completed":
-                    existing_report = (
-                        db.query(models.Report)
-                        .filter(models.Report.interview_id == uuid.UUID(interview_id))
-                        .first()
-                    )
-                    if not existing_report:
-                        evaluate_interview.delay(interview_id)
-                        logger.info(
-                            "Safety net: evaluation re-queued for interview %s.", interview_id
+            iid = uuid.UUID(interview_id)
+            has_turns = exists().where(models.TranscriptTurn.interview_id == models.Interview.id)
+            async with AsyncSessionLocal() as db:
+                row = (
+                    await db.execute(
+                        select(
+                            models.Interview.status,
+                            (has_turns | models.Interview.transcript.is_not(None)).label("has_transcript"),
+                            models.Report.id.label("report_id"),
                         )
-            finally:
-                db.close()
+                        .outerjoin(models.Report, models.Report.interview_id == models.Interview.id)
+                        .where(models.Interview.id == iid)
+                    )
+                ).first()
+                if not row:
+                    return {"status": "ok"}
+
+                if row.status in ("pending", "active"):
+                    await run_in_threadpool(
+                        complete_abandoned_interview.apply_async,
+                        args=[interview_id, time.time()],
+                        countdown=settings.SAFETY_NET_GRACE_S,
+                    )
+                    logger.info(
+                        "Safety net: interview %s still open at room_finished — completing in %.0fs "
+                        "unless the agent finalizes it.",
+                        interview_id, settings.SAFETY_NET_GRACE_S,
+                    )
+                elif row.status == "completed" and row.has_transcript and row.report_id is None:
+                    if await enqueue_evaluation(interview_id):
+                        logger.info("Safety net: evaluation re-queued for interview %s.", interview_id)
 
     return {"status": "ok"}
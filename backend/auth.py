@@ -1,27 +1,103 @@
-"""JWT helpers and FastAPI auth dependency."""
+"""JWT helpers, password hashing pool and FastAPI auth dependency."""
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 import bcrypt
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.cache import TTLCache, get_redis
 from backend.config import settings
 from backend.db import models
 from backend.db.database import get_db
 
+logger = logging.getLogger(__name__)
+
 bearer_scheme = HTTPBearer()
 
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)).decode()
 
 
 def verify_password(plain: str, hashed: str) -> bool:
     return bcrypt.checkpw(plain.encode(), hashed.encode())
 
 
+# ── Password hashing pool ─────────────────────────────────────────────────────
+# bcrypt releases the GIL, so a small dedicated thread pool keeps hashing off
+# the event loop without starving the default executor used by other work.
+
+_password_pool = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt"
+)
+_pool_lock = threading.Lock()
+_pool_stats = {"pending": 0, "running": 0, "completed": 0, "rejected": 0}
+
+
+def _tracked(fn, *args):
+    with _pool_lock:
+        _pool_stats["running"] += 1
+    try:
+        return fn(*args)
+    finally:
+        with _pool_lock:
+            _pool_stats["running"] -= 1
+            _pool_stats["completed"] += 1
+
+
+async def _run_in_password_pool(fn, *args):
+    with _pool_lock:
+        if _pool_stats["pending"] >= settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_QUEUE:
+            _pool_stats["rejected"] += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication is busy, please retry.",
+                headers={"Retry-After": "1"},
+            )
+        _pool_stats["pending"] += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_password_pool, _tracked, fn, *args)
+    finally:
+        with _pool_lock:
+            _pool_stats["pending"] -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_in_password_pool(hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await _run_in_password_pool(verify_password, plain, hashed)
+
+
+def password_pool_stats() -> dict:
+    with _pool_lock:
+        return {
+            "workers": settings.PASSWORD_HASH_WORKERS,
+            "max_queue": settings.PASSWORD_HASH_MAX_QUEUE,
+            "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+            "queue_depth": max(0, _pool_stats["pending"] - _pool_stats["running"]),
+            **_pool_stats,
+        }
+
+
+def shutdown_password_pool() -> None:
+    _password_pool.shutdown(wait=False, cancel_futures=True)
+
+
 def create_access_token(user_id: str) -> str:
     expire = datetime.now(timezone.utc) + timedelta(days=settings.ACCESS_TOKEN_EXPIRE_DAYS)
     return jwt.encode(
@@ -31,16 +107,40 @@ def create_access_token(user_id: str) -> str:
     )
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-    db: Session = Depends(get_db),
-) -> models.User:
-    token = credentials.credentials
+# ── Authenticated principal cache ─────────────────────────────────────────────
+# Verified token → user principal, so most authenticated requests skip the
+# users-table query. In-process TTL/LRU first, then (AUTH_CACHE_REDIS) a
+# Redis tier shared by all uvicorn workers. Logout is the only invalidation:
+# nothing updates a user row, so a cached principal can only go stale by
+# being revoked. Logged-out tokens are recorded in Redis until they expire;
+# another worker may still serve one from its in-process tier for at most
+# AUTH_CACHE_TTL_S.
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    id: uuid.UUID
+    email: str
+    full_name: str
+    created_at: datetime
+
+
+_user_cache = TTLCache(maxsize=settings.AUTH_CACHE_MAX_ENTRIES, ttl=settings.AUTH_CACHE_TTL_S)
+_redis_stats = {"hits": 0, "misses": 0, "errors": 0}
+
+_TOKEN_PREFIX = "auth:token:"
+_REVOKED_PREFIX = "auth:revoked:"
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _decode_token(token: str) -> dict:
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-        user_id: str = payload.get("sub")
-        if not user_id:
+        if not payload.get("sub"):
             raise ValueError
+        return payload
     except (jwt.InvalidTokenError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -48,7 +148,120 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.query(models.User).filter(models.User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found.")
+
+def _principal_to_json(user: AuthenticatedUser) -> str:
+    data = asdict(user)
+    data["id"] = str(user.id)
+    data["created_at"] = user.created_at.isoformat()
+    return json.dumps(data)
+
+
+def _principal_from_json(raw: str) -> AuthenticatedUser:
+    data = json.loads(raw)
+    return AuthenticatedUser(
+        id=uuid.UUID(data["id"]),
+        email=data["email"],
+        full_name=data["full_name"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+    )
+
+
+async def _is_revoked(key: str) -> bool:
+    try:
+        return bool(await get_redis().exists(_REVOKED_PREFIX + key))
+    except Exception as exc:
+        logger.warning("[AUTH] Revocation check failed: %s", exc)
+        return False
+
+
+async def _redis_principal(key: str) -> Optional[AuthenticatedUser]:
+    try:
+        raw = await get_redis().get(_TOKEN_PREFIX + key)
+    except Exception as exc:
+        _redis_stats["errors"] += 1
+        logger.warning("[AUTH] Redis lookup failed: %s", exc)
+        return None
+    if raw is None:
+        _redis_stats["misses"] += 1
+        return None
+    _redis_stats["hits"] += 1
+    return _principal_from_json(raw)
+
+
+async def _store_redis_principal(key: str, user: AuthenticatedUser, ttl: int) -> None:
+    try:
+        await get_redis().set(_TOKEN_PREFIX + key, _principal_to_json(user), ex=ttl)
+    except Exception as exc:
+        _redis_stats["errors"] += 1
+        logger.warning("[AUTH] Redis write failed: %s", exc)
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> AuthenticatedUser:
+    token = credentials.credentials
+    key = _token_key(token)
+
+    user = _user_cache.get(key)
+    if user is not None:
+        return user
+
+    payload = _decode_token(token)
+    if await _is_revoked(key):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Never cache a principal beyond the token's own expiry.
+    ttl = min(settings.AUTH_CACHE_TTL_S, payload.get("exp", 0) - time.time())
+
+    user = await _redis_principal(key) if settings.AUTH_CACHE_REDIS else None
+    if user is None:
+        row = (
+            await db.execute(
+                select(
+                    models.User.id,
+                    models.User.email,
+                    models.User.full_name,
+                    models.User.created_at,
+                ).where(models.User.id == uuid.UUID(payload["sub"]))
+            )
+        ).first()
+        if not row:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found.")
+        user = AuthenticatedUser(
+            id=row.id, email=row.email, full_name=row.full_name, created_at=row.created_at
+        )
+        if settings.AUTH_CACHE_REDIS and ttl >= 1:
+            await _store_redis_principal(key, user, int(ttl))
+
+    if ttl > 0:
+        _user_cache.set(key, user, ttl=ttl)
     return user
+
+
+async def revoke_token(token: str) -> None:
+    """Log out: drop the token from every cache tier and deny it until it expires."""
+    key = _token_key(token)
+    _user_cache.delete(key)
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+    except jwt.InvalidTokenError:
+        return
+    remaining = int(payload.get("exp", 0) - time.time())
+    if remaining <= 0:
+        return
+    try:
+        pipe = get_redis().pipeline()
+        pipe.set(_REVOKED_PREFIX + key, "1", ex=remaining)
+        pipe.delete(_TOKEN_PREFIX + key)
+        await pipe.execute()
+    except Exception as exc:
+        logger.warning("[AUTH] Failed to record revoked token: %s", exc)
+
+
+def auth_cache_stats() -> dict:
+    return {"memory": _user_cache.stats(), "redis": dict(_redis_stats)}
@@ -0,0 +1,111 @@
+"""
+Load test: concurrent POST /api/interviews against stub Gemini and LiveKit.
+
+The app runs in-process (httpx over ASGI) on the real database and Redis;
+Gemini skill extraction and the LiveKit API are the stubs from
+benchmarks/stubs.py. Every request has its own job description, so skill
+extraction is never served from cache.
+
+  async    — the handler as shipped: skills come from the async Gemini
+             client, bounded by SKILL_EXTRACTION_TIMEOUT_S.
+  blocking — the old handler, which called the synchronous extraction
+             inside the request and held the event loop for the whole
+             Gemini call.
+
+Throughput should grow with concurrency for `async` and stay flat at
+~1/latency for `blocking`. Seeded rows are deleted afterwards. Needs
+DATABASE_URL (migrated) and REDIS_URL:
+
+    python -m backend.benchmarks.create_interview_load [--concurrency 1 4 16 64] [--latency 0.5]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from backend.benchmarks.stubs import STUB_SKILLS, StubLiveKit, remove_user, seed_user, stub_gemini
+
+import httpx  # noqa: E402
+
+from backend.agents import evaluator_agent  # noqa: E402
+from backend.api import interviews  # noqa: E402
+from backend.cache import get_redis  # noqa: E402
+from backend.config import settings  # noqa: E402
+from backend.main import app  # noqa: E402
+from backend.services import livekit_service  # noqa: E402
+from backend.services.skills_service import _REDIS_PREFIX, resolve_skills, skills_cache_key  # noqa: E402
+
+
+async def _blocking_resolve_skills(job_description: str, role: str) -> list[str]:
+    return evaluator_agent.extract_skills_from_jd(job_description, role)
+
+
+async def _run_level(client: httpx.AsyncClient, token: str, concurrency: int, requests: int, jds: list) -> tuple:
+    pending = iter(range(requests))
+    latencies: list[float] = []
+    failures = 0
+
+    async def worker() -> None:
+        nonlocal failures
+        for i in pending:
+            jd = f"Build and operate APIs. Requisition {uuid.uuid4()}."
+            jds.append(jd)
+            t0 = time.perf_counter()
+            r = await client.post(
+                "/api/interviews/",
+                headers={"Authorization": f"Bearer {token}"},
+                json={
+                    "candidate_name": f"Candidate {i}",
+                    "candidate_email": f"candidate{i}@example.com",
+                    "role": "Backend Engineer",
+                    "job_description": jd,
+                },
+            )
+            latencies.append(time.perf_counter() - t0)
+            failures += r.status_code != 201
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - t0
+    latencies.sort()
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    return requests / elapsed, statistics.median(latencies), p95, failures
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--requests-per-worker", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.5, help="stub Gemini latency (s)")
+    parser.add_argument("--livekit-latency", type=float, default=0.05, help="stub LiveKit latency per call (s)")
+    parser.add_argument("--modes", nargs="+", default=["async", "blocking"], choices=["async", "blocking"])
+    args = parser.parse_args()
+
+    evaluator_agent.client = stub_gemini(args.latency, STUB_SKILLS)
+    user_id, _, token = seed_user()
+    jds: list[str] = []
+    try:
+        async with StubLiveKit(args.livekit_latency) as lk:
+            settings.LIVEKIT_URL = lk.url
+            await livekit_service.init_livekit()
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=600) as client:
+                print(f"stub Gemini {args.latency:.2f}s, stub LiveKit {args.livekit_latency * 1000:.0f}ms/call")
+                for mode in args.modes:
+                    interviews.resolve_skills = resolve_skills if mode == "async" else _blocking_resolve_skills
+                    for c in args.concurrency:
+                        n = c * args.requests_per_worker
+                        rps, p50, p95, failures = await _run_level(client, token, c, n, jds)
+                        print(f"{mode:>8} c={c:<3d} {n:4d} requests  {rps:7.2f} req/s  "
+                              f"p50 {p50 * 1000:7.0f}ms  p95 {p95 * 1000:7.0f}ms  failures {failures}")
+            await livekit_service.close_livekit()
+    finally:
+        interviews.resolve_skills = resolve_skills
+        remove_user(user_id)
+        if jds:
+            await get_redis().delete(*(_REDIS_PREFIX + skills_cache_key(jd, "Backend Engineer") for jd in jds))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
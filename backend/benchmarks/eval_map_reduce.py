@@ -0,0 +1,88 @@
+"""
+Latency benchmark: single-pass vs map-reduce evaluation, against a fake Gemini.
+
+The fake replaces evaluator_agent._generate_json with a sleep whose length
+grows with prompt size (FAKE_BASE_S + FAKE_PER_KCHAR_S per 1000 prompt
+characters), which is the shape that makes one huge request slow. No
+network, database or API key is used.
+
+    python -m backend.benchmarks.eval_map_reduce [--turns 400] [--turn-chars 600]
+"""
+import argparse
+import os
+import re
+import time
+
+for _var in ("GEMINI_API_KEY", "LIVEKIT_URL", "LIVEKIT_API_KEY", "LIVEKIT_API_SECRET"):
+    os.environ.setdefault(_var, "benchmark")
+
+from backend.agents import evaluator_agent  # noqa: E402
+from backend.config import settings  # noqa: E402
+
+FAKE_BASE_S = 0.8
+FAKE_PER_KCHAR_S = 0.05
+
+_SKILLS = ["Python", "System Design", "SQL", "Testing", "Communication", "Ownership"]
+
+_FAKE_REPORT = {
+    "overall_score": 7,
+    "role_eligibility": "Hire",
+    "recommendation": "Benchmark.",
+    "skill_scores": [{"skill": s, "score": 7, "evidence": "benchmark"} for s in _SKILLS],
+    "competency_scores": {},
+    "strengths": [],
+    "weaknesses": [],
+    "areas_for_improvement": [],
+}
+
+
+def _fake_generate_json(prompt: str, config=None):
+    time.sleep(FAKE_BASE_S + FAKE_PER_KCHAR_S * len(prompt) / 1000)
+    if "open_from_seq" in prompt:
+        seqs = [int(m) for m in re.findall(r"^\[(\d+)\]", prompt, re.MULTILINE)]
+        return {
+            "skill_scores": [{"skill": _SKILLS[seqs[0] % len(_SKILLS)], "score": 7, "evidence": "benchmark"}],
+            "observations": [f"turns {seqs[0]}-{seqs[-1]}"],
+            "open_from_seq": None,
+        }
+    return dict(_FAKE_REPORT)
+
+
+def _turns(count: int, chars: int) -> list[dict]:
+    return [
+        {"seq": i, "speaker": "Interviewer" if i % 2 == 0 else "Candidate", "text": "x" * chars}
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=400)
+    parser.add_argument("--turn-chars", type=int, default=600)
+    parser.add_argument("--chunk-chars", type=int, default=settings.EVAL_MAP_CHUNK_CHARS)
+    parser.add_argument("--concurrency", type=int, default=settings.EVAL_MAP_CONCURRENCY)
+    args = parser.parse_args()
+
+    evaluator_agent._generate_json = _fake_generate_json
+    turns = _turns(args.turns, args.turn_chars)
+    transcript = "\n\n".join(f"{t['speaker']}: {t['text']}" for t in turns)
+    common = {"role": "Backend Engineer", "job_description": "Build APIs.", "skills_to_cover": _SKILLS}
+
+    t0 = time.perf_counter()
+    evaluator_agent.generate_report(transcript=transcript, candidate_name="Bench", **common)
+    single_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    chunks = evaluator_agent.chunk_turns(turns, args.chunk_chars)
+    segments = evaluator_agent.assess_chunks(chunks, max_workers=args.concurrency, **common)
+    evaluator_agent.synthesize_report(segments=segments, candidate_name="Bench", **common)
+    map_reduce_s = time.perf_counter() - t0
+
+    print(f"transcript: {len(transcript):,} chars, {len(turns)} turns")
+    print(f"single pass: {single_s:6.2f}s")
+    print(f"map-reduce:  {map_reduce_s:6.2f}s  ({len(chunks)} chunks, concurrency {args.concurrency})")
+    print(f"speed-up:    {single_s / map_reduce_s:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
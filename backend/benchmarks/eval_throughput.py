@@ -0,0 +1,182 @@
+"""
+Throughput benchmark: evaluations per minute through the real Celery task
+path, against a stub Gemini client that only sleeps.
+
+For each run a Celery worker is started with the given pool and
+concurrency, consuming a private queue. The stub is installed in the
+worker before it starts, so everything else is real:
+  - evaluate_interview reads the turns from Postgres and writes the report;
+  - the report is cached and announced over Redis;
+  - every Gemini call takes a slot from the Redis in-flight limiter
+    (LLM_MAX_IN_FLIGHT) and a token from the rate buckets.
+Seeded interviews are deleted afterwards. Needs DATABASE_URL (migrated)
+and REDIS_URL:
+
+    python -m backend.benchmarks.eval_throughput --runs prefork:2 threads:16 threads:32
+    python -m backend.benchmarks.eval_throughput --runs threads:32 --max-in-flight 8
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import time
+import uuid
+from types import SimpleNamespace
+
+for _var in ("GEMINI_API_KEY", "LIVEKIT_URL", "LIVEKIT_API_KEY", "LIVEKIT_API_SECRET"):
+    os.environ.setdefault(_var, "benchmark")
+
+_QUEUE = "benchmark-eval"
+
+_REPORT = json.dumps({
+    "overall_score": 7,
+    "role_eligibility": "Hire",
+    "recommendation": "Benchmark.",
+    "skill_scores": [{"skill": "Python", "score": 7, "evidence": "benchmark"}],
+    "competency_scores": {},
+    "strengths": [],
+    "weaknesses": [],
+    "areas_for_improvement": [],
+})
+
+
+class _StubModels:
+    def __init__(self, latency_s: float) -> None:
+        self.latency_s = latency_s
+
+    def generate_content(self, **kwargs):
+        time.sleep(self.latency_s)
+        return SimpleNamespace(text=_REPORT, usage_metadata=None)
+
+
+def _run_worker(pool: str, concurrency: int, latency_s: float, max_in_flight: int) -> None:
+    """Worker process: stub Gemini, then hand over to Celery."""
+    os.environ["LLM_MAX_IN_FLIGHT"] = str(max_in_flight)
+    from backend.agents import evaluator_agent
+    from backend.celery_app import celery_app
+
+    evaluator_agent.client = SimpleNamespace(models=_StubModels(latency_s))
+    celery_app.worker_main([
+        "worker", f"--pool={pool}", f"--concurrency={concurrency}", "-Q", _QUEUE,
+        "-n", f"benchmark-{os.getpid()}@%h", "--loglevel=WARNING",
+        "--without-gossip", "--without-mingle", "--without-heartbeat",
+    ])
+
+
+def _seed(count: int, turns: int) -> tuple[uuid.UUID, list[str]]:
+    from backend.db import models
+    from backend.db.database import SessionLocal
+
+    user_id = uuid.uuid4()
+    ids = [uuid.uuid4() for _ in range(count)]
+    with SessionLocal() as db:
+        db.add(models.User(id=user_id, email=f"bench-{user_id}@example.com", hashed_password="-", full_name="Bench"))
+        db.flush()
+        db.add_all(
+            models.Interview(
+                id=iid, user_id=user_id, candidate_name="Bench", candidate_email="bench@example.com",
+                role="Backend Engineer", job_description="Build APIs.", skills_to_cover=["Python"],
+                status="completed",
+            )
+            for iid in ids
+        )
+        db.flush()
+        db.add_all(
+            models.TranscriptTurn(
+                interview_id=iid, seq=seq, speaker="Interviewer" if seq % 2 == 0 else "Candidate",
+                text=f"Turn {seq} of the benchmark interview.",
+            )
+            for iid in ids for seq in range(turns)
+        )
+        db.commit()
+    return user_id, [str(iid) for iid in ids]
+
+
+def _cleanup(user_id: uuid.UUID, ids: list[str]) -> None:
+    from backend.db import models
+    from backend.db.database import SessionLocal
+
+    uuids = [uuid.UUID(i) for i in ids]
+    with SessionLocal() as db:
+        db.query(models.Report).filter(models.Report.interview_id.in_(uuids)).delete(synchronize_session=False)
+        db.query(models.Interview).filter(models.Interview.user_id == user_id).delete(synchronize_session=False)
+        db.query(models.User).filter(models.User.id == user_id).delete(synchronize_session=False)
+        db.commit()
+
+
+def _reports_done(uuids: list[uuid.UUID]) -> int:
+    from sqlalchemy import func, select
+
+    from backend.db import models
+    from backend.db.database import SessionLocal
+
+    with SessionLocal() as db:
+        return db.scalar(select(func.count()).select_from(models.Report).where(models.Report.interview_id.in_(uuids)))
+
+
+def _wait_for_worker(timeout: float = 30.0) -> None:
+    from backend.celery_app import celery_app
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if celery_app.control.ping(timeout=0.5):
+            return
+    raise RuntimeError("Benchmark worker did not start.")
+
+
+def _measure(ids: list[str], timeout: float) -> tuple[float, int]:
+    """Enqueue every evaluation; return (seconds until all reports exist, peak in-flight Gemini calls)."""
+    from backend.cache import get_sync_redis
+    from backend.services.llm_limiter import slots_key
+    from backend.tasks.evaluate import evaluate_interview
+
+    redis = get_sync_redis()
+    uuids = [uuid.UUID(i) for i in ids]
+    peak = 0
+    t0 = time.perf_counter()
+    for iid in ids:
+        evaluate_interview.apply_async(args=[iid], queue=_QUEUE)
+    while _reports_done(uuids) < len(ids):
+        peak = max(peak, redis.zcount(slots_key(), time.time(), "+inf"))
+        if time.perf_counter() - t0 > timeout:
+            raise RuntimeError("Timed out waiting for reports.")
+        time.sleep(0.05)
+    return time.perf_counter() - t0, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=128)
+    parser.add_argument("--turns", type=int, default=12, help="transcript turns per seeded interview")
+    parser.add_argument("--latency", type=float, default=1.0, help="stub Gemini latency per call (s)")
+    parser.add_argument("--runs", nargs="+", default=["prefork:2", "threads:16", "threads:32"],
+                        help="pool:concurrency per run")
+    parser.add_argument("--max-in-flight", type=int, default=32, help="LLM_MAX_IN_FLIGHT for the worker")
+    parser.add_argument("--timeout", type=float, default=600.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    print(f"{args.jobs} evaluations per run, stub latency {args.latency:.2f}s, "
+          f"LLM_MAX_IN_FLIGHT={args.max_in_flight}")
+    ctx = multiprocessing.get_context("spawn")
+    for run in args.runs:
+        pool, concurrency = run.split(":")
+        user_id, ids = _seed(args.jobs, args.turns)
+        worker = ctx.Process(
+            target=_run_worker, args=(pool, int(concurrency), args.latency, args.max_in_flight), daemon=True
+        )
+        worker.start()
+        try:
+            _wait_for_worker()
+            elapsed, peak = _measure(ids, args.timeout)
+        finally:
+            worker.terminate()
+            worker.join(10)
+            _cleanup(user_id, ids)
+        print(f"{pool:>8}:{int(concurrency):<3d} {elapsed:7.2f}s  {args.jobs / elapsed * 60:7.1f} evals/min  "
+              f"peak in-flight {peak}")
+
+
+if __name__ == "__main__":
+    main()
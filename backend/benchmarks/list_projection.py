@@ -0,0 +1,180 @@
+"""
+Bytes-read and latency benchmark: full-row vs projected dashboard queries.
+
+Seeds one recruiter with --interviews interviews, each with a long job
+description, a legacy transcript blob and a report with full JSON/array
+bodies, then runs one page (--limit) of each list query both ways:
+
+  full      — what list_interviews / list_reports used to run: whole
+              Interview (and Report) entities, every Text/JSON column.
+  projected — the shipped queries: only the summary columns.
+
+For each it reports
+  row bytes — sum of pg_column_size over the result rows, i.e. the
+              (possibly compressed) data Postgres must assemble and send;
+  blocks    — heap + TOAST buffers touched per query, from
+              pg_statio_user_tables;
+  latency   — p50/p95 on the API's async engine, including ORM hydration.
+Seeded rows are deleted afterwards. Needs DATABASE_URL (migrated):
+
+    python -m backend.benchmarks.list_projection [--interviews 2000] [--limit 50]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from backend.benchmarks.stubs import remove_user, seed_user
+
+from sqlalchemy import func, insert, literal_column, select, text  # noqa: E402
+
+from backend.db import models  # noqa: E402
+from backend.db.database import AsyncSessionLocal, async_engine  # noqa: E402
+from backend.db.pagination import keyset_page  # noqa: E402
+
+_WORDS = (
+    "api latency schema index cache queue worker retry deploy kafka redis postgres design "
+    "tradeoff ownership incident review scale shard replica consistency throughput debug"
+).split()
+
+
+def _prose(rng: random.Random, chars: int) -> str:
+    words, size = [], 0
+    while size < chars:
+        w = rng.choice(_WORDS)
+        words.append(w)
+        size += len(w) + 1
+    return " ".join(words)
+
+
+def _seed(user_id: uuid.UUID, count: int) -> None:
+    from backend.db.database import SessionLocal
+
+    rng = random.Random(0)
+    now = datetime.utcnow()
+    interviews, reports = [], []
+    for i in range(count):
+        iid = uuid.uuid4()
+        interviews.append({
+            "id": iid, "user_id": user_id, "candidate_name": f"Candidate {i}",
+            "candidate_email": f"candidate{i}@example.com", "role": "Backend Engineer",
+            "job_description": _prose(rng, 3000), "skills_to_cover": _WORDS[:8], "status": "evaluated",
+            "livekit_room_name": f"interview-{iid}", "transcript": _prose(rng, 30000),
+            "created_at": now - timedelta(minutes=i),
+        })
+        reports.append({
+            "id": uuid.uuid4(), "interview_id": iid, "overall_score": rng.uniform(3, 9),
+            "role_eligibility": "Hire", "recommendation": _prose(rng, 1500),
+            "skill_scores": [{"skill": w, "score": 7, "evidence": _prose(rng, 400)} for w in _WORDS[:10]],
+            "competency_scores": {w: {"score": 7, "notes": _prose(rng, 300)} for w in _WORDS[:6]},
+            "strengths": [_prose(rng, 200) for _ in range(5)],
+            "weaknesses": [_prose(rng, 200) for _ in range(5)],
+            "areas_for_improvement": [{"area": w, "suggestion": _prose(rng, 300)} for w in _WORDS[:4]],
+            "red_flags": [], "green_flags": [_prose(rng, 150)],
+            "interview_quality_notes": _prose(rng, 500), "generated_at": now - timedelta(minutes=i),
+        })
+    with SessionLocal() as db:
+        for start in range(0, count, 500):
+            db.execute(insert(models.Interview), interviews[start:start + 500])
+            db.execute(insert(models.Report), reports[start:start + 500])
+        db.commit()
+    with SessionLocal() as db:
+        db.execute(text("ANALYZE interviews"))
+        db.execute(text("ANALYZE reports"))
+        db.commit()
+
+
+def _queries(user_id: uuid.UUID, limit: int) -> dict:
+    mine = models.Interview.user_id == user_id
+    page = lambda q, ts, id_: keyset_page(q, ts, id_, None, limit)  # noqa: E731
+    return {
+        ("list_interviews", "full"): page(
+            select(models.Interview).where(mine), models.Interview.created_at, models.Interview.id,
+        ),
+        ("list_interviews", "projected"): page(
+            select(
+                models.Interview.id, models.Interview.candidate_name, models.Interview.role,
+                models.Interview.status, models.Interview.created_at,
+            ).where(mine),
+            models.Interview.created_at, models.Interview.id,
+        ),
+        ("list_reports", "full"): page(
+            select(models.Report, models.Interview)
+            .join(models.Interview, models.Interview.id == models.Report.interview_id)
+            .where(mine),
+            models.Report.generated_at, models.Report.id,
+        ),
+        ("list_reports", "projected"): page(
+            select(
+                models.Report.id, models.Report.interview_id, models.Report.overall_score,
+                models.Report.role_eligibility, models.Report.generated_at,
+                models.Interview.candidate_name, models.Interview.role,
+            )
+            .join(models.Interview, models.Interview.id == models.Report.interview_id)
+            .where(mine),
+            models.Report.generated_at, models.Report.id,
+        ),
+    }
+
+
+async def _blocks() -> int:
+    """Heap + TOAST buffers touched so far on interviews and reports (hit or read)."""
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT pg_stat_clear_snapshot()"))
+        return (await conn.execute(text(
+            "SELECT sum(coalesce(heap_blks_hit, 0) + coalesce(heap_blks_read, 0)"
+            " + coalesce(toast_blks_hit, 0) + coalesce(toast_blks_read, 0))"
+            " FROM pg_statio_user_tables WHERE relname IN ('interviews', 'reports')"
+        ))).scalar()
+
+
+async def _measure(query, repeats: int) -> tuple[int, float, list[float]]:
+    async with AsyncSessionLocal() as db:
+        row_bytes = (await db.execute(
+            select(func.sum(func.pg_column_size(literal_column("q.*")))).select_from(query.subquery("q"))
+        )).scalar()
+        (await db.execute(query)).all()   # warm the cache and the statement
+        await db.commit()
+
+    before = await _blocks()
+    latencies = []
+    async with AsyncSessionLocal() as db:
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            (await db.execute(query)).all()
+            latencies.append(time.perf_counter() - t0)
+            db.expunge_all()
+        await db.commit()
+        await db.execute(text("SELECT pg_stat_force_next_flush()"))
+        await db.commit()
+    await asyncio.sleep(0.2)
+    blocks = (await _blocks() - before) / repeats
+    return row_bytes, blocks, sorted(latencies)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interviews", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    user_id, _, _ = seed_user()
+    try:
+        _seed(user_id, args.interviews)
+        print(f"{args.interviews} interviews with reports, page of {args.limit}, {args.repeats} repeats")
+        for (endpoint, variant), query in _queries(user_id, args.limit).items():
+            row_bytes, blocks, latencies = await _measure(query, args.repeats)
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            print(f"{endpoint:>15} {variant:>9}  row bytes {row_bytes:>9,}  blocks {blocks:7.1f}  "
+                  f"p50 {statistics.median(latencies) * 1000:6.2f}ms  p95 {p95 * 1000:6.2f}ms")
+    finally:
+        await async_engine.dispose()
+        remove_user(user_id)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+"""
+Throughput benchmark: POST /api/auth/login at several concurrency levels.
+
+The app runs in-process (httpx over ASGI) on the real database; the seeded
+recruiter's password is hashed with --rounds. Two ways of running bcrypt:
+
+  pool       — as shipped: a dedicated pool of PASSWORD_HASH_WORKERS threads
+               with at most PASSWORD_HASH_MAX_QUEUE logins waiting; beyond
+               that, login answers 503 with Retry-After at once.
+  threadpool — the old sync handler: bcrypt on Starlette's shared threadpool
+               (40 threads), with no bound on how many logins queue for it.
+
+Alongside the logins, a probe calls GET /health (a sync endpoint, so it
+also needs the shared threadpool) every 50ms; its p95 shows what a login
+burst does to the rest of the API. Seeded rows are deleted afterwards.
+Needs DATABASE_URL (migrated):
+
+    python -m backend.benchmarks.login_throughput [--concurrency 1 8 32 128] [--rounds 10]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from backend.benchmarks.stubs import remove_user, seed_user
+
+import bcrypt  # noqa: E402
+import httpx  # noqa: E402
+from fastapi.concurrency import run_in_threadpool  # noqa: E402
+
+from backend import auth  # noqa: E402
+from backend.api import auth as auth_api  # noqa: E402
+from backend.config import settings  # noqa: E402
+from backend.db.database import async_engine  # noqa: E402
+from backend.main import app  # noqa: E402
+
+_PASSWORD = "benchmark-password"
+
+
+async def _threadpool_verify(plain: str, hashed: str) -> bool:
+    return await run_in_threadpool(auth.verify_password, plain, hashed)
+
+
+def _p(values: list[float], q: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * q))] if values else float("nan")
+
+
+async def _run_level(client: httpx.AsyncClient, email: str, concurrency: int, requests: int) -> dict:
+    pending = iter(range(requests))
+    ok: list[float] = []
+    statuses: dict[int, int] = {}
+    probes: list[float] = []
+    done = asyncio.Event()
+
+    async def worker() -> None:
+        for _ in pending:
+            t0 = time.perf_counter()
+            r = await client.post("/api/auth/login", json={"email": email, "password": _PASSWORD})
+            statuses[r.status_code] = statuses.get(r.status_code, 0) + 1
+            if r.status_code == 200:
+                ok.append(time.perf_counter() - t0)
+
+    async def probe() -> None:
+        while not done.is_set():
+            t0 = time.perf_counter()
+            await client.get("/health")
+            probes.append(time.perf_counter() - t0)
+            await asyncio.sleep(0.05)
+
+    prober = asyncio.create_task(probe())
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - t0
+    done.set()
+    await prober
+    ok.sort()
+    probes.sort()
+    return {
+        "logins_s": len(ok) / elapsed,
+        "p50": statistics.median(ok) if ok else float("nan"),
+        "p95": _p(ok, 0.95),
+        "rejected": statuses.get(503, 0),
+        "other": sum(n for code, n in statuses.items() if code not in (200, 503)),
+        "probe_p95": _p(probes, 0.95),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--requests-per-worker", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=10, help="bcrypt work factor of the seeded hash")
+    parser.add_argument("--modes", nargs="+", default=["pool", "threadpool"], choices=["pool", "threadpool"])
+    args = parser.parse_args()
+
+    hashed = bcrypt.hashpw(_PASSWORD.encode(), bcrypt.gensalt(rounds=args.rounds)).decode()
+    user_id, email, _ = seed_user(hashed_password=hashed)
+    print(f"bcrypt rounds {args.rounds}, PASSWORD_HASH_WORKERS={settings.PASSWORD_HASH_WORKERS}, "
+          f"PASSWORD_HASH_MAX_QUEUE={settings.PASSWORD_HASH_MAX_QUEUE}")
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=600) as client:
+            for mode in args.modes:
+                auth_api.verify_password_async = auth.verify_password_async if mode == "pool" else _threadpool_verify
+                for c in args.concurrency:
+                    n = c * args.requests_per_worker
+                    r = await _run_level(client, email, c, n)
+                    print(f"{mode:>10} c={c:<3d} {n:4d} logins  {r['logins_s']:6.1f} ok/s  "
+                          f"p50 {r['p50'] * 1000:7.0f}ms  p95 {r['p95'] * 1000:7.0f}ms  "
+                          f"503 {r['rejected']:4d}  other {r['other']}  /health p95 {r['probe_p95'] * 1000:6.0f}ms")
+    finally:
+        auth_api.verify_password_async = auth.verify_password_async
+        await async_engine.dispose()
+        remove_user(user_id)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
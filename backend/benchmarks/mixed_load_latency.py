@@ -0,0 +1,205 @@
+"""
+Latency-percentile benchmark under mixed load: sync vs async SQLAlchemy
+engine in `async def` handlers.
+
+A small FastAPI app serves the same four request types twice, once per
+engine, and is driven in-process (httpx over ASGI) by --concurrency
+clients picking request types at random:
+
+  list     (40%) — one projected dashboard page of the seeded interviews
+  lookup   (30%) — one interview by id (load_only, like the token endpoint)
+  write    (10%) — update one interview's started_at and commit
+  external (20%) — no database; awaits --external-latency, standing in for
+                   a LiveKit or Gemini call
+
+  sync  — the old handlers: psycopg2 sessions called straight from
+          `async def`, so every query blocks the event loop.
+  async — the shipped handlers: asyncpg sessions, awaited.
+
+Every DB request also makes one `SELECT pg_sleep(--db-rtt)` round trip,
+standing in for the network latency to a managed Postgres (0 disables it).
+Prints throughput and p50/p95/p99 per request type and overall. Seeded
+rows are deleted afterwards. Needs DATABASE_URL (migrated):
+
+    python -m backend.benchmarks.mixed_load_latency [--concurrency 8 64] [--requests 2000]
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from backend.benchmarks.stubs import remove_user, seed_user
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from sqlalchemy import insert, select, text, update  # noqa: E402
+from sqlalchemy.orm import load_only  # noqa: E402
+
+from backend.db import models  # noqa: E402
+from backend.db.database import AsyncSessionLocal, SessionLocal, async_engine, engine  # noqa: E402
+from backend.db.pagination import keyset_page  # noqa: E402
+
+_MIX = [("list", 0.4), ("lookup", 0.3), ("write", 0.1), ("external", 0.2)]
+
+
+def _seed(user_id: uuid.UUID, count: int) -> list[uuid.UUID]:
+    now = datetime.utcnow()
+    ids = [uuid.uuid4() for _ in range(count)]
+    with SessionLocal() as db:
+        db.execute(insert(models.Interview), [
+            {
+                "id": iid, "user_id": user_id, "candidate_name": f"Candidate {i}",
+                "candidate_email": f"candidate{i}@example.com", "role": "Backend Engineer",
+                "job_description": "Build and operate APIs. " * 100, "skills_to_cover": ["Python"],
+                "status": "pending", "livekit_room_name": f"interview-{iid}",
+                "created_at": now - timedelta(minutes=i),
+            }
+            for i, iid in enumerate(ids)
+        ])
+        db.commit()
+    return ids
+
+
+def _build_app(user_id: uuid.UUID, db_rtt: float, external_latency: float) -> FastAPI:
+    app = FastAPI()
+    page = keyset_page(
+        select(
+            models.Interview.id, models.Interview.candidate_name, models.Interview.role,
+            models.Interview.status, models.Interview.created_at,
+        ).where(models.Interview.user_id == user_id),
+        models.Interview.created_at, models.Interview.id, None, 50,
+    )
+
+    def lookup(iid: str):
+        return (
+            select(models.Interview)
+            .options(load_only(models.Interview.status, models.Interview.livekit_room_name))
+            .where(models.Interview.id == uuid.UUID(iid))
+        )
+
+    def touch(iid: str):
+        return update(models.Interview).where(models.Interview.id == uuid.UUID(iid)).values(
+            started_at=datetime.utcnow()
+        )
+
+    rtt = text("SELECT pg_sleep(:s)").bindparams(s=db_rtt)
+
+    # ── sync engine, called from async def (old) ─────────────────────────────
+    @app.get("/sync/list")
+    async def sync_list():
+        with SessionLocal() as db:
+            if db_rtt:
+                db.execute(rtt)
+            return len(db.execute(page).all())
+
+    @app.get("/sync/lookup/{iid}")
+    async def sync_lookup(iid: str):
+        with SessionLocal() as db:
+            if db_rtt:
+                db.execute(rtt)
+            return db.scalars(lookup(iid)).first().status
+
+    @app.post("/sync/write/{iid}")
+    async def sync_write(iid: str):
+        with SessionLocal() as db:
+            if db_rtt:
+                db.execute(rtt)
+            db.execute(touch(iid))
+            db.commit()
+
+    # ── async engine (shipped) ───────────────────────────────────────────────
+    @app.get("/async/list")
+    async def async_list():
+        async with AsyncSessionLocal() as db:
+            if db_rtt:
+                await db.execute(rtt)
+            return len((await db.execute(page)).all())
+
+    @app.get("/async/lookup/{iid}")
+    async def async_lookup(iid: str):
+        async with AsyncSessionLocal() as db:
+            if db_rtt:
+                await db.execute(rtt)
+            return (await db.scalars(lookup(iid))).first().status
+
+    @app.post("/async/write/{iid}")
+    async def async_write(iid: str):
+        async with AsyncSessionLocal() as db:
+            if db_rtt:
+                await db.execute(rtt)
+            await db.execute(touch(iid))
+            await db.commit()
+
+    @app.get("/external")
+    async def external():
+        await asyncio.sleep(external_latency)
+
+    return app
+
+
+async def _run(client: httpx.AsyncClient, engine_name: str, ids: list, concurrency: int, requests: int) -> dict:
+    rng = random.Random(0)
+    kinds = rng.choices([k for k, _ in _MIX], weights=[w for _, w in _MIX], k=requests)
+    pending = iter(kinds)
+    latencies: dict[str, list[float]] = {k: [] for k, _ in _MIX}
+
+    async def worker() -> None:
+        for kind in pending:
+            iid = rng.choice(ids)
+            t0 = time.perf_counter()
+            if kind == "external":
+                r = await client.get("/external")
+            elif kind == "write":
+                r = await client.post(f"/{engine_name}/write/{iid}")
+            elif kind == "lookup":
+                r = await client.get(f"/{engine_name}/lookup/{iid}")
+            else:
+                r = await client.get(f"/{engine_name}/list")
+            r.raise_for_status()
+            latencies[kind].append(time.perf_counter() - t0)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    latencies["all"] = [v for values in latencies.values() for v in values]
+    return {kind: sorted(values) for kind, values in latencies.items()}
+
+
+def _p(values: list[float], q: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * q))] * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 64])
+    parser.add_argument("--requests", type=int, default=2000, help="requests per engine and level")
+    parser.add_argument("--interviews", type=int, default=500)
+    parser.add_argument("--db-rtt", type=float, default=0.002, help="extra DB round trip per request (s)")
+    parser.add_argument("--external-latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    user_id, _, _ = seed_user()
+    try:
+        ids = [str(i) for i in _seed(user_id, args.interviews)]
+        app = _build_app(user_id, args.db_rtt, args.external_latency)
+        print(f"{args.requests} requests per run, DB round trip {args.db_rtt * 1000:.0f}ms, "
+              f"external {args.external_latency * 1000:.0f}ms; p50 / p95 / p99 in ms")
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            for c in args.concurrency:
+                for engine_name in ("sync", "async"):
+                    t0 = time.perf_counter()
+                    latencies = await _run(client, engine_name, ids, c, args.requests)
+                    rps = args.requests / (time.perf_counter() - t0)
+                    cols = "  ".join(
+                        f"{kind} {_p(v, 0.5):5.1f}/{_p(v, 0.95):6.1f}/{_p(v, 0.99):6.1f}"
+                        for kind, v in latencies.items()
+                    )
+                    print(f"c={c:<3d} {engine_name:>5}  {rps:6.0f} req/s  {cols}")
+    finally:
+        await async_engine.dispose()
+        remove_user(user_id)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+"""
+Latency benchmark: LiveKit room creation + agent dispatch with a
+per-request client (before) vs the shared pooled client (after).
+
+  per-request — what create_interview_room used to do: build a LiveKitAPI
+                (and its aiohttp session) for every interview and close it
+                afterwards, so each interview opens a new TLS connection.
+  pooled      — livekit_service.create_interview_room on the app-scoped
+                client, whose keep-alive connections are reused.
+
+Runs against the stub LiveKit API from benchmarks/stubs.py served over TLS.
+--connect-delay adds to the first call on each connection the round trips
+that TCP and TLS setup cost over a real network; the loopback handshake
+itself is also paid. No database, Redis or API key is used.
+
+    python -m backend.benchmarks.room_creation_latency [--rooms 200] [--concurrency 1 16 64]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+
+from backend.benchmarks.stubs import StubLiveKit
+
+from livekit import api  # noqa: E402
+
+from backend.config import settings  # noqa: E402
+from backend.services import livekit_service  # noqa: E402
+
+
+async def _per_request(room_name: str, interview_id: str) -> None:
+    lk = api.LiveKitAPI(
+        url=settings.LIVEKIT_URL,
+        api_key=settings.LIVEKIT_API_KEY,
+        api_secret=settings.LIVEKIT_API_SECRET,
+    )
+    metadata = json.dumps({"interview_id": interview_id, "role": "Backend Engineer"})
+    await lk.room.create_room(
+        api.CreateRoomRequest(name=room_name, metadata=metadata, empty_timeout=300, max_participants=3)
+    )
+    await lk.agent_dispatch.create_dispatch(
+        api.CreateAgentDispatchRequest(room=room_name, agent_name="interviewer")
+    )
+    await lk.aclose()
+
+
+async def _pooled(room_name: str, interview_id: str) -> None:
+    await livekit_service.create_interview_room(
+        room_name, interview_id, role="Backend Engineer", job_description="",
+        skills_to_cover=[], candidate_name="Benchmark",
+    )
+
+
+async def _run(create, rooms: int, concurrency: int) -> tuple[float, list[float]]:
+    pending = iter(range(rooms))
+    latencies: list[float] = []
+
+    async def worker() -> None:
+        for _ in pending:
+            interview_id = str(uuid.uuid4())
+            t0 = time.perf_counter()
+            await create(f"interview-{interview_id}", interview_id)
+            latencies.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - t0, sorted(latencies)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rooms", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--latency", type=float, default=0.02, help="stub LiveKit latency per call (s)")
+    parser.add_argument("--connect-delay", type=float, default=0.04, help="extra delay on a new connection (s)")
+    args = parser.parse_args()
+
+    print(f"{args.rooms} rooms per run over TLS, stub latency {args.latency * 1000:.0f}ms/call, "
+          f"connect delay {args.connect_delay * 1000:.0f}ms")
+    for concurrency in args.concurrency:
+        for mode, create in (("per-request", _per_request), ("pooled", _pooled)):
+            async with StubLiveKit(args.latency, tls=True, connect_delay_s=args.connect_delay) as lk:
+                settings.LIVEKIT_URL = lk.url
+                if mode == "pooled":
+                    await livekit_service.init_livekit()
+                elapsed, latencies = await _run(create, args.rooms, concurrency)
+                if mode == "pooled":
+                    await livekit_service.close_livekit()
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            print(f"c={concurrency:<3d} {mode:>11}  p50 {statistics.median(latencies) * 1000:6.1f}ms  "
+                  f"p95 {p95 * 1000:6.1f}ms  {args.rooms / elapsed:7.1f} rooms/s  "
+                  f"{lk.connections} connections")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,149 @@
+"""
+Local stand-ins for the external services, shared by the API benchmarks.
+
+  StubLiveKit   — the LiveKit server API (Twirp) on 127.0.0.1. Every call
+                  waits `latency_s` and returns an empty message, which the
+                  SDK decodes as a default response. With tls=True it is
+                  served over HTTPS with a throwaway self-signed certificate,
+                  so a new connection costs a TLS handshake as it does against
+                  LiveKit Cloud. connect_delay_s is added to the first
+                  call on each connection, standing in for the extra round
+                  trips of TCP and TLS setup over a real network.
+  stub_gemini() — a genai client whose generate_content only sleeps.
+  seed_user()   — a recruiter row and a bearer token for it; remove_user()
+                  deletes it with everything it owns.
+
+Import this module before anything from backend: it fills in the settings
+the backend requires at import time.
+"""
+import asyncio
+import json
+import os
+import ssl
+import subprocess
+import tempfile
+import time
+import uuid
+from types import SimpleNamespace
+
+for _var in ("GEMINI_API_KEY", "LIVEKIT_URL", "LIVEKIT_API_KEY", "LIVEKIT_API_SECRET"):
+    os.environ.setdefault(_var, "benchmark")
+
+from aiohttp import connector as aiohttp_connector, web  # noqa: E402
+
+
+class StubLiveKit:
+    """Async context manager running a fake LiveKit API; `url` is set once entered."""
+
+    def __init__(self, latency_s: float = 0.05, tls: bool = False, connect_delay_s: float = 0.0) -> None:
+        self.latency_s = latency_s
+        self.tls = tls
+        self.connect_delay_s = connect_delay_s
+        self.url = ""
+        self.calls: dict[str, int] = {}
+        self._peers: set = set()
+        self._runner = None
+        self._tmp = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        self.calls[method] = self.calls.get(method, 0) + 1
+        peer = request.transport.get_extra_info("peername")
+        delay = self.latency_s if peer in self._peers else self.latency_s + self.connect_delay_s
+        self._peers.add(peer)
+        await request.read()
+        await asyncio.sleep(delay)
+        return web.Response(body=b"", content_type="application/protobuf")
+
+    def _ssl_context(self) -> ssl.SSLContext:
+        self._tmp = tempfile.TemporaryDirectory()
+        cert, key = os.path.join(self._tmp.name, "cert.pem"), os.path.join(self._tmp.name, "key.pem")
+        subprocess.run(
+            ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+             "-keyout", key, "-out", cert, "-subj", "/CN=localhost",
+             "-addext", "subjectAltName=IP:127.0.0.1,DNS:localhost"],
+            check=True, capture_output=True,
+        )
+        # Trust it in aiohttp's default client context, which the LiveKit
+        # sessions use; that context is built once at import.
+        aiohttp_connector._SSL_CONTEXT_VERIFIED.load_verify_locations(cert)
+        ctx = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ctx.load_cert_chain(cert, key)
+        return ctx
+
+    async def __aenter__(self) -> "StubLiveKit":
+        app = web.Application()
+        app.router.add_post("/twirp/{service}/{method}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0, ssl_context=self._ssl_context() if self.tls else None)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"{'https' if self.tls else 'http'}://127.0.0.1:{port}"
+        return self
+
+    @property
+    def connections(self) -> int:
+        """Client connections that have made at least one call."""
+        return len(self._peers)
+
+    async def __aexit__(self, *exc) -> None:
+        await self._runner.cleanup()
+        if self._tmp is not None:
+            self._tmp.cleanup()
+
+
+class _StubModels:
+    def __init__(self, latency_s: float, text: str) -> None:
+        self.latency_s = latency_s
+        self.text = text
+
+    def generate_content(self, **kwargs):
+        time.sleep(self.latency_s)
+        return SimpleNamespace(text=self.text, usage_metadata=None)
+
+
+class _StubAsyncModels(_StubModels):
+    async def generate_content(self, **kwargs):
+        await asyncio.sleep(self.latency_s)
+        return SimpleNamespace(text=self.text, usage_metadata=None)
+
+
+def stub_gemini(latency_s: float, text: str) -> SimpleNamespace:
+    """A stand-in for evaluator_agent.client answering every call with `text`."""
+    return SimpleNamespace(
+        models=_StubModels(latency_s, text),
+        aio=SimpleNamespace(models=_StubAsyncModels(latency_s, text)),
+    )
+
+
+STUB_SKILLS = json.dumps(["Python", "SQL", "System Design", "Testing", "Communication", "Ownership"])
+
+
+def seed_user(hashed_password: str = "-") -> tuple[uuid.UUID, str, str]:
+    """Insert a recruiter; returns (user id, email, bearer token)."""
+    from backend.auth import create_access_token
+    from backend.db import models
+    from backend.db.database import SessionLocal
+
+    user_id = uuid.uuid4()
+    email = f"bench-{user_id}@example.com"
+    with SessionLocal() as db:
+        db.add(models.User(id=user_id, email=email, hashed_password=hashed_password, full_name="Benchmark"))
+        db.commit()
+    return user_id, email, create_access_token(str(user_id))
+
+
+def remove_user(user_id: uuid.UUID) -> None:
+    """Delete a seeded recruiter with its interviews and their reports."""
+    from sqlalchemy import delete, select
+
+    from backend.db import models
+    from backend.db.database import SessionLocal
+
+    interviews = select(models.Interview.id).where(models.Interview.user_id == user_id)
+    with SessionLocal() as db:
+        db.execute(delete(models.Report).where(models.Report.interview_id.in_(interviews)))
+        db.execute(delete(models.Interview).where(models.Interview.user_id == user_id))
+        db.execute(delete(models.User).where(models.User.id == user_id))
+        db.commit()
@@ -0,0 +1,104 @@
+"""
+Caching primitives shared by the API and workers.
+
+  TTLCache         — thread-safe in-process LRU with per-entry TTL and hit/miss counters
+  get_redis()      — lazy asyncio Redis client (request path)
+  get_sync_redis() — lazy blocking Redis client (Celery tasks)
+
+Usage:
+    from backend.cache import TTLCache, get_redis
+    cache = TTLCache(maxsize=1024, ttl=3600)
+    value = cache.get(key)
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire `ttl` seconds after being set."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_s": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+_redis = None
+
+
+def get_redis():
+    """Return the shared asyncio Redis client for REDIS_URL (created on first use)."""
+    global _redis
+    if _redis is None:
+        import redis.asyncio as aioredis
+
+        from backend.config import settings
+        _redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis
+
+
+_sync_redis = None
+
+
+def get_sync_redis():
+    """Return the shared blocking Redis client for REDIS_URL (created on first use)."""
+    global _sync_redis
+    if _sync_redis is None:
+        import redis
+
+        from backend.config import settings
+        _sync_redis = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _sync_redis
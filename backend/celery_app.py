@@ -1,12 +1,14 @@
 from celery import Celery
+from celery.signals import worker_process_shutdown, worker_shutdown
 
 from backend.config import settings
+from backend.observability import get_telemetry
 
 celery_app = Celery(
     "ai_intrvwr",
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
-    include=["backend.tasks.evaluate"],
+    include=["backend.tasks.evaluate", "backend.tasks.assess", "backend.tasks.finalize"],
 )
 
 celery_app.conf.update(
@@ -16,6 +18,21 @@ celery_app.conf.update(
     timezone="UTC",
     enable_utc=True,
     task_acks_late=True,                      # only ack after task completes (safer retries)
-    worker_prefetch_multiplier=1,             # one task at a time per worker (LLM tasks are heavy)
+    # Evaluations are almost entirely waiting on Gemini, so one process runs
+    # many of them on threads; the global Gemini cap is services/llm_limiter.
+    worker_pool=settings.EVAL_WORKER_POOL,
+    # prefork: no task hoarding — idle children pick up work. The threads pool
+    # runs Celery's blocking consumer loop, which stops fetching while every
+    # thread is busy and only resumes after a ~2s poll timeout; a small
+    # reserve per thread keeps them fed in between.
+    worker_prefetch_multiplier=1 if settings.EVAL_WORKER_POOL == "prefork" else 4,
+    worker_concurrency=settings.EVAL_WORKER_CONCURRENCY,
     broker_connection_retry_on_startup=True,  # suppress CPendingDeprecationWarning
 )
+
+
+@worker_shutdown.connect           # threads/solo pools: tasks ran in the main process
+@worker_process_shutdown.connect   # prefork: each child has its own buffer
+def _flush_telemetry(**kwargs) -> None:
+    """Send buffered Langfuse calls before a worker process exits."""
+    get_telemetry().flush()
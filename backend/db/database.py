@@ -1,8 +1,11 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from backend.config import settings
 
+# ── Sync engine — Celery tasks and Alembic only ──────────────────────────────
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,   # reconnect if connection dropped
@@ -13,14 +16,26 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+# ── Async engine — FastAPI request path ───────────────────────────────────────
+# Same database as DATABASE_URL, driven by asyncpg unless overridden.
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL
+    or make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    pool_pre_ping=True,
+    pool_size=10,
+    max_overflow=20,
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+
 class Base(DeclarativeBase):
     pass
 
 
-def get_db():
-    """FastAPI dependency — yields a DB session per request."""
-    db = SessionLocal()
-    try:
+async def get_db():
+    """FastAPI dependency — yields an async DB session per request."""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
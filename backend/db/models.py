@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, String, Float, JSON, DateTime, Text, ARRAY, ForeignKey
+from sqlalchemy import Column, String, Float, Integer, JSON, DateTime, Text, ARRAY, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 
 from backend.db.database import Base
@@ -27,13 +27,47 @@ class Interview(Base):
     role = Column(String(200), nullable=False)
     job_description = Column(Text, nullable=False)
     skills_to_cover = Column(JSON, nullable=True)        # list[str] stored as JSON
-    status = Column(String(50), default="pending")       # pending | active | completed | evaluated
+    status = Column(String(50), default="pending")       # pending | active | completed | evaluated | evaluation_failed
     livekit_room_name = Column(String(200), nullable=True)
-    transcript = Column(Text, nullable=True)
+    transcript = Column(Text, nullable=True)             # legacy blob — superseded by transcript_turns
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     started_at = Column(DateTime, nullable=True)
     ended_at = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        # keyset pagination of the dashboard list (see db/pagination.py)
+        Index("ix_interviews_user_created_id", "user_id", "created_at", "id"),
+        Index("ix_interviews_user_status_created_id", "user_id", "status", "created_at", "id"),
+    )
+
+
+class TranscriptTurn(Base):
+    __tablename__ = "transcript_turns"
+
+    interview_id = Column(
+        UUID(as_uuid=True), ForeignKey("interviews.id", ondelete="CASCADE"), primary_key=True
+    )
+    seq = Column(Integer, primary_key=True)                 # 0-based turn index within the interview
+    speaker = Column(String(50), nullable=False)            # Candidate | Interviewer
+    text = Column(Text, nullable=False)
+    spoken_at = Column(DateTime, nullable=True)             # when the agent committed the turn (UTC)
+    latency_s = Column(Float, nullable=True)                # agent response latency (Interviewer turns)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class SegmentAssessment(Base):
+    """Partial evaluation of turns start_seq..end_seq, written while the interview runs."""
+    __tablename__ = "segment_assessments"
+
+    interview_id = Column(
+        UUID(as_uuid=True), ForeignKey("interviews.id", ondelete="CASCADE"), primary_key=True
+    )
+    start_seq = Column(Integer, primary_key=True)
+    end_seq = Column(Integer, nullable=False)               # last turn fully assessed
+    skill_scores = Column(JSON, nullable=False)             # list[{skill, score, evidence}] — concluded topics only
+    observations = Column(JSON, nullable=False)             # list[str] — competency signals, red/green flags
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
 
 class Report(Base):
     __tablename__ = "reports"
@@ -52,3 +86,7 @@ class Report(Base):
     green_flags = Column(ARRAY(Text), nullable=True)
     interview_quality_notes = Column(Text, nullable=True)
     generated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_reports_generated_id", "generated_at", "id"),
+    )
@@ -0,0 +1,44 @@
+"""
+Keyset (cursor) pagination over a (timestamp, id) sort key, newest first.
+
+The cursor is an opaque base64 token of the last row's key; the next page
+is everything strictly "older" than it, which Postgres answers with a
+row-value comparison against a composite (ts, id) index.
+"""
+import base64
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import tuple_
+
+
+def encode_cursor(ts: datetime, row_id: UUID) -> str:
+    raw = f"{ts.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Parse a cursor produced by encode_cursor. Raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        ts, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(ts), UUID(row_id)
+    except Exception as exc:
+        raise ValueError("Invalid cursor.") from exc
+
+
+def keyset_page(query, ts_col, id_col, cursor: Optional[str], limit: int):
+    """Apply ordering, the cursor predicate and limit+1 (to detect a next page)."""
+    if cursor:
+        ts, row_id = decode_cursor(cursor)
+        query = query.filter(tuple_(ts_col, id_col) < tuple_(ts, row_id))
+    return query.order_by(ts_col.desc(), id_col.desc()).limit(limit + 1)
+
+
+def split_page(rows: list, limit: int, key) -> tuple[list, Optional[str]]:
+    """Trim the look-ahead row and return (page, next_cursor)."""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(*key(page[-1]))
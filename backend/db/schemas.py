@@ -14,6 +14,17 @@ class CreateInterviewRequest(BaseModel):
     job_description: str
 
 
+class BulkCandidate(BaseModel):
+    candidate_name: str
+    candidate_email: EmailStr
+
+
+class BulkCreateInterviewRequest(BaseModel):
+    role: str
+    job_description: str
+    candidates: list[BulkCandidate]
+
+
 class InterviewResponse(BaseModel):
     id: UUID
     candidate_name: str
@@ -26,6 +37,28 @@ class InterviewResponse(BaseModel):
         from_attributes = True
 
 
+# ── Transcript checkpointing (agent → backend) ─────────────────────────────────
+
+class TranscriptTurnIn(BaseModel):
+    seq: int                      # 0-based, contiguous per interview
+    speaker: str                  # Candidate | Interviewer
+    text: str
+    ts: Optional[float] = None    # unix time the turn was committed
+    latency_s: Optional[float] = None
+
+
+class AppendTranscriptRequest(BaseModel):
+    interview_id: UUID
+    turns: list[TranscriptTurnIn]
+
+
+class CompleteInterviewRequest(BaseModel):
+    interview_id: UUID
+    final_seq: Optional[int] = None        # seq of the last turn; None if there were none
+    turns: list[TranscriptTurnIn] = []     # turns the checkpoint stream could not deliver
+    transcript: Optional[str] = None       # legacy agents: the whole transcript as text
+
+
 # ── Auth ──────────────────────────────────────────────────────────────────────
 
 class RegisterRequest(BaseModel):
@@ -1,9 +1,39 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.api import auth, interviews, reports, webhooks, metrics
+from backend.auth import shutdown_password_pool
+from backend.db.database import async_engine
+from backend.observability import get_telemetry
+from backend.services.livekit_service import close_livekit, init_livekit
+from backend.services.report_cache import run_invalidation_listener
+from backend.services.report_events import run_report_event_listener
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await init_livekit()
+    listeners = [
+        asyncio.create_task(run_invalidation_listener()),
+        asyncio.create_task(run_report_event_listener()),
+    ]
+    try:
+        yield
+    finally:
+        for listener in listeners:
+            listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await listener
+        await close_livekit()
+        shutdown_password_pool()
+        await async_engine.dispose()
+        await asyncio.to_thread(get_telemetry().flush)
+
 
-app = FastAPI(title="AI Interviewer API", version="1.0.0")
+app = FastAPI(title="AI Interviewer API", version="1.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -11,6 +41,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "ETag", "X-Next-Cursor"],
 )
 
 app.include_router(auth.router)
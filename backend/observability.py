@@ -1,13 +1,23 @@
 """
 Langfuse observability — lazy singleton, no-op when keys are not set.
 
-Usage:
-    from backend.observability import get_langfuse
-    lf = get_langfuse()
-    if lf:
-        trace = lf.trace(name="my-op", ...)
+Application code emits through the buffered telemetry sink, never by
+calling Langfuse inline:
+    from backend.observability import get_telemetry
+    telemetry = get_telemetry()
+    telemetry.trace(id=trace_id, name="my-op", ...)
+    telemetry.event(trace_id=trace_id, name="step", ...)
+
+Calls are queued (dropped if the queue is full) and replayed against the
+Langfuse client by a background thread in batches, so hot paths — the
+agent's real-time voice loop in particular — never wait on telemetry.
 """
 import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
@@ -41,3 +51,153 @@ def get_langfuse():
         _client = None
 
     return _client
+
+
+class StageTimer:
+    """
+    Records wall-clock duration per named stage of a request. Stages may
+    overlap (e.g. run under asyncio.gather), so the sum of stages can
+    exceed the total — the longest chain is the critical path.
+    """
+
+    def __init__(self) -> None:
+        self._t0 = time.perf_counter()
+        self.stages: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = (time.perf_counter() - start) * 1000
+
+    async def run(self, name: str, awaitable):
+        with self.stage(name):
+            return await awaitable
+
+    @property
+    def total_ms(self) -> float:
+        return (time.perf_counter() - self._t0) * 1000
+
+    def server_timing(self) -> str:
+        """Render as a Server-Timing header value (visible in browser devtools)."""
+        parts = [f"{name};dur={ms:.1f}" for name, ms in self.stages.items()]
+        parts.append(f"total;dur={self.total_ms:.1f}")
+        return ", ".join(parts)
+
+
+class TelemetrySink:
+    """
+    Bounded queue of Langfuse calls drained by a daemon thread.
+
+    Each entry is (method, kwargs) for a Langfuse client method that takes
+    explicit ids (trace / event / generation / score), so nothing has to
+    hold SDK objects between calls. When the queue is full new entries are
+    dropped and counted rather than blocking the caller.
+    """
+
+    def __init__(self, maxsize: int, batch_size: int, flush_interval_s: float) -> None:
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self.emitted = 0
+        self.dropped = 0
+        self.errors = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    # ── Producer API (non-blocking) ──────────────────────────────────────────
+
+    def trace(self, **kwargs) -> None:
+        """Create or update (by `id`) a trace."""
+        self._put("trace", kwargs)
+
+    def event(self, **kwargs) -> None:
+        self._put("event", kwargs)
+
+    def generation(self, **kwargs) -> None:
+        self._put("generation", kwargs)
+
+    def score(self, **kwargs) -> None:
+        self._put("score", kwargs)
+
+    def _put(self, method: str, kwargs: dict) -> None:
+        if get_langfuse() is None:
+            return
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((method, kwargs))
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until everything queued so far is handed to Langfuse and sent."""
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put((None, done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize(),
+            "maxsize": self._queue.maxsize,
+            "emitted": self.emitted,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+    # ── Consumer thread ──────────────────────────────────────────────────────
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="telemetry-sink", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        lf = get_langfuse()
+        while True:
+            batch = []
+            try:
+                batch.append(self._queue.get(timeout=self.flush_interval_s))
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            for method, payload in batch:
+                if method is None:          # flush marker
+                    try:
+                        lf.flush()
+                    except Exception as exc:
+                        logger.warning("[OBSERVABILITY] Langfuse flush failed: %s", exc)
+                    payload.set()
+                    continue
+                try:
+                    getattr(lf, method)(**payload)
+                    self.emitted += 1
+                except Exception as exc:
+                    self.errors += 1
+                    logger.debug("[OBSERVABILITY] Langfuse %s failed: %s", method, exc)
+
+
+_telemetry: Optional[TelemetrySink] = None
+
+
+def get_telemetry() -> TelemetrySink:
+    """Return the process-wide telemetry sink (its thread starts on first use)."""
+    global _telemetry
+    if _telemetry is None:
+        from backend.config import settings
+        _telemetry = TelemetrySink(
+            maxsize=settings.TELEMETRY_QUEUE_MAX,
+            batch_size=settings.TELEMETRY_BATCH_SIZE,
+            flush_interval_s=settings.TELEMETRY_FLUSH_S,
+        )
+    return _telemetry
@@ -0,0 +1,22 @@
+"""
+Fast JSON encoding for hot read paths.
+
+Endpoints that already hold plain dicts/rows return
+`Response(encode_json(...), media_type="application/json")` directly,
+skipping FastAPI's response_model validation + jsonable_encoder pass.
+"""
+import json
+from datetime import datetime
+from uuid import UUID
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
+
+
+def encode_json(payload) -> str:
+    return json.dumps(payload, default=_json_default, separators=(",", ":"))
@@ -0,0 +1,57 @@
+"""
+Segment assessments written by the incremental evaluator (tasks/assess.py).
+
+Segments are contiguous, non-overlapping seq ranges of an interview's
+transcript_turns, each scored once its topics concluded. When they cover
+every turn at completion, evaluation only needs the synthesis step.
+"""
+import uuid
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.db import models
+
+
+async def assessed_through(db: AsyncSession, interview_id: uuid.UUID) -> int:
+    """Last seq covered by a segment assessment, or -1."""
+    through = await db.scalar(
+        select(func.max(models.SegmentAssessment.end_seq))
+        .where(models.SegmentAssessment.interview_id == interview_id)
+    )
+    return -1 if through is None else through
+
+
+def load_segments(db: Session, interview_id: uuid.UUID) -> list[models.SegmentAssessment]:
+    return list(db.scalars(
+        select(models.SegmentAssessment)
+        .where(models.SegmentAssessment.interview_id == interview_id)
+        .order_by(models.SegmentAssessment.start_seq)
+    ))
+
+
+def save_segment(db: Session, interview_id: uuid.UUID, start_seq: int, end_seq: int, result: dict) -> None:
+    """Insert a segment; a concurrent run that already wrote this start_seq wins."""
+    db.execute(
+        pg_insert(models.SegmentAssessment)
+        .values(
+            interview_id=interview_id,
+            start_seq=start_seq,
+            end_seq=end_seq,
+            skill_scores=result["skill_scores"],
+            observations=result["observations"],
+        )
+        .on_conflict_do_nothing(index_elements=["interview_id", "start_seq"])
+    )
+
+
+def covered_through(segments: list[models.SegmentAssessment]) -> int:
+    """Last seq of the gap-free run of segments starting at seq 0, or -1."""
+    through = -1
+    for seg in segments:
+        if seg.start_seq != through + 1:
+            break
+        through = seg.end_seq
+    return through
@@ -0,0 +1,75 @@
+"""
+Dead-letter store for evaluations that failed permanently or ran out of
+retries.
+
+One Redis hash, `evaluate:dead-letter`, with a JSON entry per interview:
+{interview_id, error_type, error, kind, attempts, failed_at}. An entry
+stays until the evaluation is requeued (POST /api/reports/{id}/retry) or
+succeeds; the interview itself is marked `evaluation_failed` so the
+dashboard and report page can show it.
+"""
+import json
+import logging
+from datetime import datetime
+from typing import Optional
+
+from backend.cache import get_redis, get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+DEAD_LETTER_KEY = "evaluate:dead-letter"
+
+
+def record_dead_letter(interview_id: str, exc: Exception, kind: str, attempts: int) -> None:
+    """Park a failed evaluation. Never raises."""
+    entry = {
+        "interview_id": interview_id,
+        "error_type": type(exc).__name__,
+        "error": str(exc)[:2000],
+        "kind": kind,
+        "attempts": attempts,
+        "failed_at": datetime.utcnow().isoformat(),
+    }
+    try:
+        get_sync_redis().hset(DEAD_LETTER_KEY, interview_id, json.dumps(entry))
+    except Exception as redis_exc:
+        logger.error("[EVAL] Could not dead-letter %s (%s): %s", interview_id, redis_exc, entry)
+
+
+def discard_dead_letter(interview_id: str) -> None:
+    """Drop an entry after a successful evaluation (sync). Never raises."""
+    try:
+        get_sync_redis().hdel(DEAD_LETTER_KEY, interview_id)
+    except Exception as exc:
+        logger.warning("[EVAL] Could not clear dead letter for %s: %s", interview_id, exc)
+
+
+async def get_dead_letter(interview_id: str) -> Optional[dict]:
+    try:
+        raw = await get_redis().hget(DEAD_LETTER_KEY, interview_id)
+    except Exception as exc:
+        logger.warning("[EVAL] Dead-letter lookup failed for %s: %s", interview_id, exc)
+        return None
+    return json.loads(raw) if raw else None
+
+
+async def clear_dead_letter(interview_id: str) -> None:
+    try:
+        await get_redis().hdel(DEAD_LETTER_KEY, interview_id)
+    except Exception as exc:
+        logger.warning("[EVAL] Could not clear dead letter for %s: %s", interview_id, exc)
+
+
+async def dead_letter_ids() -> list[str]:
+    """Interview IDs with a parked evaluation."""
+    return await get_redis().hkeys(DEAD_LETTER_KEY)
+
+
+async def list_dead_letters(interview_ids: list[str], limit: int = 100) -> tuple[int, list[dict]]:
+    """How many of `interview_ids` are parked and up to `limit` of their entries, most recent first."""
+    if not interview_ids:
+        return 0, []
+    raws = await get_redis().hmget(DEAD_LETTER_KEY, interview_ids)
+    entries = [json.loads(raw) for raw in raws if raw]
+    entries.sort(key=lambda e: e["failed_at"], reverse=True)
+    return len(entries), entries[:limit]
@@ -0,0 +1,130 @@
+"""
+Idempotent enqueueing of evaluate_interview.
+
+The agent's completion webhook, its retries and LiveKit's room_finished
+safety net can all fire for the same interview within seconds. A Redis
+SET NX key per interview makes sure only the first of them publishes a
+Celery task; the task id is deterministic so duplicates that slip past
+(e.g. Redis unavailable) are still recognisable in the result backend.
+
+With incremental evaluation on, completion publishes the chain
+assess_interview(final) → evaluate_interview, and checkpoint batches
+schedule assess_interview for the turns concluded so far.
+
+enqueue_evaluation_sync is the same deduplicated enqueue for Celery tasks
+(e.g. the deferred room_finished safety net).
+"""
+import logging
+import uuid
+
+from celery import chain
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.cache import get_redis, get_sync_redis
+from backend.config import settings
+from backend.services.assessments import assessed_through
+from backend.tasks.assess import assess_interview
+from backend.tasks.evaluate import evaluate_interview
+
+logger = logging.getLogger(__name__)
+
+_ENQUEUED_PREFIX = "evaluate:enqueued:"
+_ASSESS_SCHEDULED_PREFIX = "assess:scheduled:"
+
+
+def _publish(interview_id: str, task_id: str, regenerate: bool) -> None:
+    if settings.INCREMENTAL_EVAL_ENABLED:
+        workflow = chain(
+            assess_interview.si(interview_id, final=True),
+            evaluate_interview.si(interview_id, regenerate=regenerate),
+        )
+        workflow.apply_async(task_id=task_id)   # id of the final task
+    else:
+        evaluate_interview.apply_async(args=[interview_id], kwargs={"regenerate": regenerate}, task_id=task_id)
+
+
+async def enqueue_evaluation(interview_id: str, *, force: bool = False, regenerate: bool = False) -> bool:
+    """
+    Queue evaluation unless it was already queued recently.
+    `force` clears the idempotency key first (manual re-evaluation);
+    `regenerate` replaces an existing report.
+    Returns True if a task was published.
+    """
+    key = _ENQUEUED_PREFIX + interview_id
+    r = get_redis()
+    try:
+        if force:
+            await r.delete(key)
+        acquired = await r.set(key, "1", nx=True, ex=int(settings.EVAL_ENQUEUE_DEDUP_TTL_S))
+    except Exception as exc:
+        # Fail open — the task itself still refuses to evaluate twice.
+        logger.warning("[EVAL] Idempotency check failed for %s: %s", interview_id, exc)
+        acquired = True
+
+    if not acquired:
+        logger.info("[EVAL] Evaluation already queued for interview %s — skipping.", interview_id)
+        return False
+
+    task_id = f"evaluate-{interview_id}" if not force else f"evaluate-{interview_id}-{uuid.uuid4().hex[:8]}"
+    try:
+        await run_in_threadpool(_publish, interview_id, task_id, regenerate)
+    except Exception:
+        try:
+            await r.delete(key)
+        except Exception:
+            pass
+        raise
+    logger.info("[EVAL] Evaluation task %s queued.", task_id)
+    return True
+
+
+def enqueue_evaluation_sync(interview_id: str) -> bool:
+    """Blocking enqueue_evaluation (without force) for Celery tasks. Returns True if published."""
+    key = _ENQUEUED_PREFIX + interview_id
+    r = get_sync_redis()
+    try:
+        acquired = r.set(key, "1", nx=True, ex=int(settings.EVAL_ENQUEUE_DEDUP_TTL_S))
+    except Exception as exc:
+        logger.warning("[EVAL] Idempotency check failed for %s: %s", interview_id, exc)
+        acquired = True
+    if not acquired:
+        logger.info("[EVAL] Evaluation already queued for interview %s — skipping.", interview_id)
+        return False
+
+    task_id = f"evaluate-{interview_id}"
+    try:
+        _publish(interview_id, task_id, regenerate=False)
+    except Exception:
+        try:
+            r.delete(key)
+        except Exception:
+            pass
+        raise
+    logger.info("[EVAL] Evaluation task %s queued.", task_id)
+    return True
+
+
+async def maybe_schedule_assessment(db: AsyncSession, interview_id: uuid.UUID, acked_seq: int) -> bool:
+    """
+    Queue an incremental assessment once INCREMENTAL_EVAL_MIN_TURNS turns
+    past the last assessed segment have been checkpointed. Debounced per
+    interview in Redis. Returns True if a task was published.
+    """
+    if not settings.INCREMENTAL_EVAL_ENABLED:
+        return False
+    if acked_seq - await assessed_through(db, interview_id) < settings.INCREMENTAL_EVAL_MIN_TURNS:
+        return False
+    try:
+        acquired = await get_redis().set(
+            _ASSESS_SCHEDULED_PREFIX + str(interview_id), "1",
+            nx=True, ex=int(settings.INCREMENTAL_EVAL_DEBOUNCE_S),
+        )
+        if not acquired:
+            return False
+        await run_in_threadpool(assess_interview.apply_async, args=[str(interview_id)])
+    except Exception as exc:
+        # Best effort — completion still evaluates the whole interview.
+        logger.warning("[EVAL] Could not schedule assessment for %s: %s", interview_id, exc)
+        return False
+    return True
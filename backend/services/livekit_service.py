@@ -1,26 +1,68 @@
 import json
+import logging
+from typing import Optional
 
+import aiohttp
 from livekit import api
 
 from backend.config import settings
 
+logger = logging.getLogger(__name__)
 
-async def create_interview_room(
-    room_name: str,
+# App-scoped client — opened at FastAPI startup, closed at shutdown.
+# A single aiohttp session keeps TLS connections to LiveKit alive across
+# requests; it is safe to share between concurrent handlers on one event loop.
+_lk: Optional[api.LiveKitAPI] = None
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def init_livekit() -> api.LiveKitAPI:
+    """Create the shared LiveKitAPI client (idempotent)."""
+    global _lk, _session
+    if _lk is None:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=settings.LIVEKIT_HTTP_POOL_SIZE,
+                keepalive_timeout=settings.LIVEKIT_HTTP_KEEPALIVE_S,
+            ),
+            timeout=aiohttp.ClientTimeout(total=settings.LIVEKIT_HTTP_TIMEOUT_S),
+        )
+        _lk = api.LiveKitAPI(
+            url=settings.LIVEKIT_URL,
+            api_key=settings.LIVEKIT_API_KEY,
+            api_secret=settings.LIVEKIT_API_SECRET,
+            session=_session,
+        )
+        logger.info("[LIVEKIT] Shared API client opened → %s", settings.LIVEKIT_URL)
+    return _lk
+
+
+async def close_livekit() -> None:
+    """Close the shared client and its connection pool."""
+    global _lk, _session
+    if _lk is not None:
+        await _lk.aclose()
+        _lk = None
+    if _session is not None:
+        await _session.close()
+        _session = None
+        logger.info("[LIVEKIT] Shared API client closed.")
+
+
+async def get_livekit() -> api.LiveKitAPI:
+    """Return the shared client, opening it lazily outside the app lifespan."""
+    return _lk if _lk is not None else await init_livekit()
+
+
+def room_metadata(
     interview_id: str,
     role: str,
     job_description: str,
     skills_to_cover: list[str],
     candidate_name: str,
-) -> None:
-    """Create a LiveKit room pre-loaded with interview metadata."""
-    lk = api.LiveKitAPI(
-        url=settings.LIVEKIT_URL,
-        api_key=settings.LIVEKIT_API_KEY,
-        api_secret=settings.LIVEKIT_API_SECRET,
-    )
-
-    metadata = json.dumps({
+) -> str:
+    """Serialize the interview context the agent reads from room metadata."""
+    return json.dumps({
         "interview_id": interview_id,
         "role": role,
         "job_description": job_description,
@@ -28,6 +70,10 @@ async def create_interview_room(
         "candidate_name": candidate_name,
     })
 
+
+async def create_room(room_name: str, metadata: str) -> None:
+    """Create the LiveKit room for an interview."""
+    lk = await get_livekit()
     await lk.room.create_room(
         api.CreateRoomRequest(
             name=room_name,
@@ -37,8 +83,31 @@ async def create_interview_room(
         )
     )
 
-    # Explicitly dispatch the agent worker to this room.
-    # Without this the agent worker sits idle — it does NOT auto-join rooms.
+
+async def delete_room(room_name: str) -> None:
+    """Remove a room that will not be used, e.g. when creating its interview failed. Never raises."""
+    try:
+        lk = await get_livekit()
+        await lk.room.delete_room(api.DeleteRoomRequest(room=room_name))
+    except Exception as exc:
+        logger.warning("[LIVEKIT] Could not delete room %s: %s", room_name, exc)
+
+
+async def update_room_metadata(room_name: str, metadata: str) -> None:
+    """Replace the metadata of an existing room (e.g. once skills are known)."""
+    lk = await get_livekit()
+    await lk.room.update_room_metadata(
+        api.UpdateRoomMetadataRequest(room=room_name, metadata=metadata)
+    )
+
+
+async def dispatch_agent(room_name: str) -> None:
+    """
+    Explicitly dispatch the agent worker to this room.
+    Without this the agent worker sits idle — it does NOT auto-join rooms.
+    The agent reads room metadata on join, so dispatch only once it is final.
+    """
+    lk = await get_livekit()
     await lk.agent_dispatch.create_dispatch(
         api.CreateAgentDispatchRequest(
             room=room_name,
@@ -46,7 +115,21 @@ async def create_interview_room(
         )
     )
 
-    await lk.aclose()
+
+async def create_interview_room(
+    room_name: str,
+    interview_id: str,
+    role: str,
+    job_description: str,
+    skills_to_cover: list[str],
+    candidate_name: str,
+) -> None:
+    """Create a LiveKit room pre-loaded with interview metadata and dispatch the agent."""
+    await create_room(
+        room_name,
+        room_metadata(interview_id, role, job_description, skills_to_cover, candidate_name),
+    )
+    await dispatch_agent(room_name)
 
 
 def generate_candidate_token(room_name: str, participant_name: str) -> str:
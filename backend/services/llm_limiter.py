@@ -0,0 +1,291 @@
+"""
+Coordination of Gemini calls per API key, shared by every API and worker
+process and thread. All state lives in Redis, keyed by a hash of
+GEMINI_API_KEY.
+
+  llm_slot()        — cap on in-flight requests (LLM_MAX_IN_FLIGHT). Slots
+                      are a sorted set scored by lease expiry, so a slot held
+                      by a crashed worker frees itself once its lease runs out.
+  wait_for_budget() — token buckets for requests/min (LLM_RPM) and
+                      tokens/min (LLM_TPM). BATCH work (evaluation) may only
+                      draw them down to LLM_INTERACTIVE_RESERVE of capacity;
+                      INTERACTIVE work (skill extraction) may use all of it.
+  start_cooldown()  — after a 429 every caller pauses for the server's
+                      retry-after hint (retry_after_s).
+
+Acquisition is a Lua script (atomic), polled with jitter until it succeeds
+or its wait budget elapses (TimeoutError).
+
+If Redis is unreachable the limiter fails open: a degraded limit is better
+than no evaluations.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import re
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Optional
+
+from backend.cache import get_redis, get_sync_redis
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+_ACQUIRE = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[2]) then
+    redis.call('ZADD', KEYS[1], ARGV[3], ARGV[4])
+    redis.call('EXPIRE', KEYS[1], ARGV[5])
+    return 1
+end
+return 0
+"""
+
+# KEYS: request bucket, token bucket, cooldown
+# ARGV: now, rpm, tpm, token cost, reserved fraction
+# Returns "0" when granted, else the seconds to wait — as a string, since
+# Lua numbers returned to Redis are truncated to integers.
+_TAKE_BUDGET = """
+local now = tonumber(ARGV[1])
+local cooldown = tonumber(redis.call('GET', KEYS[3]) or '0')
+if cooldown > now then
+    return tostring(cooldown - now)
+end
+local function level(key, cap)
+    local v = redis.call('HMGET', key, 'level', 'ts')
+    local lvl, ts = tonumber(v[1]), tonumber(v[2])
+    if not lvl or not ts then
+        return cap
+    end
+    return math.min(cap, lvl + math.max(0, now - ts) * cap / 60)
+end
+local rpm, tpm = tonumber(ARGV[2]), tonumber(ARGV[3])
+local cost = math.min(tonumber(ARGV[4]), tpm)
+local reserve = tonumber(ARGV[5])
+local requests, tokens = level(KEYS[1], rpm), level(KEYS[2], tpm)
+local request_short = 1 + reserve * rpm - requests
+local token_short = cost + reserve * tpm - tokens
+if request_short <= 0 and token_short <= 0 then
+    redis.call('HSET', KEYS[1], 'level', requests - 1, 'ts', now)
+    redis.call('HSET', KEYS[2], 'level', tokens - cost, 'ts', now)
+    redis.call('EXPIRE', KEYS[1], 120)
+    redis.call('EXPIRE', KEYS[2], 120)
+    return '0'
+end
+return tostring(math.max(request_short * 60 / rpm, token_short * 60 / tpm))
+"""
+
+# KEYS: token bucket
+# ARGV: now, tpm, tokens to give back (negative to charge more)
+# Refills up to now before applying the correction, so the bucket keeps a
+# valid ts and its expiry. A missing bucket has refilled completely and is
+# left alone.
+_SETTLE = """
+local now, cap = tonumber(ARGV[1]), tonumber(ARGV[2])
+local v = redis.call('HMGET', KEYS[1], 'level', 'ts')
+local lvl, ts = tonumber(v[1]), tonumber(v[2])
+if not lvl or not ts then
+    return 0
+end
+lvl = math.min(cap, lvl + math.max(0, now - ts) * cap / 60 + tonumber(ARGV[3]))
+redis.call('HSET', KEYS[1], 'level', lvl, 'ts', now)
+redis.call('EXPIRE', KEYS[1], 120)
+return 1
+"""
+
+_RETRY_DELAY_RE = re.compile(r"""retryDelay['"]?\s*:\s*['"]?(\d+(?:\.\d+)?)s""")
+
+_scripts: dict = {}
+_last_warning = 0.0
+
+
+def _key_hash() -> str:
+    return hashlib.sha256(settings.GEMINI_API_KEY.encode()).hexdigest()[:12]
+
+
+def slots_key() -> str:
+    return "llm:inflight:" + _key_hash()
+
+
+def budget_keys() -> list[str]:
+    """[request bucket, token bucket, cooldown] keys for the current API key."""
+    h = _key_hash()
+    return [f"llm:rpm:{h}", f"llm:tpm:{h}", f"llm:cooldown:{h}"]
+
+
+def _warn_degraded(exc: Exception) -> None:
+    global _last_warning
+    if time.monotonic() - _last_warning > 60:
+        _last_warning = time.monotonic()
+        logger.warning("[LLM] Limiter unavailable, running unthrottled: %s", exc)
+
+
+def _script(source: str, client):
+    """Lua script registered on `client` — the sync and asyncio clients each need their own."""
+    key = (source, id(client))
+    if key not in _scripts:
+        _scripts[key] = client.register_script(source)
+    return _scripts[key]
+
+
+# ── Token buckets ─────────────────────────────────────────────────────────────
+
+def estimate_tokens(prompt: str) -> int:
+    """Budgeted cost of a call: ~4 characters per prompt token plus expected output."""
+    return len(prompt) // 4 + settings.LLM_OUTPUT_TOKENS_ESTIMATE
+
+
+def _budget_args(priority: str, tokens: int) -> list:
+    reserve = 0.0 if priority == INTERACTIVE else settings.LLM_INTERACTIVE_RESERVE
+    return [time.time(), settings.LLM_RPM, settings.LLM_TPM, tokens, reserve]
+
+
+def _budget_timeout(priority: str) -> TimeoutError:
+    return TimeoutError(f"No Gemini {priority} budget within {settings.LLM_BUDGET_WAIT_S:.0f}s")
+
+
+def wait_for_budget(priority: str, tokens: int) -> None:
+    """Block until one request of `tokens` fits the RPM/TPM buckets for `priority`."""
+    deadline = time.monotonic() + settings.LLM_BUDGET_WAIT_S
+    while True:
+        try:
+            r = get_sync_redis()
+            wait = float(_script(_TAKE_BUDGET, r)(keys=budget_keys(), args=_budget_args(priority, tokens)))
+        except Exception as exc:
+            _warn_degraded(exc)
+            return
+        if wait <= 0:
+            return
+        if time.monotonic() + wait > deadline:
+            raise _budget_timeout(priority)
+        time.sleep(wait + random.uniform(0, 0.1))
+
+
+async def wait_for_budget_async(priority: str, tokens: int) -> None:
+    """Async variant of wait_for_budget — for request handlers."""
+    deadline = time.monotonic() + settings.LLM_BUDGET_WAIT_S
+    while True:
+        try:
+            r = get_redis()
+            wait = float(await _script(_TAKE_BUDGET, r)(keys=budget_keys(), args=_budget_args(priority, tokens)))
+        except Exception as exc:
+            _warn_degraded(exc)
+            return
+        if wait <= 0:
+            return
+        if time.monotonic() + wait > deadline:
+            raise _budget_timeout(priority)
+        await asyncio.sleep(wait + random.uniform(0, 0.1))
+
+
+def settle_tokens(estimated: int, actual: Optional[int]) -> None:
+    """Correct the token bucket by the difference between a call's estimate and its real usage."""
+    if not actual or actual == estimated:
+        return
+    try:
+        r = get_sync_redis()
+        _script(_SETTLE, r)(keys=[budget_keys()[1]], args=[time.time(), settings.LLM_TPM, estimated - actual])
+    except Exception as exc:
+        _warn_degraded(exc)
+
+
+async def settle_tokens_async(estimated: int, actual: Optional[int]) -> None:
+    if not actual or actual == estimated:
+        return
+    try:
+        r = get_redis()
+        await _script(_SETTLE, r)(keys=[budget_keys()[1]], args=[time.time(), settings.LLM_TPM, estimated - actual])
+    except Exception as exc:
+        _warn_degraded(exc)
+
+
+# ── 429 handling ──────────────────────────────────────────────────────────────
+
+def is_rate_limited(exc: Exception) -> bool:
+    return getattr(exc, "code", None) == 429 or "RESOURCE_EXHAUSTED" in str(exc)
+
+
+def retry_after_s(exc: Exception) -> float:
+    """The RetryInfo delay Gemini attaches to a 429, else LLM_RETRY_AFTER_DEFAULT_S."""
+    details = getattr(exc, "details", None)
+    match = _RETRY_DELAY_RE.search(json.dumps(details, default=str) if details else str(exc))
+    delay = float(match.group(1)) if match else settings.LLM_RETRY_AFTER_DEFAULT_S
+    # Spread the wake-up so every waiting worker doesn't retry in the same instant
+    return delay + random.uniform(0, 1)
+
+
+def _cooldown_until(current, seconds: float) -> Optional[float]:
+    until = time.time() + seconds
+    return until if until > float(current or 0) else None
+
+
+def start_cooldown(seconds: float) -> None:
+    """Pause every caller's Gemini requests for `seconds`."""
+    try:
+        r = get_sync_redis()
+        key = budget_keys()[2]
+        until = _cooldown_until(r.get(key), seconds)
+        if until:
+            r.set(key, until, ex=int(seconds) + 1)
+    except Exception as exc:
+        _warn_degraded(exc)
+
+
+async def start_cooldown_async(seconds: float) -> None:
+    try:
+        r = get_redis()
+        key = budget_keys()[2]
+        until = _cooldown_until(await r.get(key), seconds)
+        if until:
+            await r.set(key, until, ex=int(seconds) + 1)
+    except Exception as exc:
+        _warn_degraded(exc)
+
+
+# ── In-flight slots ───────────────────────────────────────────────────────────
+
+def _try_acquire(token: str) -> bool:
+    r = get_sync_redis()
+    now = time.time()
+    lease = settings.LLM_SLOT_LEASE_S
+    return bool(_script(_ACQUIRE, r)(
+        keys=[slots_key()],
+        args=[now, settings.LLM_MAX_IN_FLIGHT, now + lease, token, int(lease) + 60],
+    ))
+
+
+@contextmanager
+def llm_slot():
+    """Hold one of LLM_MAX_IN_FLIGHT slots for the duration of a Gemini call."""
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + settings.LLM_SLOT_WAIT_S
+    held = False
+    try:
+        while not _try_acquire(token):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"No Gemini slot free within {settings.LLM_SLOT_WAIT_S:.0f}s "
+                    f"(LLM_MAX_IN_FLIGHT={settings.LLM_MAX_IN_FLIGHT})"
+                )
+            time.sleep(random.uniform(0.05, 0.25))
+        held = True
+    except TimeoutError:
+        raise
+    except Exception as exc:
+        _warn_degraded(exc)
+
+    try:
+        yield
+    finally:
+        if held:
+            try:
+                get_sync_redis().zrem(slots_key(), token)
+            except Exception as exc:
+                _warn_degraded(exc)
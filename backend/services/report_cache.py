@@ -0,0 +1,139 @@
+"""
+Read-through cache for finalized reports, keyed by interview_id.
+
+  L1 — in-process TTL/LRU of (body, etag) per API worker
+  L2 — Redis `report:<interview_id>` holding the serialized JSON body
+
+The Celery evaluator writes L2 when a report commits and publishes on
+`reports:invalidate`; every API worker listens on that channel and drops
+its L1 entry, so a regenerated report is never served stale for long.
+"""
+import asyncio
+import hashlib
+import logging
+from typing import Optional
+
+from backend.cache import TTLCache, get_redis, get_sync_redis
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+_REDIS_PREFIX = "report:"
+_INVALIDATE_CHANNEL = "reports:invalidate"
+
+report_cache = TTLCache(maxsize=settings.REPORT_CACHE_MAX_ENTRIES, ttl=settings.REPORT_CACHE_TTL_S)
+_redis_stats = {"hits": 0, "misses": 0, "errors": 0}
+
+
+# ── Serialization ─────────────────────────────────────────────────────────────
+
+def serialize_report(report, interview) -> dict:
+    """Build the GET /api/reports/{id} payload from ORM rows."""
+    return {
+        "id": str(report.id),
+        "interview_id": str(report.interview_id),
+        "candidate_name": interview.candidate_name,
+        "role_applied": interview.role,
+        "overall_score": report.overall_score,
+        "role_eligibility": report.role_eligibility,
+        "recommendation": report.recommendation,
+        "skill_scores": report.skill_scores,
+        "competency_scores": report.competency_scores,
+        "strengths": report.strengths,
+        "weaknesses": report.weaknesses,
+        "areas_for_improvement": report.areas_for_improvement,
+        "red_flags": report.red_flags,
+        "green_flags": report.green_flags,
+        "interview_quality_notes": report.interview_quality_notes,
+        "generated_at": report.generated_at,
+    }
+
+
+def etag_for(body: str) -> str:
+    return '"' + hashlib.sha1(body.encode()).hexdigest() + '"'
+
+
+def report_cache_stats() -> dict:
+    return {"memory": report_cache.stats(), "redis": dict(_redis_stats)}
+
+
+# ── Request path (async) ──────────────────────────────────────────────────────
+
+async def get_cached_report(interview_id: str) -> Optional[tuple[str, str]]:
+    """Return (body, etag) from L1 or Redis, or None on a miss."""
+    entry = report_cache.get(interview_id)
+    if entry is not None:
+        return entry
+
+    try:
+        body = await get_redis().get(_REDIS_PREFIX + interview_id)
+    except Exception as exc:
+        _redis_stats["errors"] += 1
+        logger.warning("[REPORTS] Redis lookup failed: %s", exc)
+        return None
+    if body is None:
+        _redis_stats["misses"] += 1
+        return None
+
+    _redis_stats["hits"] += 1
+    entry = (body, etag_for(body))
+    report_cache.set(interview_id, entry)
+    return entry
+
+
+async def cache_report(interview_id: str, body: str) -> tuple[str, str]:
+    """Populate both tiers after a DB read; returns (body, etag)."""
+    entry = (body, etag_for(body))
+    report_cache.set(interview_id, entry)
+    try:
+        await get_redis().set(
+            _REDIS_PREFIX + interview_id, body, ex=int(settings.REPORT_CACHE_REDIS_TTL_S)
+        )
+    except Exception as exc:
+        _redis_stats["errors"] += 1
+        logger.warning("[REPORTS] Redis write failed: %s", exc)
+    return entry
+
+
+async def run_invalidation_listener() -> None:
+    """Drop L1 entries named on the invalidation channel. Runs for the app lifetime."""
+    while True:
+        pubsub = get_redis().pubsub()
+        try:
+            await pubsub.subscribe(_INVALIDATE_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    report_cache.delete(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("[REPORTS] Invalidation listener error: %s — reconnecting.", exc)
+            await asyncio.sleep(1)
+        finally:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
+
+# ── Worker path (sync) ────────────────────────────────────────────────────────
+
+def store_report(interview_id: str, body: str) -> None:
+    """Write the freshly committed report to Redis and evict stale L1 copies. Never raises."""
+    try:
+        r = get_sync_redis()
+        r.set(_REDIS_PREFIX + interview_id, body, ex=int(settings.REPORT_CACHE_REDIS_TTL_S))
+        r.publish(_INVALIDATE_CHANNEL, interview_id)
+    except Exception as exc:
+        logger.warning("[REPORTS] Failed to cache report for %s: %s", interview_id, exc)
+
+
+def invalidate_report(interview_id: str) -> None:
+    """Remove a report from every cache tier (before regeneration). Never raises."""
+    report_cache.delete(interview_id)
+    try:
+        r = get_sync_redis()
+        r.delete(_REDIS_PREFIX + interview_id)
+        r.publish(_INVALIDATE_CHANNEL, interview_id)
+    except Exception as exc:
+        logger.warning("[REPORTS] Failed to invalidate report cache for %s: %s", interview_id, exc)
@@ -0,0 +1,98 @@
+"""
+Report readiness notifications over Redis pub/sub.
+
+The Celery evaluator publishes on `report-ready:<interview_id>` once the
+report row is committed — or, with an `error` field, once the evaluation
+has been dead-lettered; the SSE endpoint waits on it so browsers need no
+DB polling.
+
+Each API process holds a single pattern subscription (`report-ready:*`,
+run_report_event_listener, started with the app) and fans messages out
+to in-process waiters, so open SSE streams cost a queue each rather than
+a Redis connection each.
+"""
+import asyncio
+import json
+import logging
+from typing import Optional
+
+from backend.cache import get_redis, get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+
+def report_channel(interview_id: str) -> str:
+    return f"report-ready:{interview_id}"
+
+
+def publish_report_ready(interview_id: str, report_id: str) -> None:
+    """Notify subscribers that the report is available. Never raises."""
+    try:
+        get_sync_redis().publish(
+            report_channel(interview_id),
+            json.dumps({"interview_id": interview_id, "report_id": report_id}),
+        )
+    except Exception as exc:
+        logger.warning("[REPORTS] Failed to publish readiness for %s: %s", interview_id, exc)
+
+
+def publish_report_failed(interview_id: str, error: str) -> None:
+    """Notify subscribers that evaluation gave up. Never raises."""
+    try:
+        get_sync_redis().publish(
+            report_channel(interview_id),
+            json.dumps({"interview_id": interview_id, "error": error}),
+        )
+    except Exception as exc:
+        logger.warning("[REPORTS] Failed to publish failure for %s: %s", interview_id, exc)
+
+
+_CHANNEL_PREFIX = "report-ready:"
+_waiters: dict[str, set[asyncio.Queue]] = {}
+
+
+async def run_report_event_listener() -> None:
+    """Deliver readiness messages to local waiters. Runs for the app lifetime."""
+    while True:
+        pubsub = get_redis().pubsub()
+        try:
+            await pubsub.psubscribe(report_channel("*"))
+            async for message in pubsub.listen():
+                if message.get("type") != "pmessage":
+                    continue
+                interview_id = message["channel"][len(_CHANNEL_PREFIX):]
+                for queue in _waiters.get(interview_id, ()):
+                    queue.put_nowait(json.loads(message["data"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("[REPORTS] Readiness listener error: %s — reconnecting.", exc)
+            await asyncio.sleep(1)
+        finally:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
+
+def subscribe_report_ready(interview_id: str) -> asyncio.Queue:
+    """Register a waiter for the interview's readiness events."""
+    queue: asyncio.Queue = asyncio.Queue()
+    _waiters.setdefault(interview_id, set()).add(queue)
+    return queue
+
+
+async def next_report_event(queue: asyncio.Queue, timeout: float) -> Optional[dict]:
+    """Wait up to `timeout` seconds for a readiness message."""
+    try:
+        return await asyncio.wait_for(queue.get(), timeout)
+    except asyncio.TimeoutError:
+        return None
+
+
+def close_subscription(interview_id: str, queue: asyncio.Queue) -> None:
+    waiters = _waiters.get(interview_id)
+    if waiters is not None:
+        waiters.discard(queue)
+        if not waiters:
+            del _waiters[interview_id]
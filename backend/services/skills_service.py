@@ -0,0 +1,114 @@
+"""
+Skill resolution for interview creation.
+
+Wraps the async Gemini skill extraction with a timeout so a slow or failing
+LLM call never holds up the recruiter — on timeout/error the configured
+fallback skill set is used instead.
+
+Results are cached by a hash of the normalized (role, job_description) pair:
+an in-process LRU in front of a Redis tier shared by all API workers.
+Fallback skill sets are never cached.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Optional
+
+from backend.agents.evaluator_agent import extract_skills_from_jd_async
+from backend.cache import TTLCache, get_redis
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+_REDIS_PREFIX = "skills:"
+
+skill_cache = TTLCache(maxsize=settings.SKILL_CACHE_MAX_ENTRIES, ttl=settings.SKILL_CACHE_TTL_S)
+_redis_stats = {"hits": 0, "misses": 0, "errors": 0}
+
+
+def skills_cache_key(job_description: str, role: str) -> str:
+    """Content address for a JD — insensitive to case and whitespace differences."""
+    normalized = "\x1f".join(" ".join(part.split()).casefold() for part in (role, job_description))
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def skill_cache_stats() -> dict:
+    return {"memory": skill_cache.stats(), "redis": dict(_redis_stats)}
+
+
+async def _redis_get(key: str) -> Optional[list[str]]:
+    try:
+        raw = await get_redis().get(_REDIS_PREFIX + key)
+    except Exception as exc:
+        _redis_stats["errors"] += 1
+        logger.warning("[SKILLS] Redis lookup failed: %s", exc)
+        return None
+    if raw is None:
+        _redis_stats["misses"] += 1
+        return None
+    _redis_stats["hits"] += 1
+    return json.loads(raw)
+
+
+async def _redis_set(key: str, skills: list[str]) -> None:
+    try:
+        await get_redis().set(
+            _REDIS_PREFIX + key, json.dumps(skills), ex=int(settings.SKILL_CACHE_TTL_S)
+        )
+    except Exception as exc:
+        _redis_stats["errors"] += 1
+        logger.warning("[SKILLS] Redis write failed: %s", exc)
+
+
+async def remember_skills(job_description: str, role: str, skills: list[str]) -> None:
+    """Seed the cache with a known-good skill set (e.g. from an existing interview)."""
+    if not skills or skills == settings.SKILL_EXTRACTION_FALLBACK:
+        return
+    key = skills_cache_key(job_description, role)
+    skill_cache.set(key, list(skills))
+    await _redis_set(key, list(skills))
+
+
+async def _extract(job_description: str, role: str) -> Optional[list[str]]:
+    try:
+        skills = await asyncio.wait_for(
+            extract_skills_from_jd_async(job_description, role),
+            timeout=settings.SKILL_EXTRACTION_TIMEOUT_S,
+        )
+    except asyncio.TimeoutError:
+        logger.warning(
+            "[SKILLS] Extraction timed out after %.1fs for role '%s' — using fallback.",
+            settings.SKILL_EXTRACTION_TIMEOUT_S, role,
+        )
+        return None
+    except Exception as exc:
+        logger.warning("[SKILLS] Extraction failed for role '%s': %s — using fallback.", role, exc)
+        return None
+
+    if not isinstance(skills, list) or not skills:
+        logger.warning("[SKILLS] Extraction returned no skills for role '%s' — using fallback.", role)
+        return None
+    return [str(s) for s in skills]
+
+
+async def resolve_skills(job_description: str, role: str) -> list[str]:
+    """Return skills to assess for this JD, falling back to a generic set on failure."""
+    key = skills_cache_key(job_description, role)
+
+    skills = skill_cache.get(key)
+    if skills is not None:
+        return list(skills)
+
+    skills = await _redis_get(key)
+    if skills is not None:
+        skill_cache.set(key, skills)
+        return list(skills)
+
+    skills = await _extract(job_description, role)
+    if skills is None:
+        return list(settings.SKILL_EXTRACTION_FALLBACK)
+
+    skill_cache.set(key, skills)
+    await _redis_set(key, skills)
+    return list(skills)
@@ -0,0 +1,132 @@
+"""
+Per-turn transcript storage (`transcript_turns`, keyed by interview_id + seq).
+
+The interviewer agent streams turns in small batches while the interview
+runs; batches are inserted with ON CONFLICT DO NOTHING on the seq, so
+re-sent batches (at-least-once delivery) are harmless. Readers select the
+turns they need instead of reparsing one text blob — `format_transcript`
+renders them in the `Speaker: text` layout the evaluator prompt expects.
+
+Interviews finalized before per-turn storage were backfilled by migration
+0004 using `parse_transcript`, which the completion webhook also applies
+to the text transcript of agents that predate checkpointing.
+"""
+import logging
+import re
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.db import models
+
+logger = logging.getLogger(__name__)
+
+_TURN_RE = re.compile(r"^(Candidate|Interviewer):[ \t]?(.*)$", re.DOTALL)
+
+
+# ── Parsing / rendering ───────────────────────────────────────────────────────
+
+def parse_transcript(transcript: str) -> list[dict]:
+    """
+    Split a `Speaker: text` blob (turns separated by blank lines) into turns.
+    Blocks without a speaker prefix are continuation paragraphs of the
+    previous turn.
+    """
+    turns: list[dict] = []
+    for block in transcript.split("\n\n"):
+        match = _TURN_RE.match(block)
+        if match:
+            turns.append({"seq": len(turns), "speaker": match.group(1), "text": match.group(2).strip()})
+        elif turns and block.strip():
+            turns[-1]["text"] += "\n\n" + block.strip()
+    return turns
+
+
+def format_transcript(turns) -> str:
+    """Render turns (dicts or TranscriptTurn rows) as `Speaker: text` blocks."""
+    return "\n\n".join(
+        f"{t['speaker']}: {t['text']}" if isinstance(t, dict) else f"{t.speaker}: {t.text}"
+        for t in turns
+    )
+
+
+def _row(interview_id: uuid.UUID, turn: dict) -> dict:
+    ts = turn.get("ts")
+    return {
+        "interview_id": interview_id,
+        "seq": turn["seq"],
+        "speaker": turn["speaker"],
+        "text": turn["text"],
+        "spoken_at": datetime.utcfromtimestamp(ts) if ts else None,
+        "latency_s": turn.get("latency_s"),
+    }
+
+
+# ── Request path (async) ──────────────────────────────────────────────────────
+
+async def append_turns(db: AsyncSession, interview_id: uuid.UUID, turns: list[dict]) -> int:
+    """Insert a batch of turns, ignoring seqs already stored; returns how many were new."""
+    inserted = await db.scalars(
+        pg_insert(models.TranscriptTurn)
+        .values([_row(interview_id, t) for t in turns])
+        .on_conflict_do_nothing(index_elements=["interview_id", "seq"])
+        .returning(models.TranscriptTurn.seq)
+    )
+    return len(inserted.all())
+
+
+async def turn_stats(db: AsyncSession, interview_id: uuid.UUID) -> tuple[int, Optional[int]]:
+    """(number of stored turns, highest stored seq) for an interview."""
+    row = (
+        await db.execute(
+            select(func.count(), func.max(models.TranscriptTurn.seq))
+            .where(models.TranscriptTurn.interview_id == interview_id)
+        )
+    ).one()
+    return row[0], row[1]
+
+
+async def suffix_start(db: AsyncSession, interview_id: uuid.UUID, n: int) -> Optional[int]:
+    """Seq of the first of the last n stored turns (seqs may have gaps), or None if there are none."""
+    last_n = (
+        select(models.TranscriptTurn.seq)
+        .where(models.TranscriptTurn.interview_id == interview_id)
+        .order_by(models.TranscriptTurn.seq.desc())
+        .limit(n)
+        .subquery()
+    )
+    return await db.scalar(select(func.min(last_n.c.seq)))
+
+
+async def check_complete(db: AsyncSession, interview_id: uuid.UUID, final_seq: Optional[int]) -> int:
+    """Return the stored turn count, logging any gap before final_seq."""
+    count, max_seq = await turn_stats(db, interview_id)
+    if final_seq is not None and (count != final_seq + 1 or max_seq != final_seq):
+        logger.warning(
+            "[TRANSCRIPT] Interview %s has %d of %d turn(s) up to seq %d.",
+            interview_id, count, final_seq + 1, final_seq,
+        )
+    return count
+
+
+def turns_query(interview_id: uuid.UUID, start: int = 0, end: Optional[int] = None):
+    """SELECT for turns start..end (inclusive) in seq order."""
+    query = (
+        select(models.TranscriptTurn)
+        .where(models.TranscriptTurn.interview_id == interview_id, models.TranscriptTurn.seq >= start)
+        .order_by(models.TranscriptTurn.seq)
+    )
+    if end is not None:
+        query = query.where(models.TranscriptTurn.seq <= end)
+    return query
+
+
+# ── Worker path (sync) ────────────────────────────────────────────────────────
+
+def load_turns(db: Session, interview_id: uuid.UUID) -> list[models.TranscriptTurn]:
+    return list(db.scalars(turns_query(interview_id)))
@@ -0,0 +1,107 @@
+"""
+Celery task: assess_interview
+Incremental evaluation. Scheduled from the transcript checkpoint webhook
+while the interview runs, and once more (final=True) at completion, ahead
+of evaluate_interview in the same chain. Each run scores the next stretch
+of unassessed turns and stores it as a SegmentAssessment; a topic still
+under discussion is left for the next run.
+
+The final run only picks up a short tail: one segment of at most
+INCREMENTAL_EVAL_MAX_SEGMENT_TURNS turns and EVAL_MAP_CHUNK_CHARS
+characters. A longer backlog is left to evaluate_interview, which assesses
+it in parallel chunks instead of one segment at a time.
+"""
+import logging
+import uuid
+
+from backend.agents.evaluator_agent import assess_segment
+from backend.cache import get_sync_redis
+from backend.celery_app import celery_app
+from backend.config import settings
+from backend.db import models
+from backend.db.database import SessionLocal
+from backend.services.assessments import load_segments, save_segment
+from backend.services.transcript_store import turns_query
+
+logger = logging.getLogger(__name__)
+
+
+def _assess_next(db, interview: models.Interview, final: bool) -> bool:
+    """Assess one segment starting after the last one. Returns True if a segment was stored."""
+    segments = load_segments(db, interview.id)
+    start = segments[-1].end_seq + 1 if segments else 0
+    limit = settings.INCREMENTAL_EVAL_MAX_SEGMENT_TURNS
+    # One turn past the segment, so the final run can tell a tail from a backlog
+    turns = list(db.scalars(turns_query(interview.id, start, start + limit)))
+    if final and (len(turns) > limit or sum(len(t.text) for t in turns) > settings.EVAL_MAP_CHUNK_CHARS):
+        logger.info(
+            "[ASSESS] Interview %s: backlog from seq %d left to the parallel evaluation.", interview.id, start
+        )
+        return False
+    turns = turns[:limit]
+    if not turns or (not final and len(turns) < settings.INCREMENTAL_EVAL_MIN_TURNS):
+        return False
+
+    assessed_skills = sorted({s["skill"] for seg in segments for s in seg.skill_scores})
+    result = assess_segment(
+        [{"seq": t.seq, "speaker": t.speaker, "text": t.text} for t in turns],
+        role=interview.role,
+        job_description=interview.job_description,
+        skills_to_cover=interview.skills_to_cover or [],
+        assessed_skills=assessed_skills,
+        final=final,
+    )
+    open_from = result["open_from_seq"]
+    end = turns[-1].seq if open_from is None else min(open_from - 1, turns[-1].seq)
+    if end < start:
+        logger.info("[ASSESS] Interview %s: topic from seq %d still open.", interview.id, start)
+        return False
+
+    save_segment(db, interview.id, start, end, result)
+    db.commit()
+    logger.info(
+        "[ASSESS] Interview %s: seq %d-%d assessed, %d skill(s) scored.",
+        interview.id, start, end, len(result["skill_scores"]),
+    )
+    return True
+
+
+@celery_app.task(name="tasks.assess_interview")
+def assess_interview(interview_id: str, final: bool = False) -> None:
+    """
+    Args:
+        interview_id: UUID string of the interview.
+        final: The interview has ended — assess every remaining turn.
+
+    Never raises: evaluate_interview falls back to a full-transcript pass
+    when segments do not cover the whole interview.
+    """
+    # One assessor per interview at a time — segments must stay contiguous.
+    lock = get_sync_redis().lock(
+        f"assess:lock:{interview_id}",
+        timeout=settings.INCREMENTAL_EVAL_LOCK_TIMEOUT_S,
+        blocking_timeout=settings.INCREMENTAL_EVAL_LOCK_TIMEOUT_S if final else 0,
+    )
+    try:
+        if not lock.acquire():
+            logger.info("[ASSESS] Interview %s already being assessed — skipping.", interview_id)
+            return
+    except Exception as exc:
+        logger.warning("[ASSESS] Lock unavailable for %s: %s", interview_id, exc)
+        return
+
+    db = SessionLocal()
+    try:
+        interview = db.get(models.Interview, uuid.UUID(interview_id))
+        if not interview:
+            return
+        _assess_next(db, interview, final)
+    except Exception as exc:
+        db.rollback()
+        logger.warning("[ASSESS] Assessment failed for %s: %s", interview_id, exc)
+    finally:
+        db.close()
+        try:
+            lock.release()
+        except Exception:
+            pass
@@ -2,30 +2,66 @@
 Celery task: evaluate_interview
 Triggered after the interview ends. Fetches the transcript, runs the
 Gemini evaluator, and saves the report to Postgres.
+
+Failures are retried according to tasks/retry_policy.py; one that is
+permanent or out of retries is dead-lettered (services/dead_letter.py)
+and the interview marked `evaluation_failed`.
+
+Evaluation modes:
+  synthesis  — the incremental evaluator (tasks/assess.py) already assessed
+               every turn, its final run covering the short tail; only the
+               short synthesis step runs.
+  map_reduce — turns not yet assessed (a backlog too long for the final
+               incremental run) are chunked at turn boundaries and assessed
+               in parallel, then synthesized together with any existing
+               segments. Used when some turns were already assessed, or the
+               transcript exceeds EVAL_MAP_REDUCE_THRESHOLD_CHARS.
+  full       — one pass over the whole transcript.
 """
 import logging
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from backend.celery_app import celery_app
-from backend.agents.evaluator_agent import generate_report
+from backend.agents.evaluator_agent import assess_chunks, chunk_turns, generate_report, synthesize_report
+from backend.config import settings
 from backend.db.database import SessionLocal
 from backend.db import models
-from backend.observability import get_langfuse
+from backend.observability import get_telemetry
+from backend.services.dead_letter import discard_dead_letter, record_dead_letter
+from backend.serialization import encode_json
+from backend.services.report_cache import invalidate_report, serialize_report, store_report
+from backend.services.report_events import publish_report_failed, publish_report_ready
+from backend.services.assessments import covered_through, load_segments
+from backend.services.transcript_store import format_transcript, load_turns
+from backend.tasks.retry_policy import classify, retry_countdown
 
 logger = logging.getLogger(__name__)
 
 
+def _dead_letter(db, interview_id: str, exc: Exception, kind: str, attempts: int) -> None:
+    record_dead_letter(interview_id, exc, kind, attempts)
+    try:
+        db.query(models.Interview).filter(
+            models.Interview.id == uuid.UUID(interview_id)
+        ).update({"status": "evaluation_failed"})
+        db.commit()
+    except Exception as status_exc:
+        db.rollback()
+        logger.warning("Could not mark %s evaluation_failed: %s", interview_id, status_exc)
+    publish_report_failed(interview_id, f"{type(exc).__name__}: {exc}")
+
+
 @celery_app.task(
     bind=True,
-    max_retries=3,
-    default_retry_delay=60,   # wait 60s before retry
+    max_retries=None,   # bounded by retry_policy (EVAL_MAX_RETRIES)
     name="tasks.evaluate_interview",
 )
-def evaluate_interview(self, interview_id: str) -> str:
+def evaluate_interview(self, interview_id: str, regenerate: bool = False) -> str:
     """
     Args:
         interview_id: UUID string of the interview to evaluate.
+        regenerate: Replace an existing report instead of returning it.
     Returns:
         The UUID string of the generated report.
     """
@@ -41,7 +77,9 @@ def evaluate_interview(self, interview_id: str) -> str:
             logger.error("Interview %s not found — skipping evaluation.", interview_id)
             return
 
-        if not interview.transcript:
+        turns = load_turns(db, interview.id)
+        transcript = format_transcript(turns) if turns else interview.transcript
+        if not transcript:
             logger.error("Interview %s has no transcript — skipping.", interview_id)
             return
 
@@ -51,53 +89,89 @@ def evaluate_interview(self, interview_id: str) -> str:
             .filter(models.Report.interview_id == uuid.UUID(interview_id))
             .first()
         )
-        if existing:
+        if existing and not regenerate:
             logger.warning("Report already exists for interview %s.", interview_id)
             return str(existing.id)
+        if existing:
+            logger.info("Regenerating report for interview %s.", interview_id)
+            invalidate_report(interview_id)
+            db.delete(existing)
 
         logger.info("Starting evaluation for interview %s.", interview_id)
 
-        lf = get_langfuse()
-        eval_generation = None
-        if lf:
-            trace = lf.trace(
-                name="evaluation",
-                session_id=interview_id,
-                user_id=interview.candidate_name,
-                metadata={"role": interview.role, "interview_id": interview_id},
-                tags=["evaluation", interview.role],
-            )
-            eval_generation = trace.generation(
-                name="generate_report",
-                model="gemini-2.5-flash",
-                input={
-                    "transcript_length": len(interview.transcript),
-                    "role": interview.role,
-                    "candidate_name": interview.candidate_name,
-                    "skills_to_cover": interview.skills_to_cover or [],
-                },
-            )
+        telemetry = get_telemetry()
+        eval_trace_id = str(uuid.uuid4())
+        telemetry.trace(
+            id=eval_trace_id,
+            name="evaluation",
+            session_id=interview_id,
+            user_id=interview.candidate_name,
+            metadata={"role": interview.role, "interview_id": interview_id},
+            tags=["evaluation", interview.role],
+        )
+
+        segments = load_segments(db, interview.id) if turns else []
+        through = covered_through(segments)
+        segments = [
+            {"skill_scores": seg.skill_scores, "observations": seg.observations}
+            for seg in segments if seg.end_seq <= through
+        ]
+        remaining = [
+            {"seq": t.seq, "speaker": t.speaker, "text": t.text} for t in turns if t.seq > through
+        ]
+        if turns and not remaining:
+            mode = "synthesis"
+        elif remaining and (segments or len(transcript) > settings.EVAL_MAP_REDUCE_THRESHOLD_CHARS):
+            mode = "map_reduce"
+        else:
+            mode = "full"
 
         t0 = datetime.utcnow()
-        report_data = generate_report(
-            transcript=interview.transcript,
-            role=interview.role,
-            job_description=interview.job_description,
-            candidate_name=interview.candidate_name,
-            skills_to_cover=interview.skills_to_cover or [],
-        )
+        if mode == "map_reduce":
+            segments += assess_chunks(
+                chunk_turns(remaining, settings.EVAL_MAP_CHUNK_CHARS),
+                role=interview.role,
+                job_description=interview.job_description,
+                skills_to_cover=interview.skills_to_cover or [],
+                max_workers=settings.EVAL_MAP_CONCURRENCY,
+            )
+        if mode in ("synthesis", "map_reduce"):
+            report_data = synthesize_report(
+                segments=segments,
+                role=interview.role,
+                job_description=interview.job_description,
+                candidate_name=interview.candidate_name,
+                skills_to_cover=interview.skills_to_cover or [],
+            )
+        else:
+            report_data = generate_report(
+                transcript=transcript,
+                role=interview.role,
+                job_description=interview.job_description,
+                candidate_name=interview.candidate_name,
+                skills_to_cover=interview.skills_to_cover or [],
+            )
         duration_s = (datetime.utcnow() - t0).total_seconds()
 
-        if eval_generation:
-            eval_generation.end(
-                output={
-                    "overall_score": report_data["overall_score"],
-                    "role_eligibility": report_data["role_eligibility"],
-                    "recommendation": report_data["recommendation"],
-                },
-                metadata={"duration_s": duration_s},
-            )
-            lf.flush()
+        telemetry.generation(
+            trace_id=eval_trace_id,
+            name="generate_report" if mode == "full" else "synthesize_report",
+            model="gemini-2.5-flash",
+            start_time=t0,
+            end_time=t0 + timedelta(seconds=duration_s),
+            input={
+                "transcript_length": len(transcript),
+                "role": interview.role,
+                "candidate_name": interview.candidate_name,
+                "skills_to_cover": interview.skills_to_cover or [],
+            },
+            output={
+                "overall_score": report_data["overall_score"],
+                "role_eligibility": report_data["role_eligibility"],
+                "recommendation": report_data["recommendation"],
+            },
+            metadata={"duration_s": duration_s, "mode": mode, "segments": len(segments)},
+        )
 
         report = models.Report(
             interview_id=uuid.UUID(interview_id),
@@ -119,17 +193,17 @@ def evaluate_interview(self, interview_id: str) -> str:
         interview.status = "evaluated"
         db.commit()
         db.refresh(report)
+        store_report(interview_id, encode_json(serialize_report(report, interview)))
+        publish_report_ready(interview_id, str(report.id))
+        discard_dead_letter(interview_id)
 
         # Score the interview trace in Langfuse so it appears on the interview session
-        lf = get_langfuse()
-        if lf:
-            lf.score(
-                trace_id=interview_id,
-                name="overall_score",
-                value=report_data["overall_score"],
-                comment=report_data["role_eligibility"],
-            )
-            lf.flush()
+        telemetry.score(
+            trace_id=interview_id,
+            name="overall_score",
+            value=report_data["overall_score"],
+            comment=report_data["role_eligibility"],
+        )
 
         logger.info(
             "Evaluation complete for interview %s — report %s created.", interview_id, report.id
@@ -138,7 +212,20 @@ def evaluate_interview(self, interview_id: str) -> str:
 
     except Exception as exc:
         db.rollback()
-        logger.error("Evaluation failed for %s: %s", interview_id, exc)
-        raise self.retry(exc=exc)
+        kind = classify(exc)
+        attempts = self.request.retries + 1
+        countdown = retry_countdown(exc, kind, self.request.retries)
+        if countdown is None:
+            logger.error(
+                "Evaluation failed for %s after %d attempt(s) (%s) — dead-lettered: %s",
+                interview_id, attempts, kind, exc,
+            )
+            _dead_letter(db, interview_id, exc, kind, attempts)
+            raise
+        logger.warning(
+            "Evaluation attempt %d for %s failed (%s), retrying in %.1fs: %s",
+            attempts, interview_id, kind, countdown, exc,
+        )
+        raise self.retry(exc=exc, countdown=countdown)
     finally:
         db.close()
@@ -0,0 +1,50 @@
+"""
+Celery task: complete_abandoned_interview
+The room_finished safety net. LiveKit reports the room closed as soon as
+the last participant leaves — often before the agent's own finalization
+(which may still be retrying from its outbox) has reached the backend.
+So the webhook only schedules this task, SAFETY_NET_GRACE_S later; if the
+interview is still open by then, the agent is presumed lost and the
+interview is completed from its checkpointed turns.
+"""
+import logging
+import uuid
+from datetime import datetime
+
+from sqlalchemy import exists, update
+
+from backend.celery_app import celery_app
+from backend.db import models
+from backend.db.database import SessionLocal
+from backend.services.evaluation_queue import enqueue_evaluation_sync
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="tasks.complete_abandoned_interview")
+def complete_abandoned_interview(interview_id: str, finished_at: float) -> None:
+    """
+    Args:
+        interview_id: UUID string of the interview.
+        finished_at: Unix time LiveKit reported the room finished (used as ended_at).
+    """
+    iid = uuid.UUID(interview_id)
+    has_turns = exists().where(models.TranscriptTurn.interview_id == iid)
+    db = SessionLocal()
+    try:
+        completed = db.execute(
+            update(models.Interview)
+            .where(
+                models.Interview.id == iid,
+                models.Interview.status.in_(("pending", "active")),
+                has_turns | models.Interview.transcript.is_not(None),
+            )
+            .values(status="completed", ended_at=datetime.utcfromtimestamp(finished_at))
+        ).rowcount
+        db.commit()
+    finally:
+        db.close()
+
+    if completed:
+        logger.info("Safety net: interview %s completed from checkpoints.", interview_id)
+        enqueue_evaluation_sync(interview_id)
@@ -0,0 +1,78 @@
+"""
+Retry policy for evaluate_interview.
+
+classify() sorts a failure into one of:
+  transient — network/DB connectivity, Gemini 5xx/429, limiter timeouts.
+              Retried with exponential backoff and jitter (a 429 waits at
+              least the server's retry delay).
+  malformed — Gemini returned JSON that doesn't parse or doesn't match the
+              report schema. A fresh generation usually fixes it, so it is
+              retried almost immediately, but only EVAL_MALFORMED_RETRIES times.
+  permanent — bad input, invalid request, constraint violations. Retrying
+              cannot help; the task goes straight to the dead-letter store.
+
+Unrecognised errors count as transient, bounded by EVAL_MAX_RETRIES.
+"""
+import json
+import random
+from typing import Optional
+
+import httpx
+from google.genai import errors as genai_errors
+from redis import exceptions as redis_errors
+from sqlalchemy import exc as sa_errors
+
+from backend.config import settings
+from backend.services.llm_limiter import is_rate_limited, retry_after_s
+
+TRANSIENT = "transient"
+MALFORMED = "malformed"
+PERMANENT = "permanent"
+
+_TRANSIENT_TYPES = (
+    TimeoutError,
+    ConnectionError,
+    httpx.TransportError,
+    genai_errors.ServerError,
+    redis_errors.ConnectionError,
+    redis_errors.TimeoutError,
+    sa_errors.OperationalError,
+    sa_errors.InterfaceError,
+    sa_errors.DisconnectionError,
+)
+_PERMANENT_TYPES = (
+    genai_errors.ClientError,   # 4xx other than 408/429 — checked after is_rate_limited
+    sa_errors.IntegrityError,
+    sa_errors.DataError,
+    sa_errors.ProgrammingError,
+    ValueError,
+)
+
+
+def classify(exc: Exception) -> str:
+    if isinstance(exc, (json.JSONDecodeError, KeyError, TypeError)):
+        return MALFORMED
+    if is_rate_limited(exc) or getattr(exc, "code", None) == 408:
+        return TRANSIENT
+    if isinstance(exc, _TRANSIENT_TYPES):
+        return TRANSIENT
+    if isinstance(exc, _PERMANENT_TYPES):
+        return PERMANENT
+    return TRANSIENT
+
+
+def retry_countdown(exc: Exception, kind: str, retries: int) -> Optional[float]:
+    """Seconds until the next attempt, or None if the task should not be retried."""
+    if kind == PERMANENT or retries >= settings.EVAL_MAX_RETRIES:
+        return None
+    if kind == MALFORMED:
+        if retries >= settings.EVAL_MALFORMED_RETRIES:
+            return None
+        return random.uniform(0, settings.EVAL_RETRY_BASE_S)
+    # "Equal jitter": never less than half the exponential step, so retries
+    # still spread out, but never in lockstep across workers.
+    step = min(settings.EVAL_RETRY_MAX_S, settings.EVAL_RETRY_BASE_S * 2 ** retries)
+    countdown = random.uniform(step / 2, step)
+    if is_rate_limited(exc):
+        countdown = max(countdown, retry_after_s(exc))
+    return countdown
@@ -22,12 +22,15 @@ const STATUS_CONFIG: Record<string, { label: string; className: string }> = {
   active:    { label: "Active",    className: "text-sky-400 bg-sky-400/10 border border-sky-400/20" },
   completed: { label: "Completed", className: "text-violet-400 bg-violet-400/10 border border-violet-400/20" },
   evaluated: { label: "Evaluated", className: "text-[#4ecba0] bg-[#4ecba0]/10 border border-[#4ecba0]/20" },
+  evaluation_failed: { label: "Eval Failed", className: "text-rose-400 bg-rose-400/10 border border-rose-400/20" },
 };
 
 export default function Dashboard() {
   const router = useRouter();
   const [interviews, setInterviews] = useState<Interview[]>([]);
   const [loading, setLoading]       = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [creating, setCreating]     = useState(false);
   const [newInviteLink, setNewInviteLink] = useState("");
   const [copied, setCopied]         = useState(false);
@@ -40,14 +43,22 @@ export default function Dashboard() {
     job_description: "",
   });
 
-  const fetchInterviews = () =>
-    fetch(`${API}/api/interviews`, { headers: authHeaders() })
+  // The list is keyset-paginated: X-Next-Cursor is set when more rows exist.
+  const fetchInterviews = (cursor?: string) =>
+    fetch(`${API}/api/interviews${cursor ? `?cursor=${encodeURIComponent(cursor)}` : ""}`, { headers: authHeaders() })
       .then((r) => {
         if (r.status === 401) { clearToken(); router.push("/login"); throw new Error(); }
+        setNextCursor(r.headers.get("X-Next-Cursor"));
         return r.json();
       })
-      .then(setInterviews)
-      .finally(() => setLoading(false));
+      .then((page: Interview[]) => setInterviews((prev) => (cursor ? [...prev, ...page] : page)))
+      .finally(() => { setLoading(false); setLoadingMore(false); });
+
+  const loadMore = () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    fetchInterviews(nextCursor);
+  };
 
   useEffect(() => { fetchInterviews(); }, []);
 
@@ -109,11 +120,15 @@ export default function Dashboard() {
           <div className="flex items-center gap-4 pb-0.5">
             {!loading && (
               <p className="text-[10px] text-[#6b7280] tracking-[0.12em] uppercase">
-                {interviews.length} interview{interviews.length !== 1 ? "s" : ""}
+                {interviews.length}{nextCursor ? "+" : ""} interview{interviews.length !== 1 ? "s" : ""}
               </p>
             )}
             <button
-              onClick={() => { clearToken(); router.push("/login"); }}
+              onClick={async () => {
+                await fetch(`${API}/api/auth/logout`, { method: "POST", headers: authHeaders() }).catch(() => {});
+                clearToken();
+                router.push("/login");
+              }}
               className="text-[#6b7280] hover:text-[#9ca3af] transition-colors"
               title="Sign out"
             >
@@ -271,6 +286,15 @@ export default function Dashboard() {
                   </div>
                 );
               })}
+              {nextCursor && (
+                <button
+                  onClick={loadMore}
+                  disabled={loadingMore}
+                  className="w-full py-3 text-[11px] text-[#6b7280] hover:text-[#e8e4dc] tracking-[0.12em] uppercase transition-colors disabled:opacity-40"
+                >
+                  {loadingMore ? <Loader2 size={13} className="animate-spin mx-auto" /> : "Load more"}
+                </button>
+              )}
             </div>
           )}
         </div>
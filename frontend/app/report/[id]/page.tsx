@@ -43,8 +43,9 @@ export default function ReportPage() {
 
   useEffect(() => {
     let stopped = false;
+    let events: EventSource | null = null;
 
-    const poll = async (): Promise<boolean> => {
+    const load = async (): Promise<boolean> => {
       try {
         const res = await fetch(`${API}/api/reports/${id}`);
         if (res.status === 202) {
@@ -67,16 +68,25 @@ export default function ReportPage() {
       }
     };
 
+    // Fetch once; if still pending, wait for the server's readiness push
+    // instead of polling. EventSource reconnects by itself after timeouts.
     const run = async () => {
-      while (!stopped) {
-        const done = await poll();
-        if (done) break;
-        await new Promise((r) => setTimeout(r, 5000));
-      }
+      const done = await load();
+      if (done || stopped) return;
+      events = new EventSource(`${API}/api/reports/${id}/events`);
+      const reload = () => {
+        events?.close();
+        if (!stopped) load();
+      };
+      events.addEventListener("ready", reload);
+      events.addEventListener("failed", reload);
     };
 
     run();
-    return () => { stopped = true; };
+    return () => {
+      stopped = true;
+      events?.close();
+    };
   }, [id]);
 
   if (loading) {